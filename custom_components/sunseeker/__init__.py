@@ -14,8 +14,18 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
-
-from .const import APPTYPE_OLD, DOMAIN, REGION_EU
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    APPTYPE_OLD,
+    CONF_MQTT_TRANSPORT,
+    DEFAULT_MQTT_TRANSPORT,
+    DOMAIN,
+    MQTT_TRANSPORT_ASYNCIO,
+    REGION_EU,
+    REVALIDATE_RETRY_INTERVAL,
+)
 from .coordinator import (
     SunSeekerConfigEntry,
     SunseekerDataCoordinator,
@@ -66,10 +76,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: SunSeekerConfigEntry) ->
     data_handler = SunseekerRoboticmower(
         brand, apptype, region, email, password, locale
     )
-    await hass.async_add_executor_job(data_handler.on_load)
-    if not data_handler.login_ok:
-        _LOGGER.error("Login error")
-        raise ConfigEntryNotReady("Login failed")
+    # Commands and map fetches from the event loop use HA's shared aiohttp session
+    data_handler.http.attach_async_session(async_get_clientsession(hass))
+    if (
+        entry.options.get(CONF_MQTT_TRANSPORT, DEFAULT_MQTT_TRANSPORT)
+        == MQTT_TRANSPORT_ASYNCIO
+    ):
+        # Messages are then handled on the event loop, not the MQTT workers
+        data_handler.attach_event_loop(hass.loop)
+
+    # Start from the last snapshot and refresh from the cloud in the background
+    snapshot_store: Store = Store(
+        hass, version=1, key=f"{DOMAIN}.snapshot.{entry.entry_id}"
+    )
+    snapshot = await snapshot_store.async_load()
+    restored = bool(snapshot) and await hass.async_add_executor_job(
+        data_handler.restore_snapshot, snapshot
+    )
+    if not restored:
+        await hass.async_add_executor_job(data_handler.on_load)
+        if not data_handler.login_ok:
+            _LOGGER.error("Login error")
+            raise ConfigEntryNotReady("Login failed")
 
     robot = data_handler.deviceArray
     robots = [
@@ -86,6 +114,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: SunSeekerConfigEntry) ->
     entry.runtime_data = SunseekerEntryData(
         data_handler=data_handler,
         coordinators=robots,
+        snapshot_store=snapshot_store,
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -105,10 +134,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: SunSeekerConfigEntry) ->
                 "Initial map refresh failed for %s", dc.devicesn, exc_info=True
             )
 
+    if restored:
+        entry.async_create_background_task(
+            hass, _async_revalidate(hass, entry), f"{DOMAIN} revalidate snapshot"
+        )
+    else:
+        entry.runtime_data.async_schedule_snapshot_save(hass)
+
     await async_setup_services(hass)
     return True
 
 
+async def _async_revalidate(hass: HomeAssistant, entry: SunSeekerConfigEntry) -> None:
+    """Refresh devices restored from the snapshot with cloud data."""
+    entry_data = entry.runtime_data
+    data_handler = entry_data.data_handler
+    while (
+        result := await hass.async_add_executor_job(data_handler.revalidate)
+    ) is None:
+        _LOGGER.warning(
+            "Could not reach the Sunseeker cloud, retrying in %s seconds",
+            REVALIDATE_RETRY_INTERVAL,
+        )
+        await asyncio.sleep(REVALIDATE_RETRY_INTERVAL)
+
+    if not result:
+        # Login rejected or devices added or removed, start over without
+        # the snapshot. A rejected login then fails the setup
+        await entry_data.snapshot_store.async_remove()
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    entry_data.async_schedule_snapshot_save(hass)
+    upd = mqtt_update_values()
+    upd.livemap_update = True
+    upd.map_update = True
+    upd.heatmap = True
+    upd.wifimap = True
+    upd.netmap = True
+    for dc in entry_data.coordinators:
+        dc.dataupdated(dc.devicesn, uv=upd)
+
+
 async def async_update_entry(hass: HomeAssistant, entry: SunSeekerConfigEntry) -> None:
     """Update options."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -118,6 +185,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: SunSeekerConfigEntry) -
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        await entry.runtime_data.async_flush_snapshot()
         entry.runtime_data.data_handler.unload()
     return unload_ok
 
@@ -109,9 +109,21 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_devices):
     async_add_devices(zone_finish)
 
 
+# Device fields read by SunseekerBinarySensor for each valuepair, the others
+# are updated on any change
+_BINARY_SENSOR_FIELDS: dict[str, tuple[str, ...]] = {
+    "Station": ("station",),
+    "rain_en": ("rain_en",),
+    "mul_en": ("mul_en",),
+    "mul_auto": ("mul_auto",),
+}
+
+
 class SunseekerZoneFinishBinarySensor(SunseekerEntity, BinarySensorEntity):
     """Zone finish."""
 
+    _device_fields = ("zone.finish",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -151,6 +163,8 @@ class SunseekerZoneFinishBinarySensor(SunseekerEntity, BinarySensorEntity):
 class SunseekerZoneStartBinarySensor(SunseekerEntity, BinarySensorEntity):
     """Zone started."""
 
+    _device_fields = ("zone.start",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -208,6 +222,7 @@ class SunseekerBinarySensor(SunseekerEntity, BinarySensorEntity):
         self._attr_device_class = device_class
         self._attr_native_unit_of_measurement = unit
         self._valuepair = valuepair
+        self._device_fields = _BINARY_SENSOR_FIELDS.get(valuepair)
         self._icon = icon
         self._attr_has_entity_name = True
         self._attr_translation_key = translationkey
@@ -104,6 +104,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class SunseekerButton(SunseekerEntity, ButtonEntity):
     """LawnMower buttons."""
 
+    _device_fields = ()
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -126,25 +128,23 @@ class SunseekerButton(SunseekerEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         if self._valuepair == "home":
-            await self.hass.async_add_executor_job(self.device.dock)
+            await self.device.async_command(self.device.dock)
         elif self._valuepair == "start":
             zone = None
-            await self.hass.async_add_executor_job(self.device.start_mowing, zone)
+            await self.device.async_command(self.device.start_mowing, zone)
         elif self._valuepair == "pause":
-            await self.hass.async_add_executor_job(self.device.pause)
+            await self.device.async_command(self.device.pause)
         elif self._valuepair == "border":
-            await self.hass.async_add_executor_job(self.device.border)
+            await self.device.async_command(self.device.border)
         elif self._valuepair == "stop":
-            await self.hass.async_add_executor_job(self.device.stop)
+            await self.device.async_command(self.device.stop)
         elif self._valuepair == "end_task":
-            await self.hass.async_add_executor_job(self.device.stop_task)
+            await self.device.async_command(self.device.stop_task)
         elif self._valuepair == "reset_bladeplade":
-            await self.hass.async_add_executor_job(self.device.set_reset_bladeplade)
+            await self.device.async_command(self.device.set_reset_bladeplade)
         elif self._valuepair == "reset_blade":
-            await self.hass.async_add_executor_job(self.device.set_reset_blade)
+            await self.device.async_command(self.device.set_reset_blade)
         elif self._valuepair == "reset_small_bladeplade":
-            await self.hass.async_add_executor_job(
-                self.device.set_reset_small_bladeplade
-            )
+            await self.device.async_command(self.device.set_reset_small_bladeplade)
         elif self._valuepair == "reset_small_blade":
-            await self.hass.async_add_executor_job(self.device.set_reset_small_blade)
+            await self.device.async_command(self.device.set_reset_small_blade)
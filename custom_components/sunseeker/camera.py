@@ -1,6 +1,5 @@
 """Support for Live map camera."""
 
-import io
 import logging
 
 from homeassistant.components.camera import Camera, CameraEntityFeature
@@ -34,6 +33,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class MowerCamera(SunseekerEntity, Camera):
     """Mower Camera."""
 
+    _device_fields = ()
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -57,16 +58,14 @@ class MowerCamera(SunseekerEntity, Camera):
         self.data_coordinator.livemap_entity = self
         self.device = self._data_handler.get_device(self._sn)
         self._attr_supported_features = CameraEntityFeature(0)
+        self.content_type = self.device.map.frame_content_type
 
-    async def async_camera_image(self, **kwargs) -> bytes | None:
-        """Return bytes of camera image."""
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return bytes of camera image, reduced for small cards."""
         try:
-            roi_img = self.device.map.livemap
-            if roi_img is not None:
-                img_byte_arr = io.BytesIO()
-                roi_img.save(img_byte_arr, format="PNG")
-                return img_byte_arr.getvalue()
-            return None  # noqa: TRY300
+            return await self.device.map.async_encoded_frame("livemap", width, height)
         except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug("Camera image error: %s", ex)
             return None
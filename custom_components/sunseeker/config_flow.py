@@ -13,7 +13,27 @@ from homeassistant.const import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import selector
 
-from .const import APPTYPE_NEW, APPTYPE_OLD, DOMAIN, REGION_EU, REGION_US
+from .const import (
+    APPTYPE_NEW,
+    APPTYPE_OLD,
+    CONF_FRAME_FORMAT,
+    CONF_FRAME_QUALITY,
+    CONF_LIVEMAP_INTERVAL,
+    CONF_MAP_MAX_SIZE,
+    CONF_MQTT_TRANSPORT,
+    CONF_PATH_TOLERANCE,
+    DEFAULT_FRAME_FORMAT,
+    DEFAULT_FRAME_QUALITY,
+    DEFAULT_LIVEMAP_INTERVAL,
+    DEFAULT_MAP_MAX_SIZE,
+    DEFAULT_MQTT_TRANSPORT,
+    DEFAULT_PATH_TOLERANCE,
+    DOMAIN,
+    FRAME_FORMATS,
+    MQTT_TRANSPORTS,
+    REGION_EU,
+    REGION_US,
+)
 
 brands = [
     "Adano",
@@ -159,6 +179,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_MODEL_ID: user_input[CONF_MODEL_ID],
                     CONF_REGION: user_input[CONF_REGION],
                     CONF_PASSWORD: user_input[CONF_PASSWORD].replace(" ", ""),
+                    CONF_LIVEMAP_INTERVAL: user_input[CONF_LIVEMAP_INTERVAL],
+                    CONF_FRAME_FORMAT: user_input[CONF_FRAME_FORMAT],
+                    CONF_FRAME_QUALITY: user_input[CONF_FRAME_QUALITY],
+                    CONF_MAP_MAX_SIZE: user_input[CONF_MAP_MAX_SIZE],
+                    CONF_PATH_TOLERANCE: user_input[CONF_PATH_TOLERANCE],
+                    CONF_MQTT_TRANSPORT: user_input[CONF_MQTT_TRANSPORT],
                 }
             )
         entry = self.config_entry
@@ -195,6 +221,85 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             type=selector.TextSelectorType.PASSWORD
                         )
                     ),
+                    vol.Required(
+                        CONF_LIVEMAP_INTERVAL,
+                        default=entry.options.get(
+                            CONF_LIVEMAP_INTERVAL, DEFAULT_LIVEMAP_INTERVAL
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=60,
+                            step=0.5,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_FRAME_FORMAT,
+                        default=entry.options.get(
+                            CONF_FRAME_FORMAT, DEFAULT_FRAME_FORMAT
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=FRAME_FORMATS,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_FRAME_FORMAT,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_FRAME_QUALITY,
+                        default=entry.options.get(
+                            CONF_FRAME_QUALITY, DEFAULT_FRAME_QUALITY
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=100,
+                            step=1,
+                            mode=selector.NumberSelectorMode.SLIDER,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_MAP_MAX_SIZE,
+                        default=entry.options.get(
+                            CONF_MAP_MAX_SIZE, DEFAULT_MAP_MAX_SIZE
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=512,
+                            max=8192,
+                            step=256,
+                            unit_of_measurement="px",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_PATH_TOLERANCE,
+                        default=entry.options.get(
+                            CONF_PATH_TOLERANCE, DEFAULT_PATH_TOLERANCE
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=5,
+                            step=0.1,
+                            unit_of_measurement="px",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_MQTT_TRANSPORT,
+                        default=entry.options.get(
+                            CONF_MQTT_TRANSPORT, DEFAULT_MQTT_TRANSPORT
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=MQTT_TRANSPORTS,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_MQTT_TRANSPORT,
+                        )
+                    ),
                 }
             ),
         )
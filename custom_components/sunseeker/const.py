@@ -149,6 +149,74 @@ CMDURL_X = "/iot_mower/wireless/device/"
 CMDURL_V = "/iot_mower/wireless/device/"
 CMDURL_V1 = "/app_wirelessv1_mower/wirelessv1/device/"
 
+# Max keep-alive connections kept per host by the shared HTTP client
+HTTP_POOL_SIZE = 10
+# Max REST requests in flight while the devices are brought up at startup
+INIT_CONCURRENCY = 8
+# Threads handling the MQTT messages, shared by all accounts and mowers
+MQTT_WORKERS = 4
+# Max MQTT messages waiting per worker, position frames are dropped first
+MQTT_QUEUE_SIZE = 64
+# Max seconds the MQTT network thread waits for room in a full queue, it
+# sends no keepalive meanwhile
+MQTT_QUEUE_TIMEOUT = 5
+# Seconds to wait before writing the warm-start snapshot
+SNAPSHOT_SAVE_DELAY = 10
+# Seconds between attempts to revalidate a snapshot when the cloud is down
+REVALIDATE_RETRY_INTERVAL = 60
+# Seconds between two firmware update checks
+OTA_CHECK_INTERVAL = 21600
+
+# Options
+CONF_LIVEMAP_INTERVAL = "livemap_interval"
+# Min seconds between two live map frames while the mower moves
+DEFAULT_LIVEMAP_INTERVAL = 2
+CONF_FRAME_FORMAT = "frame_format"
+CONF_MAP_MAX_SIZE = "map_max_size"
+CONF_PATH_TOLERANCE = "path_tolerance"
+CONF_FRAME_QUALITY = "frame_quality"
+CONF_MQTT_TRANSPORT = "mqtt_transport"
+
+# Encodings of the map and live map frames
+FRAME_FORMAT_PNG = "png"
+FRAME_FORMAT_WEBP = "webp"
+FRAME_FORMAT_WEBP_LOSSLESS = "webp_lossless"
+FRAME_FORMAT_JPEG = "jpeg"
+FRAME_FORMATS = [
+    FRAME_FORMAT_PNG,
+    FRAME_FORMAT_WEBP,
+    FRAME_FORMAT_WEBP_LOSSLESS,
+    FRAME_FORMAT_JPEG,
+]
+FRAME_CONTENT_TYPES = {
+    FRAME_FORMAT_PNG: "image/png",
+    FRAME_FORMAT_WEBP: "image/webp",
+    FRAME_FORMAT_WEBP_LOSSLESS: "image/webp",
+    FRAME_FORMAT_JPEG: "image/jpeg",
+}
+DEFAULT_FRAME_FORMAT = FRAME_FORMAT_PNG
+# Quality of the lossy formats, 1-100
+DEFAULT_FRAME_QUALITY = 80
+# Longest side of the reduced frames served to small cards, smallest first
+FRAME_SIZES = (320, 960)
+
+# Map canvas scale, lowered for large gardens to keep the longest side
+# of the canvas within the max size
+MAP_PIXELS_PER_METRE = 25
+DEFAULT_MAP_MAX_SIZE = 2048
+# Max pixels a simplified path line may be off the mower's path
+DEFAULT_PATH_TOLERANCE = 1.0
+
+# How the MQTT connections are run, on paho's network threads or on the
+# event loop
+MQTT_TRANSPORT_THREAD = "thread"
+MQTT_TRANSPORT_ASYNCIO = "asyncio"
+MQTT_TRANSPORTS = [
+    MQTT_TRANSPORT_THREAD,
+    MQTT_TRANSPORT_ASYNCIO,
+]
+DEFAULT_MQTT_TRANSPORT = MQTT_TRANSPORT_THREAD
+
 # --- Old-model error codes (loaded from bundled XML lang files) ---
 
 _OLD_ERROR_INT_TO_NAME: dict[int, str] = {
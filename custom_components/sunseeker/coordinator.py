@@ -1,24 +1,39 @@
 """Sunseeker data coordinator."""
 
 import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass
 import json
 import logging
 from pathlib import Path
+from threading import Lock, get_ident
+import time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     APPTYPE_OLD,
+    CONF_FRAME_FORMAT,
+    CONF_FRAME_QUALITY,
+    CONF_LIVEMAP_INTERVAL,
+    CONF_MAP_MAX_SIZE,
+    CONF_PATH_TOLERANCE,
+    DEFAULT_FRAME_FORMAT,
+    DEFAULT_FRAME_QUALITY,
+    DEFAULT_LIVEMAP_INTERVAL,
+    DEFAULT_MAP_MAX_SIZE,
+    DEFAULT_PATH_TOLERANCE,
     DOMAIN,
     MODEL_S,
     MODEL_V,
     MODEL_V1,
     MODEL_X,
+    SNAPSHOT_SAVE_DELAY,
     SUB_MODEL_GEN2,
     SUB_MODEL_GEN3,
 )
@@ -28,6 +43,9 @@ from .sunseeker_mqtt import mqtt_update_values
 
 _LOGGER = logging.getLogger(__name__)
 
+# Field listener key for entities that depend on any device field
+ALL_FIELDS = "*"
+
 
 class SunseekerDataCoordinator(DataUpdateCoordinator):  # noqa: D101
     data_loaded: bool = False
@@ -60,6 +78,20 @@ class SunseekerDataCoordinator(DataUpdateCoordinator):  # noqa: D101
             update_interval=None,
         )
         self._image_update_lock: asyncio.Lock = asyncio.Lock()
+        # Live map frames are rendered at most once per livemap_interval
+        self.livemap_interval: float = config_entry.options.get(
+            CONF_LIVEMAP_INTERVAL, DEFAULT_LIVEMAP_INTERVAL
+        )
+        self._livemap_frame_pending: CALLBACK_TYPE | None = None
+        self._livemap_last_frame: float = 0
+        config_entry.async_on_unload(self._cancel_livemap_frame)
+        # Updates waiting for the next dispatch on the event loop
+        self._dispatch_lock: Lock = Lock()
+        self._pending_uv: mqtt_update_values | None = None
+        self._pending_need_update: bool = False
+        self._pending_fields: set[str] = set()
+        # Entity callbacks by the device field they depend on
+        self._field_listeners: dict[str, list[CALLBACK_TYPE]] = {}
         self.region = region
         self.brand = brand
         self.always_update = True
@@ -71,6 +103,18 @@ class SunseekerDataCoordinator(DataUpdateCoordinator):  # noqa: D101
         self.modelname = self.device.ModelName  # X3
         self.apptype = self.device.apptype
         self.device.dataupdated = self.dataupdated
+        self.device.map.frame_format = config_entry.options.get(
+            CONF_FRAME_FORMAT, DEFAULT_FRAME_FORMAT
+        )
+        self.device.map.frame_quality = int(
+            config_entry.options.get(CONF_FRAME_QUALITY, DEFAULT_FRAME_QUALITY)
+        )
+        self.device.map.max_canvas_size = int(
+            config_entry.options.get(CONF_MAP_MAX_SIZE, DEFAULT_MAP_MAX_SIZE)
+        )
+        self.device.map.path_tolerance = config_entry.options.get(
+            CONF_PATH_TOLERANCE, DEFAULT_PATH_TOLERANCE
+        )
         self._schedule_store: Store = Store(
             hass,
             version=1,
@@ -238,86 +282,193 @@ class SunseekerDataCoordinator(DataUpdateCoordinator):  # noqa: D101
         devicesn: str,
         uv: mqtt_update_values = None,
         need_update: bool = True,
+        fields: Iterable[str] = (),
     ):
-        """Func Callback when data is updated."""
+        """Func Callback when data is updated.
+
+        Called from the MQTT workers, timers or the event loop. The updates
+        are merged and handed to the event loop once, so a burst of messages
+        results in a single state write and image pass. need_update updates all entities,
+        fields only the entities listening to them.
+        """
         if self.devicesn != devicesn:
             return
 
+        with self._dispatch_lock:
+            schedule = self._pending_uv is None
+            if schedule:
+                self._pending_uv = mqtt_update_values()
+            if uv:
+                self._pending_uv.merge(uv)
+            self._pending_need_update |= need_update
+            self._pending_fields.update(fields)
+        if schedule:
+            if get_ident() == self.hass.loop_thread_id:
+                # Dispatch after the messages of the current read
+                self.hass.loop.call_soon(self._async_dispatch_update)
+            else:
+                self.hass.add_job(self._async_dispatch_update)
+
+    @callback
+    def _async_dispatch_update(self) -> None:
+        """Apply the updates merged since the last dispatch."""
+        with self._dispatch_lock:
+            uv = self._pending_uv
+            need_update = self._pending_need_update
+            fields = self._pending_fields
+            self._pending_uv = None
+            self._pending_need_update = False
+            self._pending_fields = set()
+        if uv is None:
+            return
+
         _LOGGER.debug("callback - start - Sunseeker %s", self.devicesn)
-        if not uv:
-            uv = mqtt_update_values()
         if need_update:
-            self.hass.add_job(self.async_set_updated_data, None)
+            self.async_set_updated_data(None)
+        elif fields:
+            self.async_update_field_listeners(fields)
 
         if (
             self.device.apptype == APPTYPE_OLD
             and uv.schedule
             and not self.device.Schedule.IsEmpty()
         ):
-            self.hass.add_job(self.save_schedule_data)
-        self.hass.add_job(self.Handle_image_update, uv)
+            self.hass.async_create_task(self.save_schedule_data())
+        self.hass.async_create_task(self.Handle_image_update(uv))
 
         if uv.heatmap:
-            self.hass.add_job(self.get_heat_map, devicesn)
+            self.hass.async_create_task(self.get_heat_map(self.devicesn))
             if self.heatmap_entity:
                 _LOGGER.debug("heatmap trigger update")
-                self.hass.add_job(self.heatmap_entity.trigger_update)
+                self.hass.async_create_task(self.heatmap_entity.trigger_update())
 
         if uv.wifimap:
-            self.hass.add_job(self.get_wifi_map, devicesn)
+            self.hass.async_create_task(self.get_wifi_map(self.devicesn))
             if self.wifimap_entity:
                 _LOGGER.debug("wifimap trigger update")
-                self.hass.add_job(self.wifimap_entity.trigger_update)
+                self.hass.async_create_task(self.wifimap_entity.trigger_update())
         if (
             uv.netmap
             and self.device.model in (MODEL_X, MODEL_S)
             and self.device.submodel in (SUB_MODEL_GEN2, SUB_MODEL_GEN3)
         ):
-            self.hass.add_job(self.get_net_map, devicesn)
+            self.hass.async_create_task(self.get_net_map(self.devicesn))
             if self.netmap_entity:
                 _LOGGER.debug("netmap trigger update")
-                self.hass.add_job(self.netmap_entity.trigger_update)
+                self.hass.async_create_task(self.netmap_entity.trigger_update())
         _LOGGER.debug("callback - end - Sunseeker %s", self.devicesn)
 
+    @callback
+    def async_add_field_listener(
+        self, update_callback: CALLBACK_TYPE, fields: Iterable[str]
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of device fields, ALL_FIELDS for any field.
+
+        The fields are the dotted device attributes recorded by the MQTT
+        handler, zone attributes are prefixed with "zone.". Updates that are
+        not tracked per field go to the coordinator listeners.
+        """
+        fields = tuple(fields)
+        for field in fields:
+            self._field_listeners.setdefault(field, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            for field in fields:
+                listeners = self._field_listeners[field]
+                listeners.remove(update_callback)
+                if not listeners:
+                    del self._field_listeners[field]
+
+        return remove_listener
+
+    @callback
+    def async_update_field_listeners(self, fields: Iterable[str]) -> None:
+        """Call the listeners of the changed fields, each once."""
+        called: set[CALLBACK_TYPE] = set()
+        for field in (ALL_FIELDS, *fields):
+            for update_callback in list(self._field_listeners.get(field, ())):
+                if update_callback not in called:
+                    called.add(update_callback)
+                    update_callback()
+
     async def Handle_image_update(self, uv: mqtt_update_values):
         """Function to call none async."""
         if self.model in (MODEL_V, MODEL_V1):
             return
         async with self._image_update_lock:
             _LOGGER.debug("Image handler - start %s", self.devicesn)
-            if uv.live_move_update or uv.start_new_path:
-                await self.device.map.generate_livemap()
+            if uv.start_new_path:
+                await self._generate_livemap()
+            elif uv.live_move_update:
+                self._schedule_livemap_frame()
             if uv.fetch_new_map_data:
-                await self.hass.async_add_executor_job(self.device.map.get_map_info)
-                await self.hass.async_add_executor_job(
-                    self.device.map.get_backup_map_data
-                )
+                await self.device.map.async_get_map_info()
+                await self.device.map.async_get_backup_map_data()
+                self.save_snapshot()
             if uv.path_url_to_load:
-                await self.hass.async_add_executor_job(
-                    self.device.map.get_path_data, uv.path_url_to_load
-                )
+                await self.device.map.async_get_path_data(uv.path_url_to_load)
             if (uv.livemap_update and uv.map_update) or uv.start_new_path:
                 await self.device.map.reload_maps()
                 if self.map_entity:
                     await self.map_entity.trigger_update()
             elif uv.livemap_update:
-                await self.device.map.generate_livemap()
+                await self._generate_livemap()
         _LOGGER.debug("Image handler - end %s", self.devicesn)
 
+    async def _generate_livemap(self) -> None:
+        """Render a live map frame."""
+        self._livemap_last_frame = time.monotonic()
+        await self.device.map.generate_livemap()
+
+    @callback
+    def _schedule_livemap_frame(self) -> None:
+        """Render the live map for a position update, at most once per interval.
+
+        Positions received while a frame is pending only update the map
+        state, the frame then draws the latest pose.
+        """
+        if self._livemap_frame_pending is not None:
+            return
+        delay = max(
+            0, self._livemap_last_frame + self.livemap_interval - time.monotonic()
+        )
+        self._livemap_frame_pending = async_call_later(
+            self.hass, delay, self._async_livemap_frame
+        )
+
+    async def _async_livemap_frame(self, _now) -> None:
+        """Render the pending live map frame."""
+        self._livemap_frame_pending = None
+        async with self._image_update_lock:
+            await self._generate_livemap()
+
+    @callback
+    def _cancel_livemap_frame(self) -> None:
+        """Drop a pending live map frame."""
+        if self._livemap_frame_pending is not None:
+            self._livemap_frame_pending()
+            self._livemap_frame_pending = None
+
+    def save_snapshot(self) -> None:
+        """Store the warm-start snapshot with the current cloud data."""
+        entry_data: SunseekerEntryData = self.config_entry.runtime_data
+        entry_data.async_schedule_snapshot_save(self.hass)
+
     async def get_heat_map(self, snr):
-        """Function to call none async."""
+        """Fetch the heat map."""
         ad = self.data_handler.get_device(snr)
-        await self.hass.async_add_executor_job(ad.map.get_heat_map)
+        await ad.map.async_get_heat_map()
 
     async def get_wifi_map(self, snr):
-        """Function to call none async."""
+        """Fetch the wifi map."""
         ad = self.data_handler.get_device(snr)
-        await self.hass.async_add_executor_job(ad.map.get_wifi_map)
+        await ad.map.async_get_wifi_map()
 
     async def get_net_map(self, snr):
-        """Function to call none async."""
+        """Fetch the net map."""
         ad = self.data_handler.get_device(snr)
-        await self.hass.async_add_executor_job(ad.map.get_net_map)
+        await ad.map.async_get_net_map()
 
     @property
     def dsn(self):
@@ -364,7 +515,7 @@ class SunseekerDataCoordinator(DataUpdateCoordinator):  # noqa: D101
 
     async def _async_update_data(self):
         try:
-            await self.hass.async_add_executor_job(self.data_handler.update)
+            self.data_handler.update()
             return self.data_handler  # noqa: TRY300
         except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug("update failed: %s", ex)
@@ -376,6 +527,34 @@ class SunseekerEntryData:
 
     data_handler: SunseekerRoboticmower
     coordinators: list[SunseekerDataCoordinator]
+    snapshot_store: Store
+    # Cancels the pending snapshot save
+    snapshot_save: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_schedule_snapshot_save(self, hass: HomeAssistant) -> None:
+        """Store the snapshot in SNAPSHOT_SAVE_DELAY seconds.
+
+        Saves requested meanwhile are merged into the pending one. The
+        snapshot is built in the executor, copying the device data and
+        converting the path is too slow for the event loop.
+        """
+        if self.snapshot_save is None:
+            self.snapshot_save = async_call_later(
+                hass, SNAPSHOT_SAVE_DELAY, self._async_save_snapshot
+            )
+
+    async def _async_save_snapshot(self, _now) -> None:
+        self.snapshot_save = None
+        hass = self.snapshot_store.hass
+        data = await hass.async_add_executor_job(self.data_handler.snapshot)
+        await self.snapshot_store.async_save(data)
+
+    async def async_flush_snapshot(self) -> None:
+        """Save a pending snapshot now, used on unload."""
+        if self.snapshot_save is not None:
+            self.snapshot_save()
+            await self._async_save_snapshot(None)
 
 
 type SunSeekerConfigEntry = ConfigEntry[SunseekerEntryData]
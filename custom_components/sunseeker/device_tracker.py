@@ -33,6 +33,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class SunseekerDeviceTracker(SunseekerEntity, TrackerEntity):
     """LawnMower tracker."""
 
+    _device_fields = ()
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -84,6 +86,14 @@ class SunseekerMowerPositionTracker(SunseekerEntity, TrackerEntity):
     compass bearing: bearing_deg = (90 - degrees(angle + map_phi)) % 360.
     """
 
+    _device_fields = (
+        "map.mower_pos",
+        "map.mower_orientation",
+        "map.charger_pos",
+        "map.charger_orientation",
+        "RTKPos",
+    )
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -8,8 +8,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from . import SunseekerDataCoordinator
-from .const import DOMAIN
+from .const import DOMAIN, MQTT_TRANSPORT_ASYNCIO, MQTT_TRANSPORT_THREAD
 from .coordinator import SunSeekerConfigEntry
+from .sunseeker_mqtt import worker_pool
 
 TO_REDACT = {
     CONF_EMAIL,
@@ -84,6 +85,7 @@ def _build_device_payload(coordinator: SunseekerDataCoordinator) -> dict[str, An
             "cmdurl": device.cmdurl,
             "deviceOnlineFlag": device.deviceOnlineFlag,
             "error_text": device.error_text,
+            "init_timings": device.init_timings,
             "map": {
                 "mapid": device.map.mapid,
                 "has_image_data": bool(device.map.image_data),
@@ -114,9 +116,25 @@ async def async_get_config_entry_diagnostics(
             "url": data_handler.url,
             "host": data_handler.host,
             "deviceArray": data_handler.deviceArray,
+            "init_duration": data_handler.init_duration,
+            "restored": data_handler.restored,
             "session": data_handler.session,
             "devicelist_OLD_models": data_handler.devicelist_OLD_models,
             "devicelist_V1_models": data_handler.devicelist_NEW_models,
+            "mqtt": {
+                "transport": (
+                    MQTT_TRANSPORT_ASYNCIO
+                    if data_handler.mqtt_loop is not None
+                    else MQTT_TRANSPORT_THREAD
+                ),
+                "rejected": {
+                    mc.model: mc.rejected for mc in data_handler.mqtt_controllers
+                },
+                # No pool is started when the clients run on the event loop
+                "workers": (
+                    worker_pool().stats() if data_handler.mqtt_loop is None else []
+                ),
+            },
         },
         "devices": [_build_device_payload(coordinator) for coordinator in coordinators],
     }
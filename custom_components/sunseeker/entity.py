@@ -3,6 +3,7 @@
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import SunseekerDataCoordinator
+from .coordinator import ALL_FIELDS
 
 
 class SunseekerEntity(CoordinatorEntity[SunseekerDataCoordinator]):
@@ -10,6 +11,10 @@ class SunseekerEntity(CoordinatorEntity[SunseekerDataCoordinator]):
 
     # coordinator = SunseekerDataCoordinator
 
+    # Device fields the state is built from, see async_add_field_listener.
+    # None updates the entity on any field change, () only on full updates.
+    _device_fields: tuple[str, ...] | None = None
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -20,3 +25,14 @@ class SunseekerEntity(CoordinatorEntity[SunseekerDataCoordinator]):
         self._attr_unique_id = (
             f"{coordinator.unique_id}-{self.__class__.__name__.lower()}"
         )
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for the device fields as well as full updates."""
+        await super().async_added_to_hass()
+        fields = (ALL_FIELDS,) if self._device_fields is None else self._device_fields
+        if fields:
+            self.async_on_remove(
+                self.coordinator.async_add_field_listener(
+                    self._handle_coordinator_update, fields
+                )
+            )
@@ -1,11 +1,7 @@
 """Support for Image map."""
 
-import io
-import json
 import logging
 
-import requests
-
 from homeassistant.components.image import ImageEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
@@ -80,6 +76,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class MowerImage(SunseekerEntity, ImageEntity):
     """Mower Image."""
 
+    _device_fields = ()
+
     data_coordinator: SunseekerDataCoordinator
 
     def __init__(
@@ -115,6 +113,8 @@ class MowerImage(SunseekerEntity, ImageEntity):
             self.data_coordinator.netmap_entity = self
         self.device = self._data_handler.get_device(self._sn)
         self.mapid = mapid
+        self.frame = ("image", "heatmap", "wifimap", "netmap")[mapid]
+        self._attr_content_type = self.device.map.frame_content_type
 
     @property
     def state(self):
@@ -125,12 +125,12 @@ class MowerImage(SunseekerEntity, ImageEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         if self.mapid == 0 and self.device.map.image_data:
+            # The geometry is served by the get_map service, only a summary
+            # goes into the state machine and the recorder
             try:
-                return {
-                    "map_backup": self.device.map.backupmap_data,
-                    "map_id": self.device.map.mapid,
-                    "map_data": json.loads(self.device.map.image_data),
-                }
+                # Parsed on the render thread, never here on the event loop
+                model = self.device.map.map_model_cached
+                return model.summary if model else {}
             except Exception:  # noqa: BLE001
                 return {}
         return {}
@@ -147,30 +147,17 @@ class MowerImage(SunseekerEntity, ImageEntity):
     async def async_image(self) -> bytes | None:
         """Return bytes of image."""
         try:
-            if self.mapid == 0:
-                roi_img = self.device.map.image
-            elif self.mapid == 1:
-                roi_img = self.device.map.heatmap
-            elif self.mapid == 2:
-                roi_img = self.device.map.wifimap
-            elif self.mapid == 3:
-                roi_img = self.device.map.netmap
-            # roi_img = img.convert("RGB")
-            if roi_img is not None:
-                img_byte_arr = io.BytesIO()
-                roi_img.save(img_byte_arr, format="PNG")
-                img_byte_arr = img_byte_arr.getvalue()
-            else:
-                return None
+            return await self.device.map.async_encoded_frame(self.frame)
         except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug(ex)
             return None
-        return img_byte_arr
 
 
 class MowerRobotImageUrl(SunseekerEntity, ImageEntity):
     """Image entity showing the robot image from a URL."""
 
+    _device_fields = ()
+
     data_coordinator: SunseekerDataCoordinator
 
     def __init__(
@@ -209,9 +196,7 @@ class MowerRobotImageUrl(SunseekerEntity, ImageEntity):
         if not url:
             return None
         try:
-            response = await self.hass.async_add_executor_job(
-                lambda: requests.get(url, timeout=10)
-            )
+            response = await self._data_handler.http.async_get(url, timeout=10)
             if response.status_code == 200:
                 self._cached_image = response.content
                 return self._cached_image
@@ -58,6 +58,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class SunseekerLawnMower(SunseekerEntity, LawnMowerEntity):
     """LawnMower."""
 
+    _device_fields = ("mode", "errortype")
+
     def __init__(self, coordinator: SunseekerDataCoordinator) -> None:
         """Initialize the heater."""
         super().__init__(coordinator)
@@ -181,15 +183,15 @@ class SunseekerLawnMower(SunseekerEntity, LawnMowerEntity):
 
     async def async_start_mowing(self) -> None:
         """Start or resume mowing."""
-        await self.hass.async_add_executor_job(self.device.start_mowing, None)
+        await self.device.async_command(self.device.start_mowing, None)
 
     async def async_dock(self) -> None:
         """Dock the mower."""
-        await self.hass.async_add_executor_job(self.device.dock)
+        await self.device.async_command(self.device.dock)
 
     async def async_pause(self) -> None:
         """Pause the lawn mower."""
-        await self.hass.async_add_executor_job(self.device.pause)
+        await self.device.async_command(self.device.pause)
 
     async def async_update(self):
         """Get the latest data."""
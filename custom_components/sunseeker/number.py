@@ -136,6 +136,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class SunseekerRainDelayNumber(SunseekerEntity, NumberEntity):
     """LawnMower number."""
 
+    _device_fields = ("rain_delay_set",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -160,7 +162,7 @@ class SunseekerRainDelayNumber(SunseekerEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_rain_status,
             self.device.rain_en,
             value,
@@ -197,12 +199,13 @@ class SunseekerZoneNumber(SunseekerEntity, NumberEntity):
         self._sn = self.coordinator.devicesn
         self.icon = "mdi:map"
         self.zonenumber = zonenumber
+        self._device_fields = (f"mul_zon{zonenumber}",)
         self.device = self._data_handler.get_device(self._sn)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         if self.zonenumber == 1:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -216,7 +219,7 @@ class SunseekerZoneNumber(SunseekerEntity, NumberEntity):
                 self.device.mulpro_zon4,
             )
         if self.zonenumber == 2:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -230,7 +233,7 @@ class SunseekerZoneNumber(SunseekerEntity, NumberEntity):
                 self.device.mulpro_zon4,
             )
         if self.zonenumber == 3:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -244,7 +247,7 @@ class SunseekerZoneNumber(SunseekerEntity, NumberEntity):
                 self.device.mulpro_zon4,
             )
         if self.zonenumber == 4:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -297,12 +300,13 @@ class SunseekerMulNumber(SunseekerEntity, NumberEntity):
         self._sn = self.coordinator.devicesn
         self.icon = "mdi:map"
         self.mulnumber = mulnumber
+        self._device_fields = (f"mulpro_zon{mulnumber}",)
         self.device = self._data_handler.get_device(self._sn)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         if self.mulnumber == 1:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -316,7 +320,7 @@ class SunseekerMulNumber(SunseekerEntity, NumberEntity):
                 self.device.mulpro_zon4,
             )
         if self.mulnumber == 2:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -330,7 +334,7 @@ class SunseekerMulNumber(SunseekerEntity, NumberEntity):
                 self.device.mulpro_zon4,
             )
         if self.mulnumber == 3:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -344,7 +348,7 @@ class SunseekerMulNumber(SunseekerEntity, NumberEntity):
                 self.device.mulpro_zon4,
             )
         if self.mulnumber == 4:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_zone_status,
                 self.device.mul_auto,
                 self.device.mul_en,
@@ -375,6 +379,8 @@ class SunseekerMulNumber(SunseekerEntity, NumberEntity):
 class SunseekerUltrasonicLevelNumber(SunseekerEntity, NumberEntity):
     """Ultrasonic level for old models."""
 
+    _device_fields = ("ultra_lv",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -399,7 +405,7 @@ class SunseekerUltrasonicLevelNumber(SunseekerEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_ultrasonic,
             bool(self.device.ultra_flag),
             int(value),
@@ -414,6 +420,8 @@ class SunseekerUltrasonicLevelNumber(SunseekerEntity, NumberEntity):
 class SunseekerBladespeedNumber(SunseekerEntity, NumberEntity):
     """LawnMower number."""
 
+    _device_fields = ("blade_speed",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -439,7 +447,7 @@ class SunseekerBladespeedNumber(SunseekerEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_blade_speed,
             int(value),
         )
@@ -453,6 +461,8 @@ class SunseekerBladespeedNumber(SunseekerEntity, NumberEntity):
 class SunseekerBladeheightNumber(SunseekerEntity, NumberEntity):
     """LawnMower number."""
 
+    _device_fields = ("blade_height",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -478,7 +488,7 @@ class SunseekerBladeheightNumber(SunseekerEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_blade_height,
             int(value),
         )
@@ -492,6 +502,8 @@ class SunseekerBladeheightNumber(SunseekerEntity, NumberEntity):
 class SunseekerPlanangleNumber(SunseekerEntity, NumberEntity):
     """LawnMower number."""
 
+    _device_fields = ("plan_angle",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -517,7 +529,7 @@ class SunseekerPlanangleNumber(SunseekerEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_plan_mode,
             self.device.plan_mode,
             int(value),
@@ -532,6 +544,8 @@ class SunseekerPlanangleNumber(SunseekerEntity, NumberEntity):
 class SunseekerCustomBladeheightNumber(SunseekerEntity, NumberEntity):
     """LawnMower number."""
 
+    _device_fields = ("zone.blade_height",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -565,7 +579,7 @@ class SunseekerCustomBladeheightNumber(SunseekerEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self.zone.blade_height = int(value)
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_custon_property,
             self.zone,
         )
@@ -580,6 +594,8 @@ class SunseekerCustomBladeheightNumber(SunseekerEntity, NumberEntity):
 class SunseekerCustomBladespeedNumber(SunseekerEntity, NumberEntity):
     """LawnMower number."""
 
+    _device_fields = ("zone.blade_speed",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -612,7 +628,7 @@ class SunseekerCustomBladespeedNumber(SunseekerEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self.zone.blade_speed = int(value)
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_custon_property,
             self.zone,
         )
@@ -627,6 +643,8 @@ class SunseekerCustomBladespeedNumber(SunseekerEntity, NumberEntity):
 class SunseekerCustomPlanangleNumber(SunseekerEntity, NumberEntity):
     """LawnMower number."""
 
+    _device_fields = ("zone.plan_angle",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -659,7 +677,7 @@ class SunseekerCustomPlanangleNumber(SunseekerEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self.zone.plan_angle = int(value)
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_custon_property,
             self.zone,
         )
@@ -674,6 +692,8 @@ class SunseekerCustomPlanangleNumber(SunseekerEntity, NumberEntity):
 class SunseekerZigzagAngleNumber(SunseekerEntity, NumberEntity):
     """Number entity for a global zigzag angle."""
 
+    _device_fields = ("multi_zigzag_angles",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -709,7 +729,7 @@ class SunseekerZigzagAngleNumber(SunseekerEntity, NumberEntity):
             for i in range(1, 5)
         ]
         angles[self._angle_index - 1]["angle"] = int(value)
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_plan_mode_gen2,
             self.device.plan_mode,
             angles,
@@ -724,6 +744,8 @@ class SunseekerZigzagAngleNumber(SunseekerEntity, NumberEntity):
 class SunseekerCustomZigzagAngleNumber(SunseekerEntity, NumberEntity):
     """Number entity for a zone-specific zigzag angle."""
 
+    _device_fields = ("zone.multi_zigzag_angles",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -765,7 +787,7 @@ class SunseekerCustomZigzagAngleNumber(SunseekerEntity, NumberEntity):
             }
             for i in range(1, 5)
         ]
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_custon_property,
             self.zone,
         )
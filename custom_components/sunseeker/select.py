@@ -228,6 +228,7 @@ class SunseekerMapDrawModeSelect(SunseekerEntity, SelectEntity):
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
     _attr_icon = "mdi:draw"
+    _device_fields = ()
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -255,6 +256,7 @@ class SunseekerScreenTimeoutSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("screen_lock",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -293,9 +295,7 @@ class SunseekerScreenTimeoutSelect(SunseekerEntity, SelectEntity):
         }
         value = reverse_mapping.get(option, 0)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(
-            self.device.set_screen_durration_V1, value
-        )
+        await self.device.async_command(self.device.set_screen_durration_V1, value)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -310,6 +310,7 @@ class SunseekerBorderFirstSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("border_first",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -344,7 +345,7 @@ class SunseekerBorderFirstSelect(SunseekerEntity, SelectEntity):
         }
         value = reverse_mapping.get(option, 0)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(self.device.set_border_first_V1, value)
+        await self.device.async_command(self.device.set_border_first_V1, value)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -359,6 +360,7 @@ class SunseekerRechargeModeSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("recharge_mode",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -387,7 +389,7 @@ class SunseekerRechargeModeSelect(SunseekerEntity, SelectEntity):
         reverse_mapping = {"smart": 1, "border": 2, "direct": 0}
         value = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(self.device.set_return_path, value)
+        await self.device.async_command(self.device.set_return_path, value)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -402,6 +404,7 @@ class SunseekerReturnModeSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("docking_path",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -436,7 +439,7 @@ class SunseekerReturnModeSelect(SunseekerEntity, SelectEntity):
         }
         value = reverse_mapping.get(option, 0)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(self.device.set_return_path_V1, value)
+        await self.device.async_command(self.device.set_return_path_V1, value)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -451,6 +454,7 @@ class SunseekerBorderDistanceSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("border_distance",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -485,9 +489,7 @@ class SunseekerBorderDistanceSelect(SunseekerEntity, SelectEntity):
         }
         value = reverse_mapping.get(option, 0)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(
-            self.device.set_border_distance_V1, value
-        )
+        await self.device.async_command(self.device.set_border_distance_V1, value)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -502,6 +504,7 @@ class SunseekerDisAlongBorderSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("dis_along_border",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -536,7 +539,7 @@ class SunseekerDisAlongBorderSelect(SunseekerEntity, SelectEntity):
             "close": 2,
         }
         value = reverse_mapping.get(option, 0)
-        await self.hass.async_add_executor_job(self.device.set_dis_along_border, value)
+        await self.device.async_command(self.device.set_dis_along_border, value)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -551,6 +554,7 @@ class SunseekerSpeedSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("work_speed",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -588,9 +592,7 @@ class SunseekerSpeedSelect(SunseekerEntity, SelectEntity):
         speed = reverse_mapping.get(option, 1)
         gap = self.device.gap
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(
-            self.device.set_mow_efficiency, gap, speed
-        )
+        await self.device.async_command(self.device.set_mow_efficiency, gap, speed)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -605,6 +607,7 @@ class SunseekerGapSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("gap",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -642,9 +645,7 @@ class SunseekerGapSelect(SunseekerEntity, SelectEntity):
         gap = reverse_mapping.get(option, 1)
         speed = self.device.work_speed
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(
-            self.device.set_mow_efficiency, gap, speed
-        )
+        await self.device.async_command(self.device.set_mow_efficiency, gap, speed)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -659,6 +660,7 @@ class SunseekerBorderSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("border_mode",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -695,7 +697,7 @@ class SunseekerBorderSelect(SunseekerEntity, SelectEntity):
         }
         freq = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(self.device.set_border_freq, freq)
+        await self.device.async_command(self.device.set_border_freq, freq)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -710,6 +712,7 @@ class SunseekerAISensSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("AISens",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -744,7 +747,7 @@ class SunseekerAISensSelect(SunseekerEntity, SelectEntity):
         }
         ai_freq = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(self.device.set_AIsensitivity, ai_freq)
+        await self.device.async_command(self.device.set_AIsensitivity, ai_freq)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -759,6 +762,7 @@ class SunseekerAvoidObjectsSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("avoid_objects",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -793,7 +797,7 @@ class SunseekerAvoidObjectsSelect(SunseekerEntity, SelectEntity):
         }
         touch = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(self.device.set_avoid_objects, touch)
+        await self.device.async_command(self.device.set_avoid_objects, touch)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -808,6 +812,7 @@ class SunseekerPlanModeSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("plan_mode",)
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -852,13 +857,13 @@ class SunseekerPlanModeSelect(SunseekerEntity, SelectEntity):
         plan_mode = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
         if self.device.support_multi_angle:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_plan_mode_gen2,
                 plan_mode,
                 self.device.multi_zigzag_angles,
             )
         else:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_plan_mode,
                 plan_mode,
                 self.device.plan_angle,
@@ -877,6 +882,11 @@ class SunseekerScheduleModeSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = (
+        "Schedule_new.schedule_pause",
+        "Schedule_new.schedule_recommended",
+        "Schedule_new.schedule_custom",
+    )
 
     def __init__(
         self, coordinator: SunseekerDataCoordinator, name: str, translationkey: str
@@ -923,7 +933,7 @@ class SunseekerScheduleModeSelect(SunseekerEntity, SelectEntity):
         }
         mode = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(self.device.set_schedue_mode, mode)
+        await self.device.async_command(self.device.set_schedue_mode, mode)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -988,6 +998,7 @@ class SunseekerCustomPlanModeSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("zone.plan_mode",)
 
     def __init__(
         self,
@@ -1039,9 +1050,7 @@ class SunseekerCustomPlanModeSelect(SunseekerEntity, SelectEntity):
         }
         self.zone.plan_mode = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(
-            self.device.set_custon_property, self.zone
-        )
+        await self.device.async_command(self.device.set_custon_property, self.zone)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -1056,6 +1065,7 @@ class SunseekerCustomSpeedSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("zone.work_speed",)
 
     def __init__(
         self,
@@ -1100,9 +1110,7 @@ class SunseekerCustomSpeedSelect(SunseekerEntity, SelectEntity):
         }
         self.zone.work_speed = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(
-            self.device.set_custon_property, self.zone
-        )
+        await self.device.async_command(self.device.set_custon_property, self.zone)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -1117,6 +1125,7 @@ class SunseekerCustomGapSelect(SunseekerEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _device_fields = ("zone.gap",)
 
     def __init__(
         self,
@@ -1161,9 +1170,7 @@ class SunseekerCustomGapSelect(SunseekerEntity, SelectEntity):
         }
         self.zone.gap = reverse_mapping.get(option, 1)
         # Call your integration's method to set the mode
-        await self.hass.async_add_executor_job(
-            self.device.set_custon_property, self.zone
-        )
+        await self.device.async_command(self.device.set_custon_property, self.zone)
         self._attr_current_option = option
         self.async_write_ha_state()
 
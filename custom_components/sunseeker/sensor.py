@@ -712,6 +712,60 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_devices):
                 )
 
 
+# Device fields read by SunseekerSensor for each valuepair, the others are
+# updated on any change
+_SENSOR_FIELDS: dict[str, tuple[str, ...]] = {
+    "Mode": ("mode", "errortype"),
+    "wifi_lv": ("wifi_lv",),
+    "rain_status": ("rain_status",),
+    "state_error": (),
+    "Power": ("power",),
+    "rain_delay_set": ("rain_delay_set",),
+    "rain_delay_left": ("rain_delay_left",),
+    "cur_min": ("cur_min",),
+    "mul_zon1": ("mul_zon1",),
+    "mul_zon2": ("mul_zon2",),
+    "mul_zon3": ("mul_zon3",),
+    "mul_zon4": ("mul_zon4",),
+    "4gnetSig": ("net_4g_sig",),
+    "taskTotalArea": ("taskTotalArea",),
+    "taskCoverArea": ("taskCoverArea",),
+    "taskProgress": ("taskCoverArea", "taskTotalArea"),
+    "blade_time_left": ("consumable.blade.at", "consumable.blade.mp"),
+    "blade_health": ("consumable.blade.at", "consumable.blade.mp"),
+    "cutterplade_time_left": ("consumable.cutter.at", "consumable.cutter.mp"),
+    "cutterplade_health": ("consumable.cutter.at", "consumable.cutter.mp"),
+    "small_blade_time_left": ("consumable.small_blade.at", "consumable.small_blade.mp"),
+    "small_blade_health": ("consumable.small_blade.at", "consumable.small_blade.mp"),
+    "small_cutterplade_time_left": (
+        "consumable.small_cutter.at",
+        "consumable.small_cutter.mp",
+    ),
+    "small_cutterplade_health": (
+        "consumable.small_cutter.at",
+        "consumable.small_cutter.mp",
+    ),
+    "errortype": ("errortype",),
+    "blade_speed": ("blade_speed",),
+    "blade_height": ("blade_height",),
+    "robot_sig": ("robotsignal",),
+    "wifi_rssi": ("robotsignal",),
+    "event": ("eventcode",),
+    "mower_firmware": ("device_firmware",),
+    "mower_new_firmware": ("device_firmware_new", "device_ota_desc"),
+    "base_firmware": ("base_firmware",),
+    "base_new_firmware": ("base_firmware_new", "base_ota_desc"),
+    "base_serialnumber": ("base_sn",),
+    "task_id": ("task_id",),
+    "schedule_cancel": ("schedule_cancel",),
+    "normal_done": ("normal_done",),
+    "end_reason": ("end_reason",),
+    "oneshot_task_type": ("oneshot_task_type",),
+    "start_reason": ("start_reason",),
+    "task_type": ("task_type",),
+}
+
+
 class SunseekerSensor(SunseekerEntity, SensorEntity):
     """Sunseeker sensor."""
 
@@ -735,6 +789,11 @@ class SunseekerSensor(SunseekerEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit
         self._valuepair = valuepair
         self._source = source
+        if source == "devicedata":
+            # Only set by the cloud api, which updates all entities
+            self._device_fields = ()
+        else:
+            self._device_fields = _SENSOR_FIELDS.get(valuepair)
         self._icon = icon
         self._attr_has_entity_name = True
         self._attr_translation_key = translationkey
@@ -1183,6 +1242,8 @@ class SunseekerScheduleSensor(SunseekerEntity, SensorEntity):
 class SunseekerCustomEstimatedTimeSensor(SunseekerEntity, SensorEntity):
     """Sunseeker Custom Estimated time Sensor."""
 
+    _device_fields = ("zone.estimate_time",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1222,6 +1283,8 @@ class SunseekerCustomEstimatedTimeSensor(SunseekerEntity, SensorEntity):
 class SunseekerCustomZoneSizeSensor(SunseekerEntity, SensorEntity):
     """Sunseeker Custom Estimated time Sensor."""
 
+    _device_fields = ("zone.region_size",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1261,6 +1324,8 @@ class SunseekerCustomZoneSizeSensor(SunseekerEntity, SensorEntity):
 class SunseekerWorkRecordSensor(SunseekerEntity, SensorEntity):
     """Sunseeker Work Record Sensor (MODEL_X and MODEL_S only)."""
 
+    _device_fields = ()
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1324,6 +1389,8 @@ def _point_in_polygon(x: float, y: float, polygon: list[tuple[float, float]]) ->
 class SunseekerWorkRegionSensor(SunseekerEntity, SensorEntity):
     """Sunseeker Work Region Sensor (MODEL_X and MODEL_S only)."""
 
+    _device_fields = ("map.mower_pos",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
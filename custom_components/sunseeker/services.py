@@ -5,7 +5,12 @@ import logging
 import voluptuous as vol
 
 from homeassistant.const import CONF_ENTITY_ID
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 
@@ -36,6 +41,7 @@ SERVICE_START_MOWING_SELECTED_AREA = "start_mowing_selected_area"
 SERVICE_STOP_TASK = "stop_task"
 SERVICE_LOAD_WORK_RECORD = "load_work_record"
 SERVICE_GET_WORK_RECORDS = "get_work_records"
+SERVICE_GET_MAP = "get_map"
 
 SET_DELETE_BACKUP = vol.Schema(
     {
@@ -57,6 +63,12 @@ SET_BACKUP_MAP = vol.Schema(
     }
 )
 
+GET_MAP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ENTITY_ID): cv.entity_id,
+    }
+)
+
 SET_PIN_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -151,7 +163,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.delete_backup,
             int(mapid),
         )
@@ -169,7 +181,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.restore_map,
             int(mapid),
         )
@@ -187,7 +199,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.backup_map,
             int(mapid),
         )
@@ -206,12 +218,12 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
         if coordinator.device.model == MODEL_OLD:
-            await hass.async_add_executor_job(
+            await coordinator.device.async_command(
                 coordinator.device.set_schedule_old,
                 schedule,
             )
         else:
-            await hass.async_add_executor_job(
+            await coordinator.device.async_command(
                 coordinator.device.set_schedule_new,
                 schedule,
             )
@@ -229,11 +241,31 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.set_map,
             map_data,
         )
 
+    async def async_handle_get_map(call: ServiceCall) -> ServiceResponse:
+        entity_id = call.data["entity_id"]
+
+        ent_reg = er.async_get(hass)
+        entry = ent_reg.async_get(entity_id)
+        if not entry:
+            raise HomeAssistantError(f"Entity {entity_id} not found")
+
+        dsn = entry.unique_id.split("_")[1]  # Example: "Map_CE1234563534545"
+        coordinator = _find_coordinator(hass, dsn)
+        if coordinator is None:
+            raise HomeAssistantError(f"Device for {entity_id} not found")
+        device_map = coordinator.device.map
+        model = await device_map.async_get_map_model()
+        return {
+            "map_id": device_map.mapid,
+            "map_data": model.data if model else None,
+            "map_backup": device_map.backupmap_data,
+        }
+
     async def async_handle_set_pin(call: ServiceCall):
         entity_id = call.data["entity_id"]
         oldpin = call.data["old_pin"]
@@ -250,7 +282,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.change_pincode, oldpin, newpin
         )
 
@@ -270,7 +302,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
         zoneids = coordinator.device.Schedule_new.get_id_by_name(zones)
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.start_mowing,
             zoneids,
         )
@@ -289,7 +321,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.stop,
         )
 
@@ -308,7 +340,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.start_mowing_selected_area,
             points,
         )
@@ -327,7 +359,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
+        await coordinator.device.async_command(
             coordinator.device.stop_task,
         )
 
@@ -344,8 +376,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
-            coordinator.device.load_work_record_detail,
+        await coordinator.device.async_load_work_record_detail(
             url,
         )
 
@@ -364,8 +395,7 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         coordinator = _find_coordinator(hass, dsn)
         if coordinator is None:
             raise HomeAssistantError(f"Device for {entity_id} not found")
-        await hass.async_add_executor_job(
-            coordinator.device.get_work_records,
+        await coordinator.device.async_get_work_records(
             pos,
             count,
             append,
@@ -437,6 +467,13 @@ async def async_setup_services(hass: HomeAssistant) -> bool:  # noqa: C901
         async_handle_get_work_records,
         schema=GET_WORK_RECORDS_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_MAP,
+        async_handle_get_map,
+        schema=GET_MAP_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_PIN,
@@ -1,11 +1,13 @@
 """SunseekerPy."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import json
 import logging
 from pathlib import Path
 from threading import Timer
-
-import requests
+import time
 
 from .const import (
     APPTYPE_NEW,
@@ -17,6 +19,8 @@ from .const import (
     HOST_OLD,
     HOST_XV_EU,
     HOST_XV_US,
+    HTTP_POOL_SIZE,
+    INIT_CONCURRENCY,
     MODEL_OLD,
     MODEL_S,
     MODEL_SXV,
@@ -57,6 +61,7 @@ from .const import (
     X,
 )
 from .sunseeker_device import SunseekerDevice
+from .sunseeker_http import SunseekerHttpClient
 from .sunseeker_mqtt import SunseekermqttController
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,7 +70,17 @@ _LOGGER = logging.getLogger(__name__)
 class SunseekerRoboticmower:
     """SunseekerRobot class."""
 
-    def __init__(self, brand, apptype, region, email, password, language) -> None:
+    def __init__(
+        self,
+        brand,
+        apptype,
+        region,
+        email,
+        password,
+        language,
+        pool_size: int = HTTP_POOL_SIZE,
+        init_concurrency: int = INIT_CONCURRENCY,
+    ) -> None:
         """Init function."""
 
         self.debug = False
@@ -99,6 +114,19 @@ class SunseekerRoboticmower:
         self.mqtt_controllers: list[SunseekermqttController] = []
         self.need_sxv_mqtt = False
         self.need_V1_mqtt = False
+        # Shared by every device and map so REST calls reuse warm connections
+        self.http = SunseekerHttpClient(pool_size)
+        self.init_concurrency = init_concurrency
+        # Seconds spent bringing up the devices of the last add_devices call
+        self.init_duration: float = 0
+        # True while the devices run on snapshot data, until revalidate
+        self.restored = False
+        # Event loop running the MQTT connections, None for paho's threads
+        self.mqtt_loop: asyncio.AbstractEventLoop | None = None
+
+    def attach_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run the MQTT connections on loop instead of paho's network threads."""
+        self.mqtt_loop = loop
 
     def on_load(self):
         """Login."""
@@ -128,7 +156,7 @@ class SunseekerRoboticmower:
             url_ = self.url + "/auth/oauth/token"
 
             _LOGGER.debug("Login header: %s data: %s url: %s", headers_, data_, url_)
-            response = requests.post(
+            response = self.http.post(
                 url=url_,
                 headers=headers_,
                 data=data_,
@@ -146,51 +174,11 @@ class SunseekerRoboticmower:
     def on_after_login(self):
         """Init the robots."""
         self.login_ok = True
-        if self.apptype == APPTYPE_OLD:
-            devicelist = self.get_device_list(APPTYPE_OLD, MODEL_OLD)
-            if devicelist and devicelist.get("data", []):
-                if self.add_devices(devicelist, APPTYPE_OLD, MODEL_OLD):
-                    mqtt_controller = SunseekermqttController(
-                        self,
-                        self.session["username"],
-                        self.session["user_id"],
-                        self.session["access_token"],
-                        self.region,
-                        self.apptype,
-                        MODEL_OLD,
-                        self.url,
-                    )
-                    self.mqtt_controllers.append(mqtt_controller)
-        else:
-            devicelist = self.get_device_list(
-                self.apptype, MODEL_SXV
-            )  # any model just not old
-            if devicelist and devicelist.get("data", []):
-                if self.add_devices(devicelist, self.apptype, MODEL_SXV):
-                    if self.need_V1_mqtt:
-                        mqtt_controller = SunseekermqttController(
-                            self,
-                            self.session["username"],
-                            self.session["user_id"],
-                            self.session["access_token"],
-                            self.region,
-                            self.apptype,
-                            MODEL_V1,
-                            self.url,
-                        )
-                        self.mqtt_controllers.append(mqtt_controller)
-                    if self.need_sxv_mqtt:
-                        mqtt_controller = SunseekermqttController(
-                            self,
-                            self.session["username"],
-                            self.session["user_id"],
-                            self.session["access_token"],
-                            self.region,
-                            self.apptype,
-                            MODEL_SXV,
-                            self.url,
-                        )
-                        self.mqtt_controllers.append(mqtt_controller)
+        model = self.devicelist_model()
+        devicelist = self.get_device_list(self.apptype, model)
+        if devicelist and devicelist.get("data", []):
+            if self.add_devices(devicelist, self.apptype, model):
+                self.create_mqtt_controllers()
 
         if self.debug:
             json_file = Path(__file__).parent / "GetDeviceList.json"
@@ -205,6 +193,40 @@ class SunseekerRoboticmower:
                     uid = device["appUserId"]
                 for mc in self.mqtt_controllers:
                     mc.debug_user_id = uid
+        self.start_mqtt()
+
+    def devicelist_model(self) -> str:
+        """Model used to fetch the device list of the apptype."""
+        if self.apptype == APPTYPE_OLD:
+            return MODEL_OLD
+        return MODEL_SXV  # any model just not old
+
+    def create_mqtt_controllers(self) -> None:
+        """Create the MQTT controllers needed by the added devices."""
+        models = []
+        if self.apptype == APPTYPE_OLD:
+            models.append(MODEL_OLD)
+        else:
+            if self.need_V1_mqtt:
+                models.append(MODEL_V1)
+            if self.need_sxv_mqtt:
+                models.append(MODEL_SXV)
+        for model in models:
+            mqtt_controller = SunseekermqttController(
+                self,
+                self.session["username"],
+                self.session["user_id"],
+                self.session["access_token"],
+                self.region,
+                self.apptype,
+                model,
+                self.url,
+                self.mqtt_loop,
+            )
+            self.mqtt_controllers.append(mqtt_controller)
+
+    def start_mqtt(self) -> None:
+        """Connect MQTT and start the token refresh timer."""
         for mc in self.mqtt_controllers:
             mc.Start_mqtt()
 
@@ -218,6 +240,89 @@ class SunseekerRoboticmower:
         )
         self.refresh_token_interval.start()
 
+    def snapshot(self) -> dict:
+        """Data needed to start from cache at the next restart.
+
+        Blocking, run it in the executor.
+        """
+        return {
+            "apptype": self.apptype,
+            "region": self.region,
+            "devicelist": copy.deepcopy(
+                self.devicelist_OLD_models
+                if self.apptype == APPTYPE_OLD
+                else self.devicelist_NEW_models
+            ),
+            "devices": [ad.snapshot() for ad in self.robotList],
+        }
+
+    def restore_snapshot(self, snapshot: dict) -> bool:
+        """Create the devices from a snapshot, without any request.
+
+        Returns False if the snapshot can not be used.
+        """
+        if snapshot.get("apptype") != self.apptype:
+            return False
+        if snapshot.get("region") != self.region:
+            return False
+        devicelist = snapshot.get("devicelist") or {}
+        if not devicelist.get("data", []):
+            return False
+        device_data = {d.get("devicesn"): d for d in snapshot.get("devices", [])}
+        if any(d["deviceSn"] not in device_data for d in devicelist["data"]):
+            return False
+        if self.apptype == APPTYPE_OLD:
+            self.devicelist_OLD_models = devicelist
+        else:
+            self.devicelist_NEW_models = devicelist
+        try:
+            for ad in self.create_devices(
+                devicelist, self.apptype, self.devicelist_model()
+            ):
+                ad.restore_snapshot(device_data[ad.devicesn])
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            _LOGGER.warning("Snapshot could not be restored: %s", error)
+            self.deviceArray = []
+            self.robotList = []
+            return False
+        self.restored = True
+        _LOGGER.info("Restored %s devices from snapshot", len(self.robotList))
+        return True
+
+    def revalidate(self) -> bool | None:
+        """Refresh restored devices from the cloud and start MQTT.
+
+        Returns False if the snapshot can not be used: the login was rejected
+        or the account has other devices. None if the cloud could not be
+        reached.
+        """
+        if not self.login():
+            return None
+        if not self.session.get("access_token"):
+            # The cloud answered without a token, retrying will not help
+            _LOGGER.error("Login rejected: %s", self.session)
+            return False
+        devicelist = self.get_device_list(self.apptype, self.devicelist_model())
+        if devicelist is None:
+            return None
+        sns = {device["deviceSn"] for device in devicelist.get("data", [])}
+        if sns != set(self.deviceArray):
+            _LOGGER.info("Device list changed since the snapshot")
+            return False
+        self.login_ok = True
+        for ad in self.robotList:
+            ad.access_token = self.session["access_token"]
+        self.init_devices(self.robotList)
+        for ad in self.robotList:
+            ad.map.robot_image = ad.map.load_robot_image()
+        if self._unloaded:
+            return True
+        if not self.mqtt_controllers:
+            self.create_mqtt_controllers()
+        self.start_mqtt()
+        self.restored = False
+        return True
+
     def getURL(self, apptype: str) -> str:
         """Get the url."""
         if apptype == APPTYPE_OLD:
@@ -254,7 +359,18 @@ class SunseekerRoboticmower:
 
     def add_devices(self, devicelist, apptype: str, model: str) -> bool:
         """Adds the devices from a devicelist."""
-        added: bool = False
+        new_devices = self.create_devices(devicelist, apptype, model)
+        self.init_devices(new_devices)
+        for ad in new_devices:
+            lg = f"Added device model: {ad.model} Gen: {ad.submodel}"
+            _LOGGER.info(lg)
+        return bool(new_devices)
+
+    def create_devices(
+        self, devicelist, apptype: str, model: str
+    ) -> list[SunseekerDevice]:
+        """Create the device objects of a devicelist, without init."""
+        new_devices: list[SunseekerDevice] = []
         for device in devicelist["data"]:
             device_sn = device["deviceSn"]
             if device["modelName"].startswith((V18, V3)):
@@ -267,7 +383,6 @@ class SunseekerRoboticmower:
                 model = MODEL_V1
 
             if device_sn not in self.deviceArray:
-                added = True
                 self.need_sxv_mqtt = (
                     model in (MODEL_S, MODEL_X, MODEL_V) or self.need_sxv_mqtt
                 )
@@ -275,8 +390,9 @@ class SunseekerRoboticmower:
                 device_id = device["deviceId"]
                 userid = device["appUserId"]
                 self.deviceArray.append(device_sn)
-                ad = SunseekerDevice(device_sn)
-                ad.access_token = self.session["access_token"]
+                ad = SunseekerDevice(device_sn, self.http)
+                # No token yet when created from a snapshot
+                ad.access_token = self.session.get("access_token", "")
                 ad.userid = userid  # self.session["user_id"]
                 ad.language = self.language
                 ad.deviceId = device_id
@@ -352,10 +468,33 @@ class SunseekerRoboticmower:
                 ):
                     ad.support_edge_trim = True
 
-                ad.InitDevice()
-                lg = f"Added device model: {ad.model} Gen: {ad.submodel}"
-                _LOGGER.info(lg)
-        return added
+                new_devices.append(ad)
+        return new_devices
+
+    def init_devices(self, devices: list[SunseekerDevice]) -> None:
+        """Run InitDevice for all devices concurrently.
+
+        Every device gets its own orchestrating thread, while the REST calls
+        of all devices share one pool capped at init_concurrency.
+        """
+        if not devices:
+            return
+        start = time.monotonic()
+        with (
+            ThreadPoolExecutor(
+                max_workers=self.init_concurrency,
+                thread_name_prefix="sunseeker_init_fetch",
+            ) as fetch_pool,
+            ThreadPoolExecutor(
+                max_workers=len(devices),
+                thread_name_prefix="sunseeker_init",
+            ) as device_pool,
+        ):
+            futures = [device_pool.submit(ad.InitDevice, fetch_pool) for ad in devices]
+            for future in futures:
+                future.result()
+        self.init_duration = round(time.monotonic() - start, 3)
+        _LOGGER.info("Initialized %s devices in %ss", len(devices), self.init_duration)
 
     def get_device_list(self, apptype: str, model: str):
         """Get device."""
@@ -376,7 +515,7 @@ class SunseekerRoboticmower:
                 "User-Agent": "okhttp/4.4.1",
             }
             _LOGGER.debug("Get device list header: %s url: %s", headers_, url_)
-            response = requests.get(
+            response = self.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
@@ -448,7 +587,7 @@ class SunseekerRoboticmower:
             _LOGGER.debug(
                 "Refresh token header: %s data: %s url: %s", headers, data, url
             )
-            response = requests.post(
+            response = self.http.post(
                 url=url,
                 headers=headers,
                 data=data,
@@ -498,7 +637,7 @@ class SunseekerRoboticmower:
                 "User-Agent": "okhttp/4.8.1",
             }
             _LOGGER.debug("Refresh token header: %s url: %s", headers, url)
-            response = requests.get(
+            response = self.http.get(
                 url=url,
                 headers=headers,
                 timeout=10,
@@ -547,3 +686,4 @@ class SunseekerRoboticmower:
                     ad.ota_timer.cancel()
                 if ad.update_timer:
                     ad.update_timer.cancel()
+        self.http.close()
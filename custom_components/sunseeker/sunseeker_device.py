@@ -1,12 +1,15 @@
 """SunseekerPy."""
 
+import asyncio
+from concurrent.futures import Executor
+from contextvars import ContextVar
+import copy
 import gzip
 import json
 import logging
 import re
-from threading import Timer
-
-import requests
+from threading import Lock, Timer
+import time
 
 from .const import (
     APPTYPE_NEW,
@@ -16,22 +19,30 @@ from .const import (
     MODEL_V,
     MODEL_V1,
     MODEL_X,
+    OTA_CHECK_INTERVAL,
     SUB_MODEL_GEN1,
 )
 from .sunseeker_consumable_items import SunseekerConsumableItems
+from .sunseeker_http import SunseekerHttpClient
 from .sunseeker_map import SunseekerMap
 from .sunseeker_schedule import Sunseeker_new_schedule, SunseekerSchedule
 from .sunseeker_zone import SunseekerZigZag, SunseekerZone
 
 _LOGGER = logging.getLogger(__name__)
 
+# Commands issued while running under SunseekerDevice.async_command
+_pending_commands: ContextVar[list | None] = ContextVar(
+    "_pending_commands", default=None
+)
+
 
 class SunseekerDevice:
     """Class for a single Sunseeker robot."""
 
-    def __init__(self, Devicesn) -> None:
+    def __init__(self, Devicesn, http: SunseekerHttpClient | None = None) -> None:
         """Init."""
 
+        self.http: SunseekerHttpClient = http or SunseekerHttpClient()
         self.language = ""
         self.host = ""
         self.url = ""
@@ -46,6 +57,8 @@ class SunseekerDevice:
         self.deviceId = None
         self.devicedata = {}  # device status
         self.settings = {}  # data from get settings
+        # Held while an MQTT message is applied and while the snapshot is copied
+        self.data_lock = Lock()
         self.power = 0
         self.mode = 0
         self.errortype = 0
@@ -130,6 +143,10 @@ class SunseekerDevice:
         self.base_firmware: str = ""
         self.base_firmware_new: str = ""
         self.base_ota_desc: str = ""
+        # [device_firmware, base_firmware] the *_new values were checked for
+        self.ota_checked: list = []
+        # Wall clock time of the last firmware check
+        self.ota_checked_at: float = 0
         self.ota_timer = None
         self.update_timer: Timer | None = None
         # Task
@@ -178,42 +195,143 @@ class SunseekerDevice:
         self.support_multi_angle = False
         self.support_4G_net = False
         self.support_edge_trim = False
-
-    def InitDevice(self) -> None:
-        """Setup the device."""
-        self.get_settings()
-        self.update_devices()
-        self.InitValues()
-
+        # Seconds spent in each InitDevice stage
+        self.init_timings: dict[str, float] = {}
+
+    def InitDevice(self, pool: Executor | None = None) -> None:
+        """Setup the device.
+
+        With a pool the independent requests of each stage run concurrently.
+        """
+        start = time.monotonic()
+        calls = [(self.get_settings,), (self.update_devices,)]
+        if self.has_map:
+            calls += [
+                (self.map.get_map_info,),
+                (self.map.get_heat_map_data,),
+                (self.map.get_backup_map_data,),
+                (self.get_work_records, 1, 10),
+            ]
+        self._run_init_stage("fetch", pool, calls)
+
+        self._run_init_stage("values", None, [(self.InitValues, False)])
+
+        calls = []
         if self.model in (MODEL_V1):
-            self.Schedule_new.Get_schedule_data_V1()
+            calls.append((self.Schedule_new.Get_schedule_data_V1,))
         if self.model in (MODEL_V):
-            self.Schedule_new.Get_schedule_data_V()
-        if self.model in (MODEL_S, MODEL_X, MODEL_V, MODEL_V1):
-            self.check_ota()
+            calls.append((self.Schedule_new.Get_schedule_data_V,))
+        check_ota = self.model in (MODEL_S, MODEL_X, MODEL_V, MODEL_V1)
+        run_ota = check_ota and not (self._ota_current() and self._ota_recent())
+        if run_ota:
+            calls += self._ota_checks()
+        self._run_init_stage("schedule_ota", pool, calls)
+        if run_ota:
+            self._set_ota_checked()
+        if check_ota:
+            # Keep the interval when the snapshot check was recent
+            self._start_ota_timer(
+                self.ota_checked_at + OTA_CHECK_INTERVAL - time.time()
+            )
+        self.init_timings["total"] = round(time.monotonic() - start, 3)
+        _LOGGER.debug(f"Init timings for {self.devicesn}: {self.init_timings}")  # noqa: G004
+
+    def _run_init_stage(self, stage: str, pool: Executor | None, calls: list) -> None:
+        """Run the calls of an init stage and record how long it took."""
+        start = time.monotonic()
+        if pool is None:
+            for func, *args in calls:
+                func(*args)
+        else:
+            futures = [pool.submit(func, *args) for func, *args in calls]
+            for future in futures:
+                future.result()
+        self.init_timings[stage] = round(time.monotonic() - start, 3)
+
+    @property
+    def has_map(self) -> bool:
+        """Return True if the device has map, zone and work record data."""
+        return self.apptype == APPTYPE_NEW and self.model in (MODEL_S, MODEL_X)
+
+    def snapshot(self) -> dict:
+        """Cloud data to store in the warm-start snapshot.
+
+        Blocking, run it in the executor. The device data is deep copied under
+        data_lock, so the store never sees a dict an MQTT message is changing.
+        The map data is only referenced under the lock and copied after it,
+        the MQTT handlers wait on the lock.
+        """
+        with self.data_lock:
+            data = copy.deepcopy(
+                {
+                    "devicesn": self.devicesn,
+                    "settings": self.settings,
+                    "devicedata": self.devicedata,
+                    "work_records": self.work_records,
+                    "ota_checked": self.ota_checked,
+                    "ota_checked_at": self.ota_checked_at,
+                    "device_firmware_new": self.device_firmware_new,
+                    "device_ota_desc": self.device_ota_desc,
+                    "base_firmware_new": self.base_firmware_new,
+                    "base_ota_desc": self.base_ota_desc,
+                }
+            )
+            map_refs = self.map.snapshot_refs()
+        data["map"] = self.map.snapshot(map_refs)
+        return data
+
+    def restore_snapshot(self, data: dict) -> None:
+        """Setup the device from a warm-start snapshot without cloud calls."""
+        self.settings = data["settings"]
+        self.devicedata = data["devicedata"]
+        self.work_records = data.get("work_records", [])
+        self.ota_checked = data.get("ota_checked", [])
+        self.ota_checked_at = data.get("ota_checked_at", 0)
+        self.device_firmware_new = data.get("device_firmware_new", "")
+        self.device_ota_desc = data.get("device_ota_desc", "")
+        self.base_firmware_new = data.get("base_firmware_new", "")
+        self.base_ota_desc = data.get("base_ota_desc", "")
+        self.map.restore_snapshot(data.get("map", {}))
+        if self.model in (MODEL_X, MODEL_S):
+            self.map.robot_image = self.map.load_robot_image(fetch=False)
+        self.InitValues(False)
 
     def InitMapAndZoneData(self) -> None:
         """Init map and zone data."""
-        if self.apptype == APPTYPE_NEW and self.model in (MODEL_S, MODEL_X):
+        if self.has_map:
             self.map.get_map_info()
-            if self.map.image_data:
-                json_data = self.map.image_data
-                idata = json.loads(json_data)
-                for work in idata.get("region_work", []):
-                    zoneid = work["id"]
-                    zonename = work["name"]
-                    self.zones.append([zoneid, zonename])
-                    zone = SunseekerZone()
-                    zone.id = zoneid
-                    zone.name = zonename
-                    self.zonelist.append(zone)
-                    self.Schedule_new.zones.append([zoneid, zonename])
+            self.InitZones()
             self.map.get_heat_map_data()
             self.map.get_backup_map_data()
             self.get_work_records(1, 10)
 
-    def InitValues(self) -> None:  # noqa: C901
-        """Init values at upstart."""
+    def InitZones(self) -> None:
+        """Add the work regions of the map as zones."""
+        model = self.map.map_model
+        if model:
+            for work in model.work:
+                zoneid = work.id
+                zonename = work.name
+                zone = self.get_zone(zoneid)
+                if zone:
+                    # Already added from the snapshot, only follow renames
+                    zone.name = zonename
+                    for entry in self.zones + self.Schedule_new.zones:
+                        if entry[0] == zoneid:
+                            entry[1] = zonename
+                    continue
+                self.zones.append([zoneid, zonename])
+                zone = SunseekerZone()
+                zone.id = zoneid
+                zone.name = zonename
+                self.zonelist.append(zone)
+                self.Schedule_new.zones.append([zoneid, zonename])
+
+    def InitValues(self, fetch_map: bool = True) -> None:  # noqa: C901
+        """Init values at upstart.
+
+        fetch_map is False when InitDevice already fetched the map data.
+        """
         self.deviceSpecies = self.devicedata["data"].get("deviceSpecies") or 0
         self.base_firmware = self.settings["data"].get(
             "wirelessStationFirmwareVersion", ""
@@ -228,7 +346,8 @@ class SunseekerDevice:
         self.cliff_detect = self.settings["data"].get("cliffDetectEnable", False)
         self.dis_along_border = self.settings["data"].get("disAlongBorder", 1)
         self.above_edge = self.settings["data"].get("aboveEdge", False)
-        self.device_firmware_new = self.device_firmware
+        if not self._ota_current():
+            self.device_firmware_new = self.device_firmware
         self.power = self.devicedata["data"].get("electricity")
         self.mode = int(self.devicedata["data"].get("workStatusCode") or 0)
         self.rain_en = self.devicedata["data"].get("rainFlag")
@@ -242,7 +361,10 @@ class SunseekerDevice:
             self.oneshot_task_type = self.settings["data"].get("oneshotTaskType", "")
             self.border_first = self.settings["data"].get("firstAlongBorder", "")
 
-        self.InitMapAndZoneData()
+        if fetch_map:
+            self.InitMapAndZoneData()
+        elif self.has_map:
+            self.InitZones()
 
         if self.apptype == APPTYPE_OLD:
             self.station = self.devicedata["data"].get("stationFlag")
@@ -408,12 +530,36 @@ class SunseekerDevice:
 
     def check_ota(self) -> None:
         """Timer to fetch firmware versions."""
-        self.check_ota_version(self.devicesn, self.device_firmware, 0)
+        for func, *args in self._ota_checks():
+            func(*args)
+        self._set_ota_checked()
+        self._start_ota_timer()
+
+    def _set_ota_checked(self) -> None:
+        """Remember the firmware versions just checked and when."""
+        self.ota_checked = [self.device_firmware, self.base_firmware]
+        self.ota_checked_at = time.time()
+
+    def _ota_current(self) -> bool:
+        """Return True if the firmware versions were already checked."""
+        return self.ota_checked == [self.device_firmware, self.base_firmware]
+
+    def _ota_recent(self) -> bool:
+        """Return True if the last firmware check is newer than the interval."""
+        return 0 <= time.time() - self.ota_checked_at < OTA_CHECK_INTERVAL
+
+    def _ota_checks(self) -> list:
+        """Firmware version checks for the mower and the base."""
+        calls = [(self.check_ota_version, self.devicesn, self.device_firmware, 0)]
         if self.model in (MODEL_X, MODEL_S) and not self.support_4G_net:
-            self.check_ota_version(self.base_sn, self.base_firmware, 2)
+            calls.append((self.check_ota_version, self.base_sn, self.base_firmware, 2))
+        return calls
+
+    def _start_ota_timer(self, delay: float = OTA_CHECK_INTERVAL) -> None:
+        """Schedule the next firmware check."""
         if self.ota_timer:
             self.ota_timer.cancel()
-        self.ota_timer = Timer(21600, self.check_ota)
+        self.ota_timer = Timer(delay, self.check_ota)
         try:
             self.ota_timer.start()
         except RuntimeError:
@@ -455,7 +601,7 @@ class SunseekerDevice:
                 "User-Agent": "okhttp/4.4.1",
             }
             _LOGGER.debug(f"Get settings header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            response = self.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
@@ -491,7 +637,7 @@ class SunseekerDevice:
                 "User-Agent": "okhttp/4.4.1",
             }
             _LOGGER.debug(f"Get device status header: {headers} url: {url}")  # noqa: G004
-            response = requests.get(
+            response = self.http.get(
                 url=url,
                 headers=headers,
                 timeout=10,
@@ -504,70 +650,117 @@ class SunseekerDevice:
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.error(f"Get device_status: failed {error}")  # noqa: G004
 
+    def _work_records_request(self, pos: int, count: int) -> tuple[str, dict]:
+        """Url and headers for the workrecords page."""
+        endpoint = f"/app_wireless_mower/work_record/page?sn={self.devicesn}&current={pos}&size={count}"
+        url_ = self.url + endpoint
+        headers_ = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.4.1",
+        }
+        _LOGGER.debug(f"Get workrecords header: {headers_} url: {url_}")  # noqa: G004
+        return url_, headers_
+
+    def _apply_work_records(self, response_data: dict, append: bool) -> None:
+        """Store a page of workrecords."""
+        _LOGGER.debug(json.dumps(response_data))
+
+        if response_data["code"] != 0:
+            self.error_text = response_data.get("msg")
+            if self.dataupdated:
+                self.dataupdated(self.devicesn)
+            _LOGGER.debug(f"Error getting workrecords for {self.devicesn}")  # noqa: G004
+            _LOGGER.debug(json.dumps(response_data))
+            return
+        self.error_text = ""
+        if response_data.get("data") is None:
+            return
+        records = response_data.get("data", {}).get("records", [])
+        if append:
+            existing_ids = {r.get("id") for r in self.work_records}
+            self.work_records = self.work_records + [
+                r for r in records if r.get("id") not in existing_ids
+            ]
+        else:
+            self.work_records = records
+        if self.dataupdated:
+            self.dataupdated(self.devicesn)
+
+    def _work_records_failed(self, error: Exception) -> None:
+        """Handle a failed workrecords request."""
+        self.error_text = error
+        if self.dataupdated:
+            self.dataupdated(self.devicesn)
+        _LOGGER.error(f"Get work_records: failed {error}")  # noqa: G004
+
     def get_work_records(self, pos: int = 1, count: int = 10, append: bool = False):
         """Get workrecords."""
-        endpoint = f"/app_wireless_mower/work_record/page?sn={self.devicesn}&current={pos}&size={count}"
         try:
-            url_ = self.url + endpoint
-            headers_ = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.4.1",
-            }
-            _LOGGER.debug(f"Get workrecords header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            url_, headers_ = self._work_records_request(pos, count)
+            response = self.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
             )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
+            self._apply_work_records(response.json(), append)
+            return  # noqa: TRY300
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            self._work_records_failed(error)
 
-            if response_data["code"] != 0:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(f"Error getting workrecords for {self.devicesn}")  # noqa: G004
-                _LOGGER.debug(json.dumps(response_data))
-                return
-            self.error_text = ""
-            if response_data.get("data") is None:
-                return
-            records = response_data.get("data", {}).get("records", [])
-            if append:
-                existing_ids = {r.get("id") for r in self.work_records}
-                self.work_records = self.work_records + [
-                    r for r in records if r.get("id") not in existing_ids
-                ]
-            else:
-                self.work_records = records
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
+    async def async_get_work_records(
+        self, pos: int = 1, count: int = 10, append: bool = False
+    ):
+        """Get workrecords on the async session."""
+        try:
+            url_, headers_ = self._work_records_request(pos, count)
+            response = await self.http.async_get(
+                url=url_,
+                headers=headers_,
+                timeout=10,
+            )
+            self._apply_work_records(response.json(), append)
             return  # noqa: TRY300
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Get work_records: failed {error}")  # noqa: G004
+            self._work_records_failed(error)
+
+    def _apply_work_record_detail(self, content: bytes) -> None:
+        """Decompress and store a work record detail."""
+        decompressed = gzip.decompress(content)
+        self.work_record_detail = json.loads(decompressed)
+        if self.dataupdated:
+            self.dataupdated(self.devicesn)
+
+    def _work_record_detail_failed(self, error: Exception) -> None:
+        """Handle a failed work record detail request."""
+        _LOGGER.error(f"Load work record detail: failed {error}")  # noqa: G004
+        self.error_text = error
+        if self.dataupdated:
+            self.dataupdated(self.devicesn)
 
     def load_work_record_detail(self, url: str):
         """Fetch and decompress a work record detail gz file."""
         try:
             _LOGGER.debug(f"Load work record detail: {url}")  # noqa: G004
-            response = requests.get(url=url, timeout=30)
+            response = self.http.get(url=url, timeout=30)
             response.raise_for_status()
-            decompressed = gzip.decompress(response.content)
-            self.work_record_detail = json.loads(decompressed)
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
+            self._apply_work_record_detail(response.content)
             return  # noqa: TRY300
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            _LOGGER.error(f"Load work record detail: failed {error}")  # noqa: G004
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
+            self._work_record_detail_failed(error)
+
+    async def async_load_work_record_detail(self, url: str):
+        """Fetch and decompress a work record detail gz file on the async session."""
+        try:
+            _LOGGER.debug(f"Load work record detail: {url}")  # noqa: G004
+            response = await self.http.async_get(url=url, timeout=30)
+            response.raise_for_status()
+            self._apply_work_record_detail(response.content)
+            return  # noqa: TRY300
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            self._work_record_detail_failed(error)
 
     def device_skin(self):
         """Get skin. X models. Return on mqtt."""
@@ -583,7 +776,7 @@ class SunseekerDevice:
                 "User-Agent": "okhttp/4.4.1",
             }
             _LOGGER.debug(f"Get skin header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            response = self.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
@@ -682,46 +875,13 @@ class SunseekerDevice:
     def get_property(self, data):
         """Get property."""
         endpoint = self.cmdurl + "get_property"
-        try:
-            url_ = self.url + endpoint
-            headers_ = {
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Connection": "Keep-Alive",
-            }
-            _LOGGER.debug(
-                f"Get Properties header: {headers_} url: {url_} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url_,
-                headers=headers_,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-
-            if response_data["code"] != 0:
-                self.error_text = response_data.get("msg")
-                _LOGGER.debug(f"Error getting properties for {self.devicesn}")  # noqa: G004
-                _LOGGER.debug(json.dumps(response_data))
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                return
-            self.error_text = ""
-            return  # noqa: TRY300
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            _LOGGER.error(f"Get properties: failed {error}")  # noqa: G004
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            if hasattr(error, "response"):
-                if error.response.status == 401:
-                    _LOGGER.debug(json.dumps(error.response.json()))
-                    _LOGGER.debug("{element['path']} receive 401 error. Refresh Token")
-                    if self.func_refesh_token:
-                        self.func_refesh_token()
-                    return
+        url = self.url + endpoint
+        headers = {
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Connection": "Keep-Alive",
+        }
+        self._post_command("Get properties", url, headers, data, check_code=True)
 
     def getConsumableItems(self):
         """Consumable items."""
@@ -736,76 +896,44 @@ class SunseekerDevice:
 
     def set_rain_status(self, state: bool, delaymin: int):
         """Set rain status."""
-        try:
-            if self.model in (MODEL_S, MODEL_X, MODEL_V, MODEL_V1):
-                if self.model == MODEL_V1:
-                    url = self.url + self.cmdurl + "setProperty"
-                    data = {
-                        "appId": self.userid,
-                        "deviceSn": self.devicesn,
-                        "method": "setRain",
-                        "rainDelayDuration": int(delaymin),
-                        "rainFlag": state,
-                    }
-                else:
-                    url = self.url + self.cmdurl + "set_property"
-                    data = {
-                        "appId": self.userid,
-                        "delay": int(delaymin),
-                        "deviceSn": self.devicesn,
-                        "id": "setDevRain",
-                        "key": "rain",
-                        "method": "set_property",
-                        "rain_flag": state,
-                    }
-            else:
-                url = self.url + "/app_mower/device/setRain"
+        if self.model in (MODEL_S, MODEL_X, MODEL_V, MODEL_V1):
+            if self.model == MODEL_V1:
+                url = self.url + self.cmdurl + "setProperty"
                 data = {
                     "appId": self.userid,
                     "deviceSn": self.devicesn,
+                    "method": "setRain",
                     "rainDelayDuration": int(delaymin),
                     "rainFlag": state,
                 }
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-            }
-            _LOGGER.debug(
-                f"Set rain status url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
             else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            _LOGGER.error(f"Set rain status: failed {error}")  # noqa: G004
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            if hasattr(error, "response"):
-                if error.response.status == 401:
-                    _LOGGER.debug(json.dumps(error.response.json()))
-                    _LOGGER.debug("{element['path']} receive 401 error. Refresh Token")
-                    if self.func_refesh_token:
-                        self.func_refesh_token()
-                    return
+                url = self.url + self.cmdurl + "set_property"
+                data = {
+                    "appId": self.userid,
+                    "delay": int(delaymin),
+                    "deviceSn": self.devicesn,
+                    "id": "setDevRain",
+                    "key": "rain",
+                    "method": "set_property",
+                    "rain_flag": state,
+                }
+        else:
+            url = self.url + "/app_mower/device/setRain"
+            data = {
+                "appId": self.userid,
+                "deviceSn": self.devicesn,
+                "rainDelayDuration": int(delaymin),
+                "rainFlag": state,
+            }
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+        }
+        self._post_command("Set rain status", url, headers, data)
 
     def set_state_change(self, command, state, zone=None):
         """Old Command is "mode" and state is 1 = Start, 0 = Pause, 2 = Home, 4 = Border."""
@@ -821,98 +949,65 @@ class SunseekerDevice:
         if self.apptype == APPTYPE_NEW:
             endpoint = self.cmdurl + "action"
 
-        try:
-            if self.apptype == APPTYPE_OLD:
+        if self.apptype == APPTYPE_OLD:
+            data = {
+                "appId": self.userid,
+                "deviceSn": self.devicesn,
+                "mode": state,
+            }
+        elif self.apptype == APPTYPE_NEW:
+            # Other commands: stop_find_charger/stopFindCharger, restart/restartWork
+            if state == 1:
+                cmd = "start"
+                cmdid = "startWork"
+            elif state == 0:
+                cmd = "pause"
+                cmdid = "pauseWork"
+            elif state == 2:
+                cmd = "start_find_charger"
+                cmdid = "startFindCharger"
+            elif state == 4:
+                cmd = "stop"
+                cmdid = "stopWork"
+            elif state == 5:  # V-models border
+                cmd = "follow_border"
+                cmdid = "followBorder"
+            if state == 5:
                 data = {
                     "appId": self.userid,
+                    "cmd": cmd,
                     "deviceSn": self.devicesn,
-                    "mode": state,
+                    "id": cmdid,
+                    "method": "action",
+                    "value": True,
+                }
+            elif zone:
+                data = {
+                    "appId": self.userid,
+                    "cmd": cmd,
+                    "deviceSn": self.devicesn,
+                    "id": cmdid,
+                    "method": "action",
+                    "work_id": zone,
                 }
-            elif self.apptype == APPTYPE_NEW:
-                # Other commands: stop_find_charger/stopFindCharger, restart/restartWork
-                if state == 1:
-                    cmd = "start"
-                    cmdid = "startWork"
-                elif state == 0:
-                    cmd = "pause"
-                    cmdid = "pauseWork"
-                elif state == 2:
-                    cmd = "start_find_charger"
-                    cmdid = "startFindCharger"
-                elif state == 4:
-                    cmd = "stop"
-                    cmdid = "stopWork"
-                elif state == 5:  # V-models border
-                    cmd = "follow_border"
-                    cmdid = "followBorder"
-                if state == 5:
-                    data = {
-                        "appId": self.userid,
-                        "cmd": cmd,
-                        "deviceSn": self.devicesn,
-                        "id": cmdid,
-                        "method": "action",
-                        "value": True,
-                    }
-                elif zone:
-                    data = {
-                        "appId": self.userid,
-                        "cmd": cmd,
-                        "deviceSn": self.devicesn,
-                        "id": cmdid,
-                        "method": "action",
-                        "work_id": zone,
-                    }
-                else:
-                    data = {
-                        "appId": self.userid,
-                        "cmd": cmd,
-                        "deviceSn": self.devicesn,
-                        "id": cmdid,
-                        "method": "action",
-                    }
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-            }
-            url = self.url + endpoint
-            _LOGGER.debug(
-                f"Set state change url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
             else:
-                self.error_text = ""
-
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set state change: failed {error}")  # noqa: G004
-            if hasattr(error, "response"):
-                if error.response.status == 401:
-                    _LOGGER.debug(json.dumps(error.response.json()))
-                    _LOGGER.debug("{element['path']} receive 401 error. Refresh Token")
-                    if self.func_refesh_token:
-                        self.func_refesh_token()
-                    return
+                data = {
+                    "appId": self.userid,
+                    "cmd": cmd,
+                    "deviceSn": self.devicesn,
+                    "id": cmdid,
+                    "method": "action",
+                }
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+        }
+        url = self.url + endpoint
+        self._post_command("Set state change", url, headers, data)
 
     def start_mowing(self, zone=None):
         """Start Mowing."""
@@ -1071,40 +1166,17 @@ class SunseekerDevice:
             "deviceSn": self.devicesn,
         }
         # note: some old models has "pause": False/True
-        try:
-            url = self.url + "/app_mower/device-schedule/setScheduling"
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json; charset=UTF-8",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-                "Accept-Encoding": "gzip",
-            }
-            _LOGGER.debug(f"Set schedule url: {url} header: {headers} data: {data}")  # noqa: G004
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set_schedule: failed {error}")  # noqa: G004
+        url = self.url + "/app_mower/device-schedule/setScheduling"
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json; charset=UTF-8",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+            "Accept-Encoding": "gzip",
+        }
+        self._post_command("Set schedule", url, headers, data)
 
     def set_schedule_old(self, timedata: dict) -> None:
         """Set schedule from service call for old model mowers."""
@@ -1148,61 +1220,36 @@ class SunseekerDevice:
         mul4: int,
     ):
         """Set zone status."""
-        try:
-            url = self.url + "/app_mower/device/setZones"
-            data = {
-                "appId": self.userid,
-                "deviceSn": self.devicesn,
-                "meterFirst": 0,
-                "meterFour": 0,
-                "meterSecond": 0,
-                "meterThird": 0,
-                "proFirst": mul1,
-                "proFour": mul2,
-                "proSecond": mul3,
-                "proThird": mul4,
-                "zoneAutomaticFlag": zoneauto,
-                "zoneExFlag": 0,
-                "zoneFirstPercentage": zone1,
-                "zoneFourthPercentage": zone4,
-                "zoneOpenFlag": zone_enable,
-                "zoneSecondPercentage": zone2,
-                "zoneThirdPercentage": zone3,
-            }
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json; charset=UTF-8",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-                "Accept-Encoding": "gzip",
-            }
-            _LOGGER.debug(
-                f"Set zone status url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set zone status: failed {error}")  # noqa: G004
+        url = self.url + "/app_mower/device/setZones"
+        data = {
+            "appId": self.userid,
+            "deviceSn": self.devicesn,
+            "meterFirst": 0,
+            "meterFour": 0,
+            "meterSecond": 0,
+            "meterThird": 0,
+            "proFirst": mul1,
+            "proFour": mul2,
+            "proSecond": mul3,
+            "proThird": mul4,
+            "zoneAutomaticFlag": zoneauto,
+            "zoneExFlag": 0,
+            "zoneFirstPercentage": zone1,
+            "zoneFourthPercentage": zone4,
+            "zoneOpenFlag": zone_enable,
+            "zoneSecondPercentage": zone2,
+            "zoneThirdPercentage": zone3,
+        }
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json; charset=UTF-8",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+            "Accept-Encoding": "gzip",
+        }
+        self._post_command("Set zone status", url, headers, data)
 
     def set_ultrasonic(
         self,
@@ -1210,48 +1257,23 @@ class SunseekerDevice:
         ultra_lv: int,
     ):
         """Set ultrasonic."""
-        try:
-            url = self.url + "/app_mower/device/setUltra"
-            data = {
-                "appId": self.userid,
-                "deviceSn": self.devicesn,
-                "ultraFlag": ultra_en,
-                "ultraLv": ultra_lv,
-            }
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json; charset=UTF-8",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-                "Accept-Encoding": "gzip",
-            }
-            _LOGGER.debug(
-                f"Set ultrasonic url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set ultrasonic failed: {error}")  # noqa: G004
+        url = self.url + "/app_mower/device/setUltra"
+        data = {
+            "appId": self.userid,
+            "deviceSn": self.devicesn,
+            "ultraFlag": ultra_en,
+            "ultraLv": ultra_lv,
+        }
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json; charset=UTF-8",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+            "Accept-Encoding": "gzip",
+        }
+        self._post_command("Set ultrasonic", url, headers, data)
 
     def set_led(
         self,
@@ -1263,52 +1285,27 @@ class SunseekerDevice:
         ledNightFlag: bool,
     ):
         """Set Headlight."""
-        try:
-            url = self.url + "/app_mower/device/setLed"
-            data = {
-                "appId": self.userid,
-                "deviceSn": self.devicesn,
-                "ledFlag": ledFlag,
-                "ledColorCode": ledColorCode,
-                "ledEnd": ledEnd,
-                "ledModeCode": ledModeCode,
-                "ledStart": ledStart,
-                "ledNightFlag": ledNightFlag,
-            }
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json; charset=UTF-8",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-                "Accept-Encoding": "gzip",
-            }
-            _LOGGER.debug(
-                f"Set led url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set led failed: {error}")  # noqa: G004
+        url = self.url + "/app_mower/device/setLed"
+        data = {
+            "appId": self.userid,
+            "deviceSn": self.devicesn,
+            "ledFlag": ledFlag,
+            "ledColorCode": ledColorCode,
+            "ledEnd": ledEnd,
+            "ledModeCode": ledModeCode,
+            "ledStart": ledStart,
+            "ledNightFlag": ledNightFlag,
+        }
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json; charset=UTF-8",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+            "Accept-Encoding": "gzip",
+        }
+        self._post_command("Set led", url, headers, data)
 
     def set_border_freq(self, freq: int):
         """Border freq."""
@@ -1644,179 +1641,182 @@ class SunseekerDevice:
 
     def set_action(self, data):
         """Set property status."""
+        cmd = "action"
+        url = self.url + self.cmdurl + cmd
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+        }
+        self._post_command("Set action", url, headers, data)
+
+    def set_property(self, data):
+        """Set property status."""
+        if self.model == MODEL_V1:
+            cmd = "setProperty"
+        else:
+            cmd = "set_property"
+        url = self.url + self.cmdurl + cmd
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+        }
+        self._post_command("Set property", url, headers, data)
+
+    def _post_command(
+        self, label: str, url: str, headers: dict, data: dict, check_code=False
+    ) -> None:
+        """Post a command and record the result in error_text.
+
+        Inside async_command the post is only queued, and sent afterwards on
+        the async session.
+        """
+        pending = _pending_commands.get()
+        if pending is not None:
+            pending.append((label, url, headers, data, check_code))
+            return
+        _LOGGER.debug(f"{label} url: {url} header: {headers} data: {data}")  # noqa: G004
         try:
-            cmd = "action"
-            url = self.url + self.cmdurl + cmd
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-            }
-            _LOGGER.debug(
-                f"Set action url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
+            response = self.http.post(
                 url=url,
                 headers=headers,
                 json=data,
                 timeout=10,
             )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
+            self._handle_command_response(label, response.json(), check_code)
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set action: failed {error}")  # noqa: G004
-
-    def set_property(self, data):
-        """Set property status."""
+            if self._handle_command_error(label, error):
+                self.func_refesh_token()
+
+    async def _async_post_command(
+        self, label: str, url: str, headers: dict, data: dict, check_code=False
+    ) -> None:
+        """Post a command on the async session."""
+        _LOGGER.debug(f"{label} url: {url} header: {headers} data: {data}")  # noqa: G004
         try:
-            if self.model == MODEL_V1:
-                cmd = "setProperty"
-            else:
-                cmd = "set_property"
-            url = self.url + self.cmdurl + cmd
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-            }
-            _LOGGER.debug(
-                f"Set property url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
+            response = await self.http.async_post(
                 url=url,
                 headers=headers,
                 json=data,
                 timeout=10,
             )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
+            self._handle_command_response(label, response.json(), check_code)
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
+            if self._handle_command_error(label, error):
+                # The refresh uses the blocking session, keep it off the loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.func_refesh_token
+                )
+
+    def _handle_command_response(
+        self, label: str, response_data: dict, check_code: bool
+    ) -> None:
+        """Handle the cloud answer to a command."""
+        _LOGGER.debug(json.dumps(response_data))
+        if check_code:
+            failed = response_data.get("code") != 0
+        else:
+            failed = response_data.get("ok") is False
+        if failed:
+            self.error_text = response_data.get("msg")
+            _LOGGER.debug(f"{label} failed for {self.devicesn}: {self.error_text}")  # noqa: G004
             if self.dataupdated:
                 self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set property: failed {error}")  # noqa: G004
-            if hasattr(error, "response"):
-                if error.response.status == 401:
-                    _LOGGER.debug(json.dumps(error.response.json()))
-                    _LOGGER.debug("{element['path']} receive 401 error. Refresh Token")
-                    if self.func_refesh_token:
-                        self.func_refesh_token()
-                    return
+        else:
+            self.error_text = ""
+
+    def _handle_command_error(self, label: str, error: Exception) -> bool:
+        """Handle a command that could not be sent.
+
+        Return True if the token should be refreshed, the caller does it.
+        """
+        self.error_text = error
+        if self.dataupdated:
+            self.dataupdated(self.devicesn)
+        _LOGGER.error(f"{label}: failed {error}")  # noqa: G004
+        response = getattr(error, "response", None)
+        if response is not None and response.status_code == 401:
+            _LOGGER.debug(f"{label} received 401 error. Refresh Token")  # noqa: G004
+            return self.func_refesh_token is not None
+        return False
+
+    async def async_command(self, func, *args) -> None:
+        """Run a command method from the event loop.
+
+        func only builds the payload, the posts it makes are collected and
+        awaited on the async session so no executor thread is held.
+        """
+        pending: list = []
+        token = _pending_commands.set(pending)
+        try:
+            func(*args)
+        finally:
+            _pending_commands.reset(token)
+        for command in pending:
+            await self._async_post_command(*command)
 
     def set_custon_property(self, zone: SunseekerZone):
         """Set custom zones."""
-        try:
-            if not self.support_multi_angle:
-                data = {
-                    "appId": self.userid,
-                    "deviceSn": self.devicesn,
-                    "id": "setCustom",
-                    "key": "custom",
-                    "method": "set_property",
-                    "value": [
-                        {
-                            "blade_height": zone.blade_height,  # int in mm
-                            "blade_speed": zone.blade_speed,  # int in revolutions per minute? 2800 = slow, 3000 = fast, at least for the X7; other robots may have different values?
-                            "plan_angle": zone.plan_angle,  # int in degrees, seems to refer to the horizontal of the displayed map, which is not necessarily enforced.
-                            "plan_mode": zone.plan_mode,  # int, 0 = standard, 1 = traceless, 2 = custom; probably only for 2 is plan_angle important
-                            "region_id": zone.id,  # long int id, id of the respective region
-                            "work_gap": zone.gap,  # int: 1 = narrow, 2 = normal, 3 = wide
-                            "work_speed": zone.work_speed,  # int: 1 = slow, 2 = normal, 3 = fast
-                        }
-                    ],
-                }
-            else:
-                zone_value: dict = {
-                    "blade_height": zone.blade_height,
-                    "blade_speed": zone.blade_speed,
-                    "plan_mode": zone.plan_mode,
-                    "region_id": zone.id,
-                    "work_gap": zone.gap,
-                    "work_speed": zone.work_speed,
-                }
-                if zone.plan_mode == 4:
-                    zone_value["multi_zigzag_angles"] = [
-                        {"active": zone.zigzag_1.active, "angle": zone.zigzag_1.angle},
-                        {"active": zone.zigzag_2.active, "angle": zone.zigzag_2.angle},
-                        {"active": zone.zigzag_3.active, "angle": zone.zigzag_3.angle},
-                        {"active": zone.zigzag_4.active, "angle": zone.zigzag_4.angle},
-                    ]
-                data = {
-                    "appId": self.userid,
-                    "deviceSn": self.devicesn,
-                    "id": "setCustom",
-                    "key": "custom",
-                    "method": "set_property",
-                    "value": [zone_value],
-                }
-            url = self.url + self.cmdurl + "set_property"
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
+        if not self.support_multi_angle:
+            data = {
+                "appId": self.userid,
+                "deviceSn": self.devicesn,
+                "id": "setCustom",
+                "key": "custom",
+                "method": "set_property",
+                "value": [
+                    {
+                        "blade_height": zone.blade_height,  # int in mm
+                        "blade_speed": zone.blade_speed,  # int in revolutions per minute? 2800 = slow, 3000 = fast, at least for the X7; other robots may have different values?
+                        "plan_angle": zone.plan_angle,  # int in degrees, seems to refer to the horizontal of the displayed map, which is not necessarily enforced.
+                        "plan_mode": zone.plan_mode,  # int, 0 = standard, 1 = traceless, 2 = custom; probably only for 2 is plan_angle important
+                        "region_id": zone.id,  # long int id, id of the respective region
+                        "work_gap": zone.gap,  # int: 1 = narrow, 2 = normal, 3 = wide
+                        "work_speed": zone.work_speed,  # int: 1 = slow, 2 = normal, 3 = fast
+                    }
+                ],
             }
-            _LOGGER.debug(
-                f"Set property url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Set property: failed {error}")  # noqa: G004
-            if hasattr(error, "response"):
-                if error.response.status == 401:
-                    _LOGGER.debug(json.dumps(error.response.json()))
-                    _LOGGER.debug("{element['path']} receive 401 error. Refresh Token")
-                    if self.func_refesh_token:
-                        self.func_refesh_token()
-                    return
+        else:
+            zone_value: dict = {
+                "blade_height": zone.blade_height,
+                "blade_speed": zone.blade_speed,
+                "plan_mode": zone.plan_mode,
+                "region_id": zone.id,
+                "work_gap": zone.gap,
+                "work_speed": zone.work_speed,
+            }
+            if zone.plan_mode == 4:
+                zone_value["multi_zigzag_angles"] = [
+                    {"active": zone.zigzag_1.active, "angle": zone.zigzag_1.angle},
+                    {"active": zone.zigzag_2.active, "angle": zone.zigzag_2.angle},
+                    {"active": zone.zigzag_3.active, "angle": zone.zigzag_3.angle},
+                    {"active": zone.zigzag_4.active, "angle": zone.zigzag_4.angle},
+                ]
+            data = {
+                "appId": self.userid,
+                "deviceSn": self.devicesn,
+                "id": "setCustom",
+                "key": "custom",
+                "method": "set_property",
+                "value": [zone_value],
+            }
+        url = self.url + self.cmdurl + "set_property"
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+        }
+        self._post_command("Set property", url, headers, data)
 
     def set_map(self, mapdata):
         """Set map from service call."""
@@ -1850,17 +1850,15 @@ class SunseekerDevice:
 
     def rename_workarea(self, mapdata) -> bool:
         """Rename changed workareas by comparing incoming and current map data."""
-        current_map = self.map.image_data
-        if not current_map:
+        model = self.map.map_model
+        if model is None:
             return False
-        current_data = json.loads(current_map)
 
         current_workareas = {}
-        for region in current_data.get("region_work", []):
-            if "id" not in region:
+        for region in model.work:
+            if region.id is None:
                 continue
-            region_id = int(region["id"])
-            current_workareas[region_id] = str(region.get("name") or "").strip()
+            current_workareas[int(region.id)] = str(region.name or "").strip()
 
         new_workareas = {}
         for region in mapdata.get("region_work", []):
@@ -1889,10 +1887,11 @@ class SunseekerDevice:
 
     def set_passage_areas(self, mapdata):
         """Deletes the passage that has been deleted and add the one that is added."""
-        current_map = self.map.image_data
-        if not current_map:
+        model = self.map.map_model
+        if model is None:
             return
-        current_data = json.loads(current_map)
+        # Compare the raw points, the model has them as floats
+        current_data = model.data
 
         # Create mapping of id -> points for old passages
         old_passages = {}
@@ -1942,15 +1941,10 @@ class SunseekerDevice:
 
     def set_obstacle_areas(self, mapdata):
         """Deletes the obstacle that has been deleted."""
-        current_map = self.map.image_data
-        if not current_map:
+        model = self.map.map_model
+        if model is None:
             return
-        current_data = json.loads(current_map)
-        old_ids = {
-            int(region["id"])
-            for region in current_data.get("region_obstacle", [])
-            if "id" in region
-        }
+        old_ids = {int(region.id) for region in model.obstacle if region.id is not None}
         new_ids = {
             int(region["id"])
             for region in mapdata.get("region_obstacle", [])
@@ -2163,96 +2157,46 @@ class SunseekerDevice:
 
     def ota_upgrade_X_models(self):
         """Start OTA."""
-        try:
-            data = {
-                "appId": self.userid,
-                "deviceSn": self.devicesn,
-                "deviceType": 0,
-                "id": "upgradeOTA",
-                "method": "upgrade",
-                "mode": "1",
-            }
-            cmd = "otaUpgrade"
-            url = self.url + self.cmdurl + cmd
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-            }
-            _LOGGER.debug(
-                f"OTA upgrade X models url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"OTA upgrade failed: {error}")  # noqa: G004
+        data = {
+            "appId": self.userid,
+            "deviceSn": self.devicesn,
+            "deviceType": 0,
+            "id": "upgradeOTA",
+            "method": "upgrade",
+            "mode": "1",
+        }
+        cmd = "otaUpgrade"
+        url = self.url + self.cmdurl + cmd
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+        }
+        self._post_command("OTA upgrade X models", url, headers, data)
 
     def base_ota_upgrade_X_models(self):
         """Start OTA."""
-        try:
-            data = {
-                "appId": self.userid,
-                "deviceSn": self.base_sn,
-                "deviceType": 2,
-                "id": "baseStationOTA",
-                "method": "upgrade",
-            }
-            cmd = "otaUpgrade"
-            url = self.url + self.cmdurl + cmd
-            headers = {
-                "Accept-Language": self.language,
-                "Authorization": "bearer " + self.access_token,
-                "Content-Type": "application/json",
-                "Host": self.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.8.1",
-            }
-            _LOGGER.debug(
-                f"Base OTA upgrade X models url: {url} header: {headers} data: {data}"  # noqa: G004
-            )
-            response = requests.post(
-                url=url,
-                headers=headers,
-                json=data,
-                timeout=10,
-            )
-            response_data = response.json()
-            _LOGGER.debug(json.dumps(response_data))
-            if response_data.get("ok") is False:
-                self.error_text = response_data.get("msg")
-                if self.dataupdated:
-                    self.dataupdated(self.devicesn)
-                _LOGGER.debug(response_data.get("msg"))
-            else:
-                self.error_text = ""
-            return  # noqa: TRY300
-
-        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
-            self.error_text = error
-            if self.dataupdated:
-                self.dataupdated(self.devicesn)
-            _LOGGER.error(f"Base OTA upgrade failed: {error}")  # noqa: G004
+        data = {
+            "appId": self.userid,
+            "deviceSn": self.base_sn,
+            "deviceType": 2,
+            "id": "baseStationOTA",
+            "method": "upgrade",
+        }
+        cmd = "otaUpgrade"
+        url = self.url + self.cmdurl + cmd
+        headers = {
+            "Accept-Language": self.language,
+            "Authorization": "bearer " + self.access_token,
+            "Content-Type": "application/json",
+            "Host": self.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.8.1",
+        }
+        self._post_command("Base OTA upgrade X models", url, headers, data)
 
     def check_ota_version(self, sn: str, version: str, devicetype: int):
         """Check device version. Devicetype 0 is the mower. Devicetype 2 is the base."""
@@ -2312,7 +2256,7 @@ class SunseekerDevice:
             _LOGGER.debug(
                 f"OTA version check: {url} header: {headers} data: {data}"  # noqa: G004
             )
-            response = requests.post(
+            response = self.http.post(
                 url=url,
                 headers=headers,
                 json=data,
@@ -0,0 +1,134 @@
+"""SunseekerHttpPy."""
+
+import asyncio
+from functools import partial
+import json
+import logging
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from .const import HTTP_POOL_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SunseekerHttpResponse:
+    """Buffered response of an async request.
+
+    Mirrors the parts of requests.Response used by the integration, so the
+    sync and async code paths can share their response handling.
+    """
+
+    def __init__(self, status_code: int, content: bytes, url: str) -> None:
+        """Init."""
+        self.status_code = status_code
+        self.content = content
+        self.url = url
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the status code is below 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """Body decoded as text."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        """Body decoded as json."""
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raise if the request failed."""
+        if not self.ok:
+            raise SunseekerHttpError(self)
+
+
+class SunseekerHttpError(Exception):
+    """Async request returned an error status."""
+
+    def __init__(self, response: SunseekerHttpResponse) -> None:
+        """Init."""
+        super().__init__(f"{response.status_code} error for url: {response.url}")
+        self.response = response
+
+
+class SunseekerHttpClient:
+    """Pooled HTTP transport shared by all REST calls of one account.
+
+    The requests session is the sync shim used from worker threads (MQTT,
+    timers, startup). Once an aiohttp session is attached, the async_*
+    methods run on the event loop and no executor thread is held while
+    waiting for the cloud.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE) -> None:
+        """Init."""
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        # One pool per host, each keeping up to pool_size warm keep-alive
+        # connections so the startup burst and commands reuse TLS sessions.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.async_session: aiohttp.ClientSession | None = None
+
+    def attach_async_session(self, session: aiohttp.ClientSession) -> None:
+        """Use session (normally the shared HA client session) for async calls."""
+        self.async_session = session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request on the pooled session."""
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request on the pooled session."""
+        return self.session.post(url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        """Send a PUT request on the pooled session."""
+        return self.session.put(url, **kwargs)
+
+    async def async_request(
+        self, method: str, url: str, timeout: float = 10, **kwargs
+    ) -> SunseekerHttpResponse:
+        """Send a request without blocking the event loop."""
+        if self.async_session is None:
+            # No aiohttp session attached, fall back to the sync shim.
+            response = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(self.session.request, method, url, timeout=timeout, **kwargs),
+            )
+            return SunseekerHttpResponse(
+                response.status_code, response.content, response.url
+            )
+        async with self.async_session.request(
+            method,
+            url,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            **kwargs,
+        ) as response:
+            content = await response.read()
+            return SunseekerHttpResponse(response.status, content, str(response.url))
+
+    async def async_get(self, url: str, **kwargs) -> SunseekerHttpResponse:
+        """Send a GET request on the async session."""
+        return await self.async_request("GET", url, **kwargs)
+
+    async def async_post(self, url: str, **kwargs) -> SunseekerHttpResponse:
+        """Send a POST request on the async session."""
+        return await self.async_request("POST", url, **kwargs)
+
+    async def async_put(self, url: str, **kwargs) -> SunseekerHttpResponse:
+        """Send a PUT request on the async session."""
+        return await self.async_request("PUT", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections.
+
+        The async session is owned by Home Assistant and is left open.
+        """
+        self.session.close()
@@ -1,24 +1,40 @@
 """SunseekerMapPy."""
 
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from dataclasses import dataclass, field
 import importlib.resources
 from io import BytesIO
 import json
 import logging
 import math
-import re
 from typing import TYPE_CHECKING
 
+import numpy as np
 from PIL import Image, ImageDraw
-import requests
 
 from .const import (
+    DEFAULT_FRAME_FORMAT,
+    DEFAULT_FRAME_QUALITY,
+    DEFAULT_MAP_MAX_SIZE,
+    DEFAULT_PATH_TOLERANCE,
+    FRAME_CONTENT_TYPES,
+    FRAME_FORMAT_JPEG,
+    FRAME_FORMAT_WEBP,
+    FRAME_FORMAT_WEBP_LOSSLESS,
+    FRAME_SIZES,
     MAP_DRAW_MODE_ADVANCED_BORDER,
     MAP_DRAW_MODE_ALL,
     MAP_DRAW_MODE_SIMPLE,
     MAP_DRAW_MODE_SIMPLE_BORDER,
+    MAP_PIXELS_PER_METRE,
     MODEL_S,
     MODEL_X,
 )
+from .sunseeker_map_model import MapModel, parse_map_model
+from .sunseeker_path import PathSlice, PathStore
 
 if TYPE_CHECKING:
     from .sunseeker import SunseekerDevice
@@ -26,6 +42,668 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attributes of SunseekerMap holding the frames served by the entities
+FRAMES = ("image", "livemap", "heatmap", "wifimap", "netmap")
+
+# All map rendering runs on this thread, so a redraw never blocks the event loop
+_RENDER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="sunseeker_render"
+)
+
+# Resized and rotated robot and charger sprites, least recently used first.
+# Only used from the render thread.
+SPRITE_CACHE_SIZE = 64
+_SPRITE_CACHE: OrderedDict[tuple, tuple[Image.Image, Image.Image]] = OrderedDict()
+
+
+@dataclass(frozen=True)
+class MapView:
+    """Immutable copy of the map state a render job reads."""
+
+    draw_mode: str
+    work_color: tuple
+    grass_color: tuple
+    grass_fill_color: tuple
+    forbidden_fill_color: tuple
+    forbidden_color: tuple
+    obstacle_fill_color: tuple
+    obstacle_color: tuple
+    placed_blank_fill_color: tuple
+    placed_blank_color: tuple
+    map_min_x: float
+    map_max_x: float
+    map_min_y: float
+    map_max_y: float
+    canvas_width: float
+    canvas_height: float
+    charger_pos_x: float
+    charger_pos_y: float
+    charger_orientation: float
+    mower_pos_x: float
+    mower_pos_y: float
+    mower_orientation: float
+    charger_image: Image.Image | None
+    robot_image: Image.Image | None
+    max_canvas_size: int
+    path_tolerance: float  # pixels, 0 only drops points on the same pixel
+
+    @property
+    def has_bounds(self) -> bool:
+        """Return True if the map bounds are usable."""
+        return self.map_max_x != self.map_min_x and self.map_max_y != self.map_min_y
+
+    @property
+    def pixels_per_metre(self) -> float:
+        """Scale of the current canvas."""
+        if not self.has_bounds:
+            return MAP_PIXELS_PER_METRE
+        return self.canvas_width / (self.map_max_x - self.map_min_x)
+
+    def transform(self, point) -> tuple[int, int]:
+        """Map coordinates to image coordinates."""
+        x, y = point
+        x_norm = (x - self.map_min_x) / (self.map_max_x - self.map_min_x)
+        y_norm = (y - self.map_min_y) / (self.map_max_y - self.map_min_y)
+        # Flip Y-axis for image coordinates
+        return (
+            int(x_norm * self.canvas_width),
+            int((1 - y_norm) * self.canvas_height),
+        )
+
+    def pixel_arrays(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Map coordinate arrays to unrounded image coordinate arrays."""
+        x_norm = (xs - self.map_min_x) / (self.map_max_x - self.map_min_x)
+        y_norm = (ys - self.map_min_y) / (self.map_max_y - self.map_min_y)
+        return x_norm * self.canvas_width, (1 - y_norm) * self.canvas_height
+
+    def transform_array(self, xs: np.ndarray, ys: np.ndarray) -> list[tuple[int, int]]:
+        """Map coordinate arrays to image coordinates, like transform."""
+        fx, fy = self.pixel_arrays(xs, ys)
+        # astype truncates towards zero, like int()
+        return list(
+            zip(
+                fx.astype(np.int64).tolist(),
+                fy.astype(np.int64).tolist(),
+                strict=True,
+            )
+        )
+
+
+@dataclass(frozen=True)
+class MapRender:
+    """Result of rendering the map data."""
+
+    image: Image.Image
+    phi: float | None
+    min_x: float
+    max_x: float
+    min_y: float
+    max_y: float
+    canvas_width: float
+    canvas_height: float
+    work_regions: list[dict]
+    charger_regions: list[list[tuple[float, float]]]
+
+
+@dataclass
+class LiveFrame:
+    """Live map frame kept between renders, only used on the render thread.
+
+    Each render restores the boxes the previous one drew on from the base
+    image instead of copying the whole base again.
+    """
+
+    image: Image.Image | None = None
+    base: Image.Image | None = None  # image the frame was copied from
+    dirty: list[tuple[int, int, int, int]] = field(default_factory=list)
+
+    def restore(self, boxes: list[tuple[int, int, int, int]]) -> None:
+        """Copy boxes back from the base image."""
+        width, height = self.image.size
+        for left, top, right, bottom in boxes:
+            box = (max(left, 0), max(top, 0), min(right, width), min(bottom, height))
+            if box[2] > box[0] and box[3] > box[1]:
+                self.image.paste(self.base.crop(box), box[:2])
+
+
+@dataclass(frozen=True)
+class LivemapRender:
+    """Result of rendering a live map frame."""
+
+    livemap: Image.Image | None
+    live_points_drawn: bool
+    type10_pending: list
+
+
+def _path_arrays(data) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the x, y and type arrays of path data."""
+    if not isinstance(data, PathSlice):
+        data = PathSlice.from_points(data)
+    return data.xs, data.ys, data.types
+
+
+# Max points between two anchors when simplifying a path
+_DP_MAX_LINE = 64
+
+
+def _douglas_peucker(
+    xs: np.ndarray, ys: np.ndarray, anchors: np.ndarray, tolerance: float
+) -> np.ndarray:
+    """Return the mask of the points to keep for lines within tolerance.
+
+    All lines between two anchors are simplified together, one level of the
+    Douglas-Peucker recursion per pass. A pass only looks at the lines split
+    by the pass before. The last point must be an anchor.
+    """
+    anchors = anchors.copy()
+    active = np.ones(len(xs), dtype=bool)
+    while True:
+        points = np.flatnonzero(active)
+        sub_anchors = anchors[points]
+        index = np.flatnonzero(sub_anchors)
+        line = np.searchsorted(index, np.arange(len(points)), side="right") - 1
+        first = points[index[line]]
+        last = points[index[np.minimum(line + 1, len(index) - 1)]]
+        dx = xs[last] - xs[first]
+        dy = ys[last] - ys[first]
+        rx = xs[points] - xs[first]
+        ry = ys[points] - ys[first]
+        norm = np.hypot(dx, dy)
+        dist = np.where(
+            norm > 0,
+            np.abs(dx * ry - dy * rx) / np.where(norm > 0, norm, 1),
+            np.hypot(rx, ry),
+        )
+        dist[sub_anchors] = 0
+        line_max = np.maximum.reduceat(dist, index)
+        split = line_max > tolerance
+        if not split.any():
+            return anchors
+        # The first point at the max distance of each line becomes an anchor
+        candidates = np.flatnonzero((dist == line_max[line]) & split[line])
+        _, first_of_line = np.unique(line[candidates], return_index=True)
+        anchors[points[candidates[first_of_line]]] = True
+        # Only the split lines, with the anchors closing them, are left
+        active[:] = False
+        active[points[split[line]]] = True
+        active[last[split[line]]] = True
+
+
+def _simplify_path(
+    fx: np.ndarray,
+    fy: np.ndarray,
+    px: np.ndarray,
+    py: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    tolerance: float,
+) -> np.ndarray:
+    """Return the mask of the path points worth drawing.
+
+    Points on the same pixel (px, py) as the point before add nothing to the
+    lines. With a tolerance the runs are also simplified with Douglas-Peucker
+    on the unrounded image coordinates (fx, fy). The first and last point of
+    each run are always kept, the draw modes depend on where the runs start
+    and end.
+    """
+    keep = np.ones(len(px), dtype=bool)
+    keep[1:] = (px[1:] != px[:-1]) | (py[1:] != py[:-1])
+    ends_of_runs = np.zeros(len(px), dtype=bool)
+    ends_of_runs[starts] = True
+    ends_of_runs[ends - 1] = True
+    keep |= ends_of_runs
+    if tolerance > 0:
+        index = np.flatnonzero(keep)
+        anchors = ends_of_runs[index]
+        # Short lines keep the number of passes low on long runs
+        anchors[::_DP_MAX_LINE] = True
+        keep[index] = _douglas_peucker(fx[index], fy[index], anchors, tolerance)
+    return keep
+
+
+def _draw_path_runs(view: MapView, draw: ImageDraw.ImageDraw, data) -> None:
+    """Draw path data using run-length-aware type classification.
+
+    Type 10 has two meanings depending on run length:
+      - short run (<2 m): turn/transition between mowing rows → drawn as mowing
+      - long run (>=2 m): navigation from charger to work area  → skipped
+    Type 17 (and 13/19) are single-point GPS fixes at the same coordinates as
+    the next point; they act as transparent bridges so segments stay continuous.
+    """
+    draw_border = view.draw_mode in (
+        MAP_DRAW_MODE_SIMPLE_BORDER,
+        MAP_DRAW_MODE_ADVANCED_BORDER,
+    )
+    draw_transitions = view.draw_mode not in (
+        MAP_DRAW_MODE_SIMPLE,
+        MAP_DRAW_MODE_SIMPLE_BORDER,
+    )
+
+    type_colors: dict[int, tuple] = {
+        9: view.work_color,
+        137: view.work_color,  # new firmware mowing type
+    }
+    if draw_border:
+        type_colors[12] = (0, 200, 255)
+        type_colors[140] = (0, 200, 255)  # new firmware border type
+    # if draw_transitions:
+    #    type_colors[11] = (255, 165, 0)  # arc / approach turns
+    all_type_colors: dict[int, tuple] = {
+        # Old firmware types
+        9: view.work_color,
+        10: view.work_color,
+        11: (255, 165, 0),
+        12: (0, 200, 255),
+        13: (180, 180, 180),
+        14: (180, 180, 180),
+        16: (200, 100, 100),
+        17: (255, 220, 0),
+        18: (100, 200, 100),
+        19: (100, 100, 200),
+        # New firmware types
+        137: view.work_color,  # new mowing (like 9)
+        138: view.work_color,  # new transition (like 10)
+        139: (255, 220, 0),  # new bridge connector (like 17)
+        140: (0, 200, 255),  # new border/perimeter (like 12)
+        144: (200, 100, 100),  # new obstacle-related (like 16)
+        146: (100, 200, 100),  # new obstacle-related (like 18)
+    }
+    bridge_types = {17, 13, 19, 139}  # 139 = new firmware bridge type
+    short_transit_max = 2.0  # metres
+
+    # Pre-segment data into runs of equal type, all points at once
+    xs, ys, types = _path_arrays(data)
+    if not len(types):
+        return
+    boundaries = np.flatnonzero(types[1:] != types[:-1]) + 1
+    starts = np.insert(boundaries, 0, 0)
+    ends = np.append(boundaries, len(types))
+    # Length of each step, the step into the next run does not count
+    steps = np.zeros(len(types))
+    steps[:-1] = np.sqrt(np.diff(xs) ** 2 + np.diff(ys) ** 2)
+    steps[boundaries - 1] = 0
+    run_dists = np.add.reduceat(steps, starts).tolist()
+    run_types = types[starts].tolist()
+
+    # Only transform the points that still add detail at this scale,
+    # runs are measured on all points above
+    fx, fy = view.pixel_arrays(xs, ys)
+    px = fx.astype(np.int64)
+    py = fy.astype(np.int64)
+    kept = np.flatnonzero(
+        _simplify_path(fx, fy, px, py, starts, ends, view.path_tolerance)
+    )
+    pixels = list(zip(px[kept].tolist(), py[kept].tolist(), strict=True))
+    starts = np.searchsorted(kept, starts).tolist()
+    ends = np.searchsorted(kept, ends).tolist()
+
+    segment: list = []
+    seg_color: tuple | None = None
+
+    def flush() -> None:
+        nonlocal segment, seg_color
+        if len(segment) >= 2 and seg_color is not None:
+            draw.line(segment, fill=seg_color, width=1)
+        segment.clear()
+        seg_color = None
+
+    for ptype, start, end, total_dist in zip(
+        run_types, starts, ends, run_dists, strict=True
+    ):
+        if view.draw_mode == MAP_DRAW_MODE_ALL:
+            color = all_type_colors.get(ptype, view.work_color)
+            transformed = pixels[start:end]
+            if seg_color == color:
+                segment.extend(transformed)
+            else:
+                flush()
+                segment = transformed
+                seg_color = color
+            continue
+
+        if ptype in bridge_types:
+            if segment:
+                segment.extend(pixels[start:end])
+            continue
+
+        if ptype in (10, 138):  # 138 = new firmware transition type
+            color = (
+                view.work_color
+                if draw_transitions and total_dist < short_transit_max
+                else None
+            )
+        else:
+            color = type_colors.get(ptype)
+
+        if color is None:
+            flush()
+            continue
+
+        transformed = pixels[start:end]
+        if seg_color == color:
+            segment.extend(transformed)
+        else:
+            flush()
+            segment = transformed
+            seg_color = color
+
+    flush()
+
+
+def _render_path(
+    view: MapView, base: Image.Image | None, layers: list
+) -> Image.Image | None:
+    """Draw each layer of path data on a copy of the previous image."""
+    if base is None:
+        return None
+    image = None
+    for data in layers:
+        image = (base if image is None else image).copy()
+        if view.has_bounds:
+            _draw_path_runs(view, ImageDraw.Draw(image), data)
+    return image
+
+
+def _draw_live_points(
+    view: MapView, image: Image.Image | None, points: PathSlice, pending: PathSlice
+) -> tuple[bool, PathSlice]:
+    """Plot in the new lines.
+
+    Returns whether the points were drawn and the type-10 points kept back.
+    """
+    if len(points) < 2 or not image:
+        return False, pending
+
+    draw = ImageDraw.Draw(image)
+    data = points
+    if view.has_bounds:
+        # In transitions-aware modes, type-10 runs are only drawn when short
+        # (<2 m). Because a run can span multiple MQTT batches, we buffer any
+        # trailing type-10 points and prepend them to the next call so the
+        # full run distance is known before deciding to draw or skip.
+        draw_transitions = view.draw_mode not in (
+            MAP_DRAW_MODE_SIMPLE,
+            MAP_DRAW_MODE_SIMPLE_BORDER,
+            MAP_DRAW_MODE_ALL,
+        )
+        if draw_transitions:
+            # Prepend buffered type-10 points from the previous call.
+            # The last buffered point is excluded because livepathpoints
+            # already retains it as its first element (continuity point).
+            if pending:
+                data = pending + data
+
+            # Find the trailing type-10/138 run — it may not be complete yet.
+            others = np.flatnonzero(~np.isin(data.types, (10, 138)))
+            trailing_start = int(others[-1]) + 1 if len(others) else 0
+            # Save all but the last point (livepathpoints retains it).
+            pending = data[trailing_start:-1]
+            data = data[:trailing_start]
+        else:
+            pending = PathSlice.empty()  # clear on mode change
+
+        if len(data) >= 2:
+            _draw_path_runs(view, draw, data)
+    return True, pending
+
+
+def _sprite(sprite: Image.Image, size: tuple[int, int], angle: float) -> Image.Image:
+    """Return sprite resized and rotated, from the cache when possible.
+
+    The angle is rounded to whole degrees, so a mower turning on the spot
+    reuses the same few sprites.
+    """
+    degrees = round(math.degrees(angle)) % 360
+    key = (id(sprite), size, degrees)
+    cached = _SPRITE_CACHE.get(key)
+    if cached is not None and cached[0] is sprite:
+        _SPRITE_CACHE.move_to_end(key)
+        return cached[1]
+    result = sprite.convert("RGBA").resize(size).rotate(degrees)
+    # Keep the source so a new image reusing its id() does not match
+    _SPRITE_CACHE[key] = (sprite, result)
+    if len(_SPRITE_CACHE) > SPRITE_CACHE_SIZE:
+        _SPRITE_CACHE.popitem(last=False)
+    return result
+
+
+def _paste_sprite(
+    image: Image.Image, sprite: Image.Image, view: MapView, pos, angle: float
+) -> tuple[int, int, tuple[int, int, int, int]]:
+    """Paste sprite centered at map position pos.
+
+    Returns the image position and the box pasted on.
+    """
+    xx, yy = view.transform(pos)
+    w1, h1 = sprite.size
+    iw, ih = image.size
+    mul = (iw + ih) / 2 / 1000
+    rw = int(w1 * mul)
+    rh = int(h1 * mul)
+    sprite = _sprite(sprite, (rw, rh), angle)
+    w, h = sprite.size
+    left, top = int(xx - w / 2), int(yy - h / 2)
+    # Paste the image on top of the map, using itself as the mask for transparency
+    image.paste(sprite, (left, top), sprite)
+    return xx, yy, (left, top, left + w, top + h)
+
+
+def _points_box(view: MapView, points: PathSlice) -> tuple[int, int, int, int]:
+    """Return the image box covering the lines between points."""
+    xs, ys = zip(*view.transform_array(points.xs, points.ys), strict=True)
+    return (min(xs) - 1, min(ys) - 1, max(xs) + 2, max(ys) + 2)
+
+
+def _render_livemap(
+    view: MapView,
+    image_path: Image.Image | None,
+    image: Image.Image | None,
+    points: PathSlice,
+    pending: PathSlice,
+    frame: LiveFrame,
+) -> LivemapRender:
+    """Add the new live points to the path image and draw a live map frame.
+
+    The frame is updated in place, only the parts that changed since the
+    previous frame are drawn again.
+    """
+    drawn_points = pending + points
+    drawn, pending = _draw_live_points(view, image_path, points, pending)
+
+    base = image_path if image_path else image
+    if not base or not view.has_bounds:
+        return LivemapRender(None, drawn, pending)
+    if frame.image is None or frame.base is not base or frame.image.size != base.size:
+        frame.image = base.copy()
+        frame.base = base
+    else:
+        dirty = frame.dirty
+        if drawn and base is image_path:
+            # New lines on the path image
+            dirty = [*dirty, _points_box(view, drawn_points)]
+        frame.restore(dirty)
+    livemap = frame.image
+
+    # Draw charger
+    _, _, charger_box = _paste_sprite(
+        livemap,
+        view.charger_image,
+        view,
+        (view.charger_pos_x, view.charger_pos_y),
+        view.charger_orientation,
+    )
+    # Draw robot
+    xx, yy, robot_box = _paste_sprite(
+        livemap,
+        view.robot_image,
+        view,
+        (view.mower_pos_x, view.mower_pos_y),
+        view.mower_orientation,
+    )
+    radius = round(50 * view.pixels_per_metre / MAP_PIXELS_PER_METRE)
+    ImageDraw.Draw(livemap).circle((xx, yy), radius, fill=None, outline="red")
+    circle_box = (xx - radius - 1, yy - radius - 1, xx + radius + 2, yy + radius + 2)
+    frame.dirty = [charger_box, robot_box, circle_box]
+    return LivemapRender(livemap, drawn, pending)
+
+
+def _render_map(view: MapView, model: MapModel) -> MapRender:
+    """Draw the map regions."""
+    min_x = model.min_x
+    max_x = model.max_x
+    min_y = model.min_y
+    max_y = model.max_y
+
+    def transform(point):
+        x, y = point
+        x_norm = (x - min_x) / (max_x - min_x)
+        y_norm = (y - min_y) / (max_y - min_y)
+        # Flip Y-axis for image coordinates
+        return (int(x_norm * canvas_width), int((1 - y_norm) * canvas_height))
+
+    work_regions = [{"name": work.name, "points": work.points} for work in model.work]
+    charger_regions = [charger.points for charger in model.charger_channel]
+
+    width = max_x - min_x
+    height = max_y - min_y
+
+    # Fewer pixels per metre on large gardens, so the canvas stays bounded
+    scale = MAP_PIXELS_PER_METRE
+    if max(width, height) * scale > view.max_canvas_size:
+        scale = view.max_canvas_size / max(width, height)
+    canvas_width = width * scale
+    canvas_height = height * scale
+    # Create a new image
+    image = Image.new("RGBA", (int(canvas_width), int(canvas_height)), (0, 0, 0, 0))
+
+    draw = ImageDraw.Draw(image)
+
+    def draw_polygon_with_alpha(
+        transformed_points,
+        outline=None,
+        fill=None,
+        width=1,
+    ):
+        """Draw polygon and alpha-blend fill via overlay when needed.
+
+        The overlay only covers the bounding box of the polygon, so blending
+        costs the area of the region instead of the whole canvas.
+        """
+        if fill is not None and transformed_points:
+            left = max(min(p[0] for p in transformed_points), 0)
+            top = max(min(p[1] for p in transformed_points), 0)
+            right = min(max(p[0] for p in transformed_points) + 1, image.width)
+            bottom = min(max(p[1] for p in transformed_points) + 1, image.height)
+            if right > left and bottom > top:
+                overlay = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+                overlay_draw = ImageDraw.Draw(overlay)
+                overlay_draw.polygon(
+                    [(x - left, y - top) for x, y in transformed_points], fill=fill
+                )
+                image.alpha_composite(overlay, (left, top))
+
+        if outline is not None:
+            draw.polygon(transformed_points, outline=outline, fill=None, width=width)
+
+    for region in model.channel:
+        transformed_points = [transform(p) for p in region.points]
+        draw_polygon_with_alpha(
+            transformed_points,
+            outline="gray",
+            fill=(128, 128, 128, 90),
+        )
+
+    for work in model.work:
+        transformed_points = [transform(p) for p in work.points]
+        draw_polygon_with_alpha(
+            transformed_points, outline=view.grass_color, fill=view.grass_fill_color
+        )
+
+    for forb in model.forbidden:
+        transformed_points = [transform(p) for p in forb.points]
+        draw_polygon_with_alpha(
+            transformed_points,
+            outline=view.forbidden_color,
+            fill=view.forbidden_fill_color,
+        )
+
+    for rb in model.placed_blank:
+        transformed_points = [transform(p) for p in rb.points]
+        draw_polygon_with_alpha(
+            transformed_points,
+            outline=view.placed_blank_color,
+            fill=view.placed_blank_fill_color,
+        )
+
+    for rb in model.divide:
+        transformed_points = [transform(p) for p in rb.points]
+        draw_polygon_with_alpha(transformed_points, outline="black", fill=None, width=2)
+
+    for obstacle in model.obstacle:
+        transformed_points = [transform(p) for p in obstacle.points]
+        draw_polygon_with_alpha(
+            transformed_points,
+            outline=view.obstacle_color,
+            fill=view.obstacle_fill_color,
+        )
+
+    # for charger in model.charger_channel:
+    #    transformed_points = [transform(p) for p in charger.points]
+    #    draw.polygon(transformed_points, outline="yellow", fill="yellow")
+
+    return MapRender(
+        image,
+        model.phi,
+        min_x,
+        max_x,
+        min_y,
+        max_y,
+        canvas_width,
+        canvas_height,
+        work_regions,
+        charger_regions,
+    )
+
+
+def _frame_size(image: Image.Image, width: int | None, height: int | None) -> int:
+    """Return the frame size to serve for a requested width and height.
+
+    0 is the full frame, otherwise the smallest of FRAME_SIZES that still
+    covers the request.
+    """
+    wanted = max(width or 0, height or 0)
+    if not wanted:
+        return 0
+    for size in FRAME_SIZES:
+        if wanted <= size < max(image.size):
+            return size
+    return 0
+
+
+def _encode_frame(
+    image: Image.Image, frame_format: str, quality: int, size: int
+) -> bytes:
+    """Encode a map frame for the image and camera entities."""
+    if size:
+        image = image.copy()
+        image.thumbnail((size, size))
+    buffer = BytesIO()
+    if frame_format == FRAME_FORMAT_JPEG:
+        # No alpha in jpeg, put the transparent parts on white
+        rgba = image.convert("RGBA")
+        flat = Image.new("RGB", rgba.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.getchannel("A"))
+        flat.save(buffer, format="JPEG", quality=quality)
+    elif frame_format == FRAME_FORMAT_WEBP:
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+    elif frame_format == FRAME_FORMAT_WEBP_LOSSLESS:
+        image.save(buffer, format="WEBP", lossless=True, quality=quality, method=4)
+    else:
+        image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
 
 class SunseekerMap:
     """Class for a single Sunseeker robot."""
@@ -37,15 +715,21 @@ class SunseekerMap:
         self.mapid = 0
         self.mapurl = ""  # URL to mapdata
         self.image_data = None  # json with map data from URL
+        self.image_mapid = 0  # mapid the loaded image_data belongs to
+        self._map_model: MapModel | None = None
+        self._map_model_source = None  # image_data the model was parsed from
         self.mappathdata = None  # path points from Getmapinfo
         self.realPathFileUlr = ""  # url to path data, currently empty?
         self.realPathmapdata = None  # path data from URL
         self.skip_server_path = False
         self.path_id = 0
         self.path_total = 0
-        self.livepathpoints = []
-        self.cached_pathpoints = []
-        self._live_type10_pending: list = []  # type-10 points awaiting run-end classification
+        self.livepathpoints = PathStore()  # points not drawn on image_path yet
+        self.cached_pathpoints = PathStore()  # all points of the current path
+        self._live_type10_pending = (
+            PathSlice.empty()
+        )  # type-10 points awaiting run-end classification
+        self._live_frame = LiveFrame()
         self.backupmap_data = None
         self.pathurl = ""
         self.image = None
@@ -77,6 +761,14 @@ class SunseekerMap:
         self.wifimap_url = None
         self.netmap = None
         self.netmap_url = None
+        # Bumped each time one of the frames above is replaced, keyed by attribute
+        self.frame_generation: dict[str, int] = dict.fromkeys(FRAMES, 0)
+        # (frame, size) -> (generation, format, quality), encoded bytes
+        self._encoded_frames: dict[tuple[str, int], tuple[tuple, bytes]] = {}
+        self.frame_format: str = DEFAULT_FRAME_FORMAT
+        self.frame_quality: int = DEFAULT_FRAME_QUALITY
+        self.max_canvas_size: int = DEFAULT_MAP_MAX_SIZE
+        self.path_tolerance: float = DEFAULT_PATH_TOLERANCE
         self.work_color = (124, 252, 0)
         self.grass_color = (0, 0, 0)
         self.grass_fill_color = (34, 139, 34)
@@ -89,6 +781,80 @@ class SunseekerMap:
         self.work_regions: list[dict] = []
         self.charger_regions: list[list[tuple[float, float]]] = []
         self.draw_mode: str = MAP_DRAW_MODE_ADVANCED_BORDER
+        # Serializes the render jobs and the publishing of their results
+        self._render_lock: asyncio.Lock = asyncio.Lock()
+
+    def set_frame(self, frame: str, image: Image.Image | None) -> None:
+        """Replace one of the frames and invalidate its encoded bytes."""
+        setattr(self, frame, image)
+        self.frame_generation[frame] += 1
+
+    @property
+    def frame_content_type(self) -> str:
+        """Content type of the encoded frames."""
+        return FRAME_CONTENT_TYPES.get(self.frame_format, "image/png")
+
+    async def async_encoded_frame(
+        self, frame: str, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return the encoded frame, encoding it only once per generation.
+
+        With a width or height a reduced copy is served when one of
+        FRAME_SIZES covers it, each size is cached on its own.
+        """
+        image = getattr(self, frame)
+        if image is None:
+            return None
+        size = _frame_size(image, width, height)
+        key = (self.frame_generation[frame], self.frame_format, self.frame_quality)
+        cached = self._encoded_frames.get((frame, size))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data = await self._render(
+            _encode_frame, image, self.frame_format, self.frame_quality, size
+        )
+        if self.frame_generation[frame] == key[0]:
+            self._encoded_frames[frame, size] = (key, data)
+        return data
+
+    def clear_path(self) -> None:
+        """Forget the path points of the current mowing session."""
+        self.livepathpoints.clear()
+        self.cached_pathpoints.clear()
+        self._live_type10_pending = PathSlice.empty()
+
+    @property
+    def map_model(self) -> MapModel | None:
+        """Parsed map data, parsed again only when image_data changes.
+
+        Blocking, on the event loop use map_model_cached or async_get_map_model.
+        """
+        return self._parse_map_model(self.image_data, self.image_mapid)
+
+    @property
+    def map_model_cached(self) -> MapModel | None:
+        """Parsed map data if image_data was already parsed, never parses."""
+        if self.image_data and self._map_model_source is self.image_data:
+            return self._map_model
+        return None
+
+    async def async_get_map_model(self) -> MapModel | None:
+        """Parsed map data, parsed on the render thread."""
+        return await self._render(
+            self._parse_map_model, self.image_data, self.image_mapid
+        )
+
+    def _parse_map_model(self, image_data, mapid: int) -> MapModel | None:
+        """Return the parsed image_data, parsed again only when it changes."""
+        if not image_data:
+            return None
+        if self._map_model_source is not image_data:
+            model = parse_map_model(image_data, mapid)
+            # Model first, map_model_cached trusts it once the source matches
+            self._map_model = model
+            self._map_model_source = image_data
+            return model
+        return self._map_model
 
     def load_charger_image(self) -> Image.Image:
         """Load robot.png from the integration folder."""
@@ -97,17 +863,20 @@ class SunseekerMap:
         ) as img_path:
             return Image.open(img_path)
 
-    def load_robot_image(self) -> Image.Image:
-        """Load robot image, using robot_image_url if set, otherwise robot.png."""
+    def load_robot_image(self, fetch: bool = True) -> Image.Image:
+        """Load robot image, using robot_image_url if set, otherwise robot.png.
+
+        With fetch=False robot.png is returned without touching the network.
+        """
         with importlib.resources.path(
             "custom_components.sunseeker", "robot.png"
         ) as img_path:
             default_img = Image.open(img_path)
             default_size = default_img.size
 
-        if self.robot_image_url:
+        if fetch and self.robot_image_url:
             try:
-                response = requests.get(self.robot_image_url, timeout=10)
+                response = self.mower.http.get(self.robot_image_url, timeout=10)
                 response.raise_for_status()
                 url_img = Image.open(BytesIO(response.content))
                 return url_img.resize(default_size, Image.LANCZOS)
@@ -119,489 +888,147 @@ class SunseekerMap:
 
         return default_img
 
-    def _draw_path_runs(self, draw, data, transform) -> None:
-        """Draw path data using run-length-aware type classification.
-
-        Type 10 has two meanings depending on run length:
-          - short run (<2 m): turn/transition between mowing rows → drawn as mowing
-          - long run (>=2 m): navigation from charger to work area  → skipped
-        Type 17 (and 13/19) are single-point GPS fixes at the same coordinates as
-        the next point; they act as transparent bridges so segments stay continuous.
-        """
-        draw_border = self.draw_mode in (
-            MAP_DRAW_MODE_SIMPLE_BORDER,
-            MAP_DRAW_MODE_ADVANCED_BORDER,
-        )
-        draw_transitions = self.draw_mode not in (
-            MAP_DRAW_MODE_SIMPLE,
-            MAP_DRAW_MODE_SIMPLE_BORDER,
+    def _view(self) -> MapView:
+        """Snapshot of the map state for a render job."""
+        return MapView(
+            draw_mode=self.draw_mode,
+            work_color=self.work_color,
+            grass_color=self.grass_color,
+            grass_fill_color=self.grass_fill_color,
+            forbidden_fill_color=self.forbidden_fill_color,
+            forbidden_color=self.forbidden_color,
+            obstacle_fill_color=self.obstacle_fill_color,
+            obstacle_color=self.obstacle_color,
+            placed_blank_fill_color=self.placed_blank_fill_color,
+            placed_blank_color=self.placed_blank_color,
+            map_min_x=self.map_min_x,
+            map_max_x=self.map_max_x,
+            map_min_y=self.map_min_y,
+            map_max_y=self.map_max_y,
+            canvas_width=self.canvas_width,
+            canvas_height=self.canvas_height,
+            charger_pos_x=self.charger_pos_x,
+            charger_pos_y=self.charger_pos_y,
+            charger_orientation=self.charger_orientation,
+            mower_pos_x=self.mower_pos_x,
+            mower_pos_y=self.mower_pos_y,
+            mower_orientation=self.mower_orientation,
+            charger_image=self.charger_image,
+            robot_image=self.robot_image,
+            max_canvas_size=self.max_canvas_size,
+            path_tolerance=self.path_tolerance,
         )
 
-        type_colors: dict[int, tuple] = {
-            9: self.work_color,
-            137: self.work_color,  # new firmware mowing type
-        }
-        if draw_border:
-            type_colors[12] = (0, 200, 255)
-            type_colors[140] = (0, 200, 255)  # new firmware border type
-        # if draw_transitions:
-        #    type_colors[11] = (255, 165, 0)  # arc / approach turns
-        bridge_types = {17, 13, 19, 139}  # 139 = new firmware bridge type
-        short_transit_max = 2.0  # metres
-
-        # Pre-segment data into (ptype, xy_points, total_distance) runs.
-        runs: list[tuple[int, list[tuple[float, float]], float]] = []
-        i = 0
-        while i < len(data):
-            ptype = int(data[i][2]) if len(data[i]) > 2 else -1
-            j = i + 1
-            while (
-                j < len(data) and (int(data[j][2]) if len(data[j]) > 2 else -1) == ptype
-            ):
-                j += 1
-            pts = [(data[k][0], data[k][1]) for k in range(i, j)]
-            total_dist = sum(
-                math.sqrt(
-                    (pts[k + 1][0] - pts[k][0]) ** 2 + (pts[k + 1][1] - pts[k][1]) ** 2
-                )
-                for k in range(len(pts) - 1)
-            )
-            runs.append((ptype, pts, total_dist))
-            i = j
-
-        segment: list = []
-        seg_color: tuple | None = None
-
-        def flush() -> None:
-            nonlocal segment, seg_color
-            if len(segment) >= 2 and seg_color is not None:
-                draw.line(segment, fill=seg_color, width=1)
-            segment.clear()
-            seg_color = None
-
-        for ptype, pts, total_dist in runs:
-            if self.draw_mode == MAP_DRAW_MODE_ALL:
-                all_type_colors: dict[int, tuple] = {
-                    # Old firmware types
-                    9: self.work_color,
-                    10: self.work_color,
-                    11: (255, 165, 0),
-                    12: (0, 200, 255),
-                    13: (180, 180, 180),
-                    14: (180, 180, 180),
-                    16: (200, 100, 100),
-                    17: (255, 220, 0),
-                    18: (100, 200, 100),
-                    19: (100, 100, 200),
-                    # New firmware types
-                    137: self.work_color,  # new mowing (like 9)
-                    138: self.work_color,  # new transition (like 10)
-                    139: (255, 220, 0),  # new bridge connector (like 17)
-                    140: (0, 200, 255),  # new border/perimeter (like 12)
-                    144: (200, 100, 100),  # new obstacle-related (like 16)
-                    146: (100, 200, 100),  # new obstacle-related (like 18)
-                }
-                color = all_type_colors.get(ptype, self.work_color)
-                transformed = [transform(p) for p in pts]
-                if seg_color == color:
-                    segment.extend(transformed)
-                else:
-                    flush()
-                    segment = transformed[:]
-                    seg_color = color
-                continue
-
-            if ptype in bridge_types:
-                if segment:
-                    segment.extend(transform(p) for p in pts)
-                continue
-
-            if ptype in (10, 138):  # 138 = new firmware transition type
-                color = (
-                    self.work_color
-                    if draw_transitions and total_dist < short_transit_max
-                    else None
-                )
-            else:
-                color = type_colors.get(ptype)
-
-            if color is None:
-                flush()
-                continue
-
-            transformed = [transform(p) for p in pts]
-            if seg_color == color:
-                segment.extend(transformed)
-            else:
-                flush()
-                segment = transformed[:]
-                seg_color = color
-
-        flush()
-
-    async def generate_path(self, pdata=None) -> None:
-        """Generate livemap."""
-        change_image = False
-        data = pdata
-        if not pdata:
-            self.image_path = None
-            if self.skip_server_path:
-                await self.generate_path(self.cached_pathpoints)
-                # we need to use Image_path image
-                change_image = True
-            elif self.realPathmapdata:
-                await self.generate_path(self.realPathmapdata)
-                # we need to use Image_path image
-                change_image = True
-            if self.mappathdata:
-                data = self.mappathdata
-        if data is None:
-            return
-        if change_image and self.image_path:
-            image = self.image_path.copy()
-        else:
-            if self.image is None:
-                return
-            image = self.image.copy()
-        draw = ImageDraw.Draw(image)
-
-        def transform(point):
-            x, y = point
-            x_norm = (x - self.map_min_x) / (self.map_max_x - self.map_min_x)
-            y_norm = (y - self.map_min_y) / (self.map_max_y - self.map_min_y)
-            # Flip Y-axis for image coordinates
-            return (
-                int(x_norm * self.canvas_width),
-                int((1 - y_norm) * self.canvas_height),
-            )
-
-        if self.map_max_x != self.map_min_x and self.map_max_y != self.map_min_y:
-            self._draw_path_runs(draw, data, transform)
-
-        self.image_path = image
-
-    async def add_live_points(self, image: Image) -> None:
-        """Plot in the new lines."""
-        size = len(self.livepathpoints)
-        if size < 2:
-            return
-        if not image:
-            return
-
-        draw = ImageDraw.Draw(image)
-
-        #  _LOGGER.debug(f"Pathpoints: {self.livepathpoints}")
-        data = self.livepathpoints
-
-        def transform(point):
-            x, y = point
-            x_norm = (x - self.map_min_x) / (self.map_max_x - self.map_min_x)
-            y_norm = (y - self.map_min_y) / (self.map_max_y - self.map_min_y)
-            # Flip Y-axis for image coordinates
-            return (
-                int(x_norm * self.canvas_width),
-                int((1 - y_norm) * self.canvas_height),
-            )
-
-        if self.map_max_x != self.map_min_x and self.map_max_y != self.map_min_y:
-            # In transitions-aware modes, type-10 runs are only drawn when short
-            # (<2 m). Because a run can span multiple MQTT batches, we buffer any
-            # trailing type-10 points and prepend them to the next call so the
-            # full run distance is known before deciding to draw or skip.
-            draw_transitions = self.draw_mode not in (
-                MAP_DRAW_MODE_SIMPLE,
-                MAP_DRAW_MODE_SIMPLE_BORDER,
-                MAP_DRAW_MODE_ALL,
-            )
-            if draw_transitions:
-                # Prepend buffered type-10 points from the previous call.
-                # The last buffered point is excluded because livepathpoints
-                # already retains it as its first element (continuity point).
-                if self._live_type10_pending:
-                    data = self._live_type10_pending + list(data)
-                    self._live_type10_pending = []
-
-                # Find the trailing type-10/138 run — it may not be complete yet.
-                trailing_start = len(data)
-                for idx in range(len(data) - 1, -1, -1):
-                    if len(data[idx]) > 2 and int(data[idx][2]) in (10, 138):
-                        trailing_start = idx
-                    else:
-                        break
-                if trailing_start < len(data):
-                    # Save all but the last point (livepathpoints retains it).
-                    self._live_type10_pending = list(data[trailing_start:-1])
-                    data = data[:trailing_start]
-            else:
-                self._live_type10_pending = []  # clear on mode change
-
-            if len(data) >= 2:
-                self._draw_path_runs(draw, data, transform)
+    async def _render(self, func, *args):
+        """Run a render job on the render thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _RENDER_EXECUTOR, func, *args
+        )
 
-        self.livepathpoints = [self.livepathpoints[-1]]
+    async def generate_path(self) -> None:
+        """Generate path image."""
+        async with self._render_lock:
+            await self._generate_path()
+
+    async def _generate_path(self) -> None:
+        layers = []
+        if self.skip_server_path:
+            if self.cached_pathpoints:
+                layers.append(self.cached_pathpoints.snapshot()[1])
+        elif self.realPathmapdata:
+            layers.append(self.realPathmapdata)
+        if self.mappathdata:
+            layers.append(self.mappathdata)
+        self.image_path = await self._render(
+            _render_path, self._view(), self.image, layers
+        )
 
     async def generate_livemap(self) -> None:
         """Generate livemap."""
-        await self.add_live_points(self.image_path)
-
-        if self.image_path:
-            image = self.image_path.copy()
-        elif self.image:
-            image = self.image.copy()
-        else:
-            return
-        draw = ImageDraw.Draw(image)
-
-        if self.map_max_x == self.map_min_x or self.map_max_y == self.map_min_y:
-            return
-        x_norm = (self.charger_pos_x - self.map_min_x) / (
-            self.map_max_x - self.map_min_x
-        )
-        y_norm = (self.charger_pos_y - self.map_min_y) / (
-            self.map_max_y - self.map_min_y
-        )
-        # Flip Y-axis for image coordinates
-        xx, yy = (
-            int(x_norm * self.canvas_width),
-            int((1 - y_norm) * self.canvas_height),
-        )
-
-        # Draw charger
-        charger_img = self.charger_image.convert("RGBA")
-        w1, h1 = charger_img.size
-        iw, ih = image.size
-        mul = (iw + ih) / 2 / 1000
-        rw = int(w1 * mul)
-        rh = int(h1 * mul)
-        charger_img = charger_img.resize((rw, rh))
-
-        angle = math.degrees(self.charger_orientation)
-        charger_img = charger_img.rotate(angle)
-        w, h = charger_img.size
-        # Center the robot image at (xx, yy)
-        xx_centered = int(xx - w / 2)
-        yy_centered = int(yy - h / 2)
-
-        # Paste the charger image on top of the map, using itself as the mask for transparency
-        image.paste(charger_img, (xx_centered, yy_centered), charger_img)
-
-        x_norm = (self.mower_pos_x - self.map_min_x) / (self.map_max_x - self.map_min_x)
-        y_norm = (self.mower_pos_y - self.map_min_y) / (self.map_max_y - self.map_min_y)
-        # Flip Y-axis for image coordinates
-        xx, yy = (
-            int(x_norm * self.canvas_width),
-            int((1 - y_norm) * self.canvas_height),
+        async with self._render_lock:
+            await self._generate_livemap()
+
+    async def _generate_livemap(self) -> None:
+        # The MQTT workers keep appending to livepathpoints while we render
+        epoch, points = self.livepathpoints.snapshot()
+        result: LivemapRender = await self._render(
+            _render_livemap,
+            self._view(),
+            self.image_path,
+            self.image,
+            points,
+            self._live_type10_pending,
+            self._live_frame,
         )
-
-        # Draw robot
-        robot_img = self.robot_image.convert("RGBA")
-        w1, h1 = robot_img.size
-        iw, ih = image.size
-        mul = (iw + ih) / 2 / 1000
-        rw = int(w1 * mul)
-        rh = int(h1 * mul)
-        robot_img = robot_img.resize((rw, rh))
-
-        angle = math.degrees(self.mower_orientation)
-        robot_img = robot_img.rotate(angle)
-        w, h = robot_img.size
-        # Center the robot image at (xx, yy)
-        xx_centered = int(xx - w / 2)
-        yy_centered = int(yy - h / 2)
-
-        # Paste the robot image on top of the map, using itself as the mask for transparency
-        image.paste(robot_img, (xx_centered, yy_centered), robot_img)
-
-        # draw.bitmap((xx, yy), self.robot_image, fill=None)
-        draw.circle((xx, yy), 50, fill=None, outline="red")
-        self.livemap = image
-        self.live_image_state = "Loaded"
+        if points and epoch == self.livepathpoints.epoch:
+            # Not restarted by a new path meanwhile
+            self._live_type10_pending = result.type10_pending
+            if result.live_points_drawn:
+                # Keep the last drawn point for continuity
+                self.livepathpoints.drop_front(len(points) - 1, epoch)
+        if result.livemap is not None:
+            self.set_frame("livemap", result.livemap)
+            self.live_image_state = "Loaded"
 
     async def generate_map(self):
         """Generate map."""
+        async with self._render_lock:
+            await self._generate_map()
 
-        json_data = self.image_data
-        data = json.loads(json_data)
-        if data.get("map_coordniate"):
-            if data.get("map_coordniate").get("phi"):
-                self.map_phi = data.get("map_coordniate").get("phi")
-
-        min_x = 0
-        max_x = 0
-        min_y = 0
-        max_y = 0
-
-        def parse_points(points_str):
-            """Convert points string to list of tuples."""
-            points_str = points_str.strip()
-            points_str = re.sub(r",\s*([\]\}])", r"\1", points_str)
-            points_list = json.loads(points_str)
-            return [(float(p[0]), float(p[1])) for p in points_list]
-
-        def transform(point):
-            x, y = point
-            x_norm = (x - min_x) / (max_x - min_x)
-            y_norm = (y - min_y) / (max_y - min_y)
-            # Flip Y-axis for image coordinates
-            return (int(x_norm * canvas_width), int((1 - y_norm) * canvas_height))
-
-        def get_min_max(pts_):
-            if not pts_:
-                return
-            nonlocal min_x, max_x, min_y, max_y
-            gmin_x = min(p[0] for p in pts_)
-            gmax_x = max(p[0] for p in pts_)
-            gmin_y = min(p[1] for p in pts_)
-            gmax_y = max(p[1] for p in pts_)
-            min_x = min(gmin_x, min_x)
-            max_x = max(gmax_x, max_x)
-            min_y = min(gmin_y, min_y)
-            max_y = max(gmax_y, max_y)
-
-        for work in data.get("divide_area_work", []):
-            pts = parse_points(work["points"])
-            get_min_max(pts)
-
-        self.work_regions = []
-        for work in data.get("region_work", []):
-            pts = parse_points(work["points"])
-            get_min_max(pts)
-            self.work_regions.append({"name": work["name"], "points": pts})
-
-        self.charger_regions = []
-        for region in data.get("region_channel", []):
-            pts = parse_points(region["points"])
-            get_min_max(pts)
-
-        for obstacle in data.get("region_obstacle", []):
-            pts = parse_points(obstacle["points"])
-            get_min_max(pts)
-
-        for forb in data.get("region_forbidden", []):
-            pts = parse_points(forb["points"])
-            get_min_max(pts)
-
-        for rb in data.get("region_placed_blank", []):
-            pts = parse_points(rb["points"])
-            get_min_max(pts)
-
-        for charger in data.get("region_charger_channel", []):
-            pts = parse_points(charger["points"])
-            get_min_max(pts)
-            self.charger_regions.append(pts)
-
-        self.map_max_x = max_x
-        self.map_min_x = min_x
-        self.map_max_y = max_y
-        self.map_min_y = min_y
-
-        width = max_x - min_x
-        height = max_y - min_y
-
-        canvas_width = width * 25  # 1920
-        canvas_height = height * 25  # 1080
-        self.canvas_width = canvas_width
-        self.canvas_height = canvas_height
-        # Create a new image
-        image = Image.new("RGBA", (int(canvas_width), int(canvas_height)), (0, 0, 0, 0))
-
-        draw = ImageDraw.Draw(image)
-
-        def draw_polygon_with_alpha(
-            transformed_points,
-            outline=None,
-            fill=None,
-            width=1,
-        ):
-            """Draw polygon and alpha-blend fill via overlay when needed."""
-            if fill is not None:
-                overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-                overlay_draw.polygon(transformed_points, fill=fill)
-                image.alpha_composite(overlay)
-
-            if outline is not None:
-                draw.polygon(
-                    transformed_points, outline=outline, fill=None, width=width
-                )
-
-        for region in data.get("region_channel", []):
-            pts = parse_points(region["points"])
-            transformed_points = [transform(p) for p in pts]
-            draw_polygon_with_alpha(
-                transformed_points,
-                outline="gray",
-                fill=(128, 128, 128, 90),
-            )
-
-        for work in data.get("region_work", []):
-            pts = parse_points(work["points"])
-            transformed_points = [transform(p) for p in pts]
-            draw_polygon_with_alpha(
-                transformed_points, outline=self.grass_color, fill=self.grass_fill_color
-            )
-
-        for forb in data.get("region_forbidden", []):
-            pts = parse_points(forb["points"])
-            transformed_points = [transform(p) for p in pts]
-            draw_polygon_with_alpha(
-                transformed_points,
-                outline=self.forbidden_color,
-                fill=self.forbidden_fill_color,
-            )
-
-        for rb in data.get("region_placed_blank", []):
-            pts = parse_points(rb["points"])
-            transformed_points = [transform(p) for p in pts]
-            draw_polygon_with_alpha(
-                transformed_points,
-                outline=self.placed_blank_color,
-                fill=self.placed_blank_fill_color,
-            )
-
-        for rb in data.get("divide_area_work", []):
-            pts = parse_points(rb["points"])
-            transformed_points = [transform(p) for p in pts]
-            draw_polygon_with_alpha(
-                transformed_points, outline="black", fill=None, width=2
-            )
-
-        for obstacle in data.get("region_obstacle", []):
-            pts = parse_points(obstacle["points"])
-            transformed_points = [transform(p) for p in pts]
-            draw_polygon_with_alpha(
-                transformed_points,
-                outline=self.obstacle_color,
-                fill=self.obstacle_fill_color,
-            )
-
-        # for charger in data.get("region_charger_channel", []):
-        #    pts = parse_points(charger["points"])
-        #    transformed_points = [transform(p) for p in pts]
-        #    draw.polygon(transformed_points, outline="yellow", fill="yellow")
-
-        self.image = image
+    async def _generate_map(self) -> None:
+        # Parsing the map data is blocking too, it is done on the render thread
+        result: MapRender = await self._render(
+            self._render_map_job, self._view(), self.image_data, self.image_mapid
+        )
+        # Publish everything at once, without awaiting in between
+        if result.phi:
+            self.map_phi = result.phi
+        self.work_regions = result.work_regions
+        self.charger_regions = result.charger_regions
+        self.map_max_x = result.max_x
+        self.map_min_x = result.min_x
+        self.map_max_y = result.max_y
+        self.map_min_y = result.min_y
+        self.canvas_width = result.canvas_width
+        self.canvas_height = result.canvas_height
+        self.set_frame("image", result.image)
         self.image_state = "Loaded"
         self.map_updated = True
 
+    def _render_map_job(self, view: MapView, image_data, mapid: int) -> MapRender:
+        """Parse the map data if it changed and draw the map regions."""
+        return _render_map(view, self._parse_map_model(image_data, mapid))
+
     async def reload_maps(self):
         """Reloads maps."""
-        if self.image_data is not None:
-            _LOGGER.debug("reload_maps -> generate_map")
-            await self.generate_map()  # Opret nyt image med kort
-            if self.mower.model in (MODEL_S, MODEL_X):
-                _LOGGER.debug("reload_maps -> generate_path")
-                await self.generate_path()  # opret image med path på nyt kort
-                _LOGGER.debug("reload_maps -> generate_livemap")
-                await self.generate_livemap()  # Opret live image med robot
-            self.image_state = "Loaded"
+        async with self._render_lock:
+            if self.image_data is not None:
+                _LOGGER.debug("reload_maps -> generate_map")
+                await self._generate_map()  # Opret nyt image med kort
+                if self.mower.model in (MODEL_S, MODEL_X):
+                    _LOGGER.debug("reload_maps -> generate_path")
+                    await self._generate_path()  # opret image med path på nyt kort
+                    _LOGGER.debug("reload_maps -> generate_livemap")
+                    await self._generate_livemap()  # Opret live image med robot
+                self.image_state = "Loaded"
 
     def get_heat_map(self):
         """Get heat map."""
         if self.heatmap_url:
             try:
-                response = requests.get(url=self.heatmap_url, timeout=10)
-                self.heatmap = Image.open(BytesIO(response.content))
+                response = self.mower.http.get(url=self.heatmap_url, timeout=10)
+                self.set_frame("heatmap", Image.open(BytesIO(response.content)))
+            except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+                _LOGGER.debug(f"Get heatmap failed {error}")  # noqa: G004
+
+    async def async_get_heat_map(self):
+        """Get heat map on the async session."""
+        if self.heatmap_url:
+            try:
+                response = await self.mower.http.async_get(
+                    url=self.heatmap_url, timeout=10
+                )
+                self.set_frame("heatmap", Image.open(BytesIO(response.content)))
             except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
                 _LOGGER.debug(f"Get heatmap failed {error}")  # noqa: G004
 
@@ -609,8 +1036,19 @@ class SunseekerMap:
         """Get wifi map."""
         if self.wifimap_url:
             try:
-                response = requests.get(url=self.wifimap_url, timeout=10)
-                self.wifimap = Image.open(BytesIO(response.content))
+                response = self.mower.http.get(url=self.wifimap_url, timeout=10)
+                self.set_frame("wifimap", Image.open(BytesIO(response.content)))
+            except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+                _LOGGER.debug(f"Get wifimap failed {error}")  # noqa: G004
+
+    async def async_get_wifi_map(self):
+        """Get wifi map on the async session."""
+        if self.wifimap_url:
+            try:
+                response = await self.mower.http.async_get(
+                    url=self.wifimap_url, timeout=10
+                )
+                self.set_frame("wifimap", Image.open(BytesIO(response.content)))
             except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
                 _LOGGER.debug(f"Get wifimap failed {error}")  # noqa: G004
 
@@ -618,92 +1056,176 @@ class SunseekerMap:
         """Get netmap map."""
         if self.netmap_url:
             try:
-                response = requests.get(url=self.netmap_url, timeout=10)
-                self.netmap = Image.open(BytesIO(response.content))
+                response = self.mower.http.get(url=self.netmap_url, timeout=10)
+                self.set_frame("netmap", Image.open(BytesIO(response.content)))
             except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
                 _LOGGER.debug(f"Get netmap failed {error}")  # noqa: G004
 
-    def get_path_data(self, url):
-        """Fetch path data."""
+    async def async_get_net_map(self):
+        """Get netmap map on the async session."""
+        if self.netmap_url:
+            try:
+                response = await self.mower.http.async_get(
+                    url=self.netmap_url, timeout=10
+                )
+                self.set_frame("netmap", Image.open(BytesIO(response.content)))
+            except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+                _LOGGER.debug(f"Get netmap failed {error}")  # noqa: G004
+
+    def _path_url_changed(self, url) -> bool:
+        """Return True if path data must be fetched from url."""
         _LOGGER.debug(
             f"Old map_path_url: {self.realPathFileUlr} new map_path_url: {url}"  # noqa: G004
         )
         if not url:
             _LOGGER.debug("Skipping fetcing new map path data, url is empty")
-            return
+            return False
         if self.realPathFileUlr != url:
             self.realPathFileUlr = url
             _LOGGER.debug("Fetcing new map path data")
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                self.realPathmapdata = response.json()
-                # _LOGGER.debug(
-                #    f"Map path data from realPathFileUlr: {json.dumps(self.realPathmapdata)}"
-                # )
-                _LOGGER.debug(f"Map path data loaded for {self.mower.devicesn}")  # noqa: G004
-        else:
-            _LOGGER.debug("Skipping fetcing new map path data, same url")
+            return True
+        _LOGGER.debug("Skipping fetcing new map path data, same url")
+        return False
+
+    def _apply_path_data(self, response) -> None:
+        """Store fetched path data."""
+        if response.status_code == 200:
+            self.realPathmapdata = PathSlice.from_points(response.json())
+            # _LOGGER.debug(
+            #    f"Map path data from realPathFileUlr: {json.dumps(self.realPathmapdata)}"
+            # )
+            _LOGGER.debug(f"Map path data loaded for {self.mower.devicesn}")  # noqa: G004
 
-    def get_map_data(self, url):
-        """Fetch map data."""
+    def get_path_data(self, url):
+        """Fetch path data."""
+        if self._path_url_changed(url):
+            response = self.mower.http.get(url, timeout=10)
+            self._apply_path_data(response)
+
+    async def async_get_path_data(self, url):
+        """Fetch path data on the async session."""
+        if self._path_url_changed(url):
+            response = await self.mower.http.async_get(url, timeout=10)
+            self._apply_path_data(response)
+
+    def _map_url_changed(self, url) -> bool:
+        """Return True if map data must be fetched from url."""
         _LOGGER.debug(f"Old mapurl: {self.mapurl} new mapurl: {url}")  # noqa: G004
+        if self.mapid and self.image_data and self.image_mapid == self.mapid:
+            # The download url is signed and changes on every map info call,
+            # the map itself only changes with mapModifyTime.
+            self.mapurl = url
+            _LOGGER.debug("Skipping fetcing new map data, same mapid")
+            return False
         if self.mapurl != url:
             self.mapurl = url
             _LOGGER.debug("Fetcing new map data")
             _LOGGER.debug(url)
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                response_data = response.json()
-                mapid = response_data.get("update_time", 0)
-                _LOGGER.debug(f"mapid expected : {self.mapid}")  # noqa: G004
-                _LOGGER.debug(f"mapid from data: {mapid}")  # noqa: G004
-                _LOGGER.debug(
-                    f"Map data from mapUrl: {json.dumps(response_data)}"  # noqa: G004
-                )
-                self.image_data = response.content
-                self.image_state = "Loaded"
-                _LOGGER.debug(f"Map data loaded for {self.mower.devicesn}")  # noqa: G004
-        else:
-            _LOGGER.debug("Skipping fetcing new map data, same url")
+            return True
+        _LOGGER.debug("Skipping fetcing new map data, same url")
+        return False
+
+    def _apply_map_data(self, response) -> None:
+        """Store fetched map data."""
+        if response.status_code == 200:
+            response_data = response.json()
+            mapid = response_data.get("update_time", 0)
+            _LOGGER.debug(f"mapid expected : {self.mapid}")  # noqa: G004
+            _LOGGER.debug(f"mapid from data: {mapid}")  # noqa: G004
+            _LOGGER.debug(
+                f"Map data from mapUrl: {json.dumps(response_data)}"  # noqa: G004
+            )
+            self.image_data = response.content
+            self.image_mapid = self.mapid
+            self.image_state = "Loaded"
+            _LOGGER.debug(f"Map data loaded for {self.mower.devicesn}")  # noqa: G004
+
+    def get_map_data(self, url):
+        """Fetch map data."""
+        if self._map_url_changed(url):
+            response = self.mower.http.get(url, timeout=10)
+            self._apply_map_data(response)
+
+    async def async_get_map_data(self, url):
+        """Fetch map data on the async session."""
+        if self._map_url_changed(url):
+            response = await self.mower.http.async_get(url, timeout=10)
+            self._apply_map_data(response)
+
+    def _cloud_headers(self) -> dict:
+        """Headers for the map endpoints."""
+        return {
+            "Accept-Language": self.mower.language,
+            "Authorization": "bearer " + self.mower.access_token,
+            "Host": self.mower.host,
+            "Connection": "Keep-Alive",
+            "User-Agent": "okhttp/4.4.1",
+        }
+
+    def _map_info_url(self) -> str:
+        """Url of the map info endpoint."""
+        endpoint = f"/wireless_map/wireless_device/get?deviceSn={self.mower.devicesn}"
+        return self.mower.url + endpoint
+
+    def _apply_map_info(self, response) -> tuple[str | None, str | None] | None:
+        """Store map info. Returns the map and path urls to load."""
+        response_data = response.json()
+        _LOGGER.debug(f"Mapinfo data: {json.dumps(response_data)}")  # noqa: G004
+        if response.status_code != 200:
+            return None
+        mapid = response_data["data"].get("mapModifyTime", 0)
+        _LOGGER.debug(f"Old mapid: {self.mapid} new mapid: {mapid}")  # noqa: G004
+        self.mapid = mapid
+        self.mappathdata = response_data["data"].get("realPathData", None)
+        return (
+            response_data["data"].get("mapPathFileUrl", None),
+            response_data["data"].get("realPathFileUlr", None),
+        )
 
     def get_map_info(self):
         """Get map info data."""
-        endpoint = f"/wireless_map/wireless_device/get?deviceSn={self.mower.devicesn}"
         try:
-            url_ = self.mower.url + endpoint
-            headers_ = {
-                "Accept-Language": self.mower.language,
-                "Authorization": "bearer " + self.mower.access_token,
-                "Host": self.mower.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.4.1",
-            }
+            url_ = self._map_info_url()
+            headers_ = self._cloud_headers()
             _LOGGER.debug(f"Get mapinfo header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            response = self.mower.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
             )
-            response_data = response.json()
-            _LOGGER.debug(f"Mapinfo data: {json.dumps(response_data)}")  # noqa: G004
-            if response.status_code == 200:
-                mapid = response_data["data"].get("mapModifyTime", 0)
-                _LOGGER.debug(f"Old mapid: {self.mapid} new mapid: {mapid}")  # noqa: G004
-                self.mapid = mapid
+            urls = self._apply_map_info(response)
+            if urls:
+                mapurl, real_path_file_url = urls
                 # Get map data
-                mapurl = response_data["data"].get("mapPathFileUrl", None)
                 self.get_map_data(mapurl)
-
-                self.mappathdata = response_data["data"].get("realPathData", None)
-
                 # Get map path data
-                real_path_file_url = response_data["data"].get("realPathFileUlr", None)
                 self.get_path_data(real_path_file_url)
 
             return  # noqa: TRY300
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug(f"Get map for {self.mower.devicesn}: failed {error}")  # noqa: G004
 
+    async def async_get_map_info(self):
+        """Get map info data on the async session."""
+        try:
+            url_ = self._map_info_url()
+            headers_ = self._cloud_headers()
+            _LOGGER.debug(f"Get mapinfo header: {headers_} url: {url_}")  # noqa: G004
+            response = await self.mower.http.async_get(
+                url=url_,
+                headers=headers_,
+                timeout=10,
+            )
+            urls = self._apply_map_info(response)
+            if urls:
+                mapurl, real_path_file_url = urls
+                await self.async_get_map_data(mapurl)
+                await self.async_get_path_data(real_path_file_url)
+
+            return  # noqa: TRY300
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            _LOGGER.debug(f"Get map for {self.mower.devicesn}: failed {error}")  # noqa: G004
+
     def get_heat_map_data(self):
         """Get mapdata."""
         endpoint = (
@@ -711,15 +1233,9 @@ class SunseekerMap:
         )
         try:
             url_ = self.mower.url + endpoint
-            headers_ = {
-                "Accept-Language": self.mower.language,
-                "Authorization": "bearer " + self.mower.access_token,
-                "Host": self.mower.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.4.1",
-            }
+            headers_ = self._cloud_headers()
             _LOGGER.debug(f"Get heatmap header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            response = self.mower.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
@@ -745,33 +1261,102 @@ class SunseekerMap:
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug(f"Get heatmap: failed {error}")  # noqa: G004
 
+    def _backup_map_url(self) -> str:
+        """Url of the backup map endpoint."""
+        endpoint = f"/wireless_map/backup_map/get?sn={self.mower.devicesn}"
+        return self.mower.url + endpoint
+
+    def _apply_backup_map_data(self, response) -> None:
+        """Store the backup map list."""
+        response_data = response.json()
+        _LOGGER.debug(f"Backup map data: {json.dumps(response_data)}")  # noqa: G004
+        if response.status_code == 200:
+            self.backupmap_data = response_data
+
     def get_backup_map_data(self):
         """Get mapdata."""
-        endpoint = f"/wireless_map/backup_map/get?sn={self.mower.devicesn}"
         try:
-            url_ = self.mower.url + endpoint
-            headers_ = {
-                "Accept-Language": self.mower.language,
-                "Authorization": "bearer " + self.mower.access_token,
-                "Host": self.mower.host,
-                "Connection": "Keep-Alive",
-                "User-Agent": "okhttp/4.4.1",
-            }
+            url_ = self._backup_map_url()
+            headers_ = self._cloud_headers()
             _LOGGER.debug(f"Get backup map header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            response = self.mower.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
             )
-            response_data = response.json()
-            _LOGGER.debug(f"Backup map data: {json.dumps(response_data)}")  # noqa: G004
-            if response.status_code == 200:
-                self.backupmap_data = response_data
+            self._apply_backup_map_data(response)
+
+            return  # noqa: TRY300
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            _LOGGER.debug(f"Get backup map for {self.mower.devicesn}: failed {error}")  # noqa: G004
+
+    async def async_get_backup_map_data(self):
+        """Get backup map list on the async session."""
+        try:
+            url_ = self._backup_map_url()
+            headers_ = self._cloud_headers()
+            _LOGGER.debug(f"Get backup map header: {headers_} url: {url_}")  # noqa: G004
+            response = await self.mower.http.async_get(
+                url=url_,
+                headers=headers_,
+                timeout=10,
+            )
+            self._apply_backup_map_data(response)
 
             return  # noqa: TRY300
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug(f"Get backup map for {self.mower.devicesn}: failed {error}")  # noqa: G004
 
+    def snapshot_refs(self) -> dict:
+        """Map data for the warm-start snapshot, without copying it.
+
+        Cheap enough to take under data_lock. The data is replaced when it
+        changes, never changed in place, so the refs stay valid for snapshot.
+        """
+        return {
+            "mapid": self.mapid,
+            "image_mapid": self.image_mapid,
+            "mapurl": self.mapurl,
+            "image_data": self.image_data,
+            "mappathdata": self.mappathdata,
+            "realPathFileUlr": self.realPathFileUlr,
+            "realPathmapdata": self.realPathmapdata,
+            "backupmap_data": self.backupmap_data,
+            "heatmap_url": self.heatmap_url,
+            "wifimap_url": self.wifimap_url,
+            "netmap_url": self.netmap_url,
+        }
+
+    @staticmethod
+    def snapshot(refs: dict) -> dict:
+        """Map data to store in the warm-start snapshot, built from snapshot_refs."""
+        data = dict(refs)
+        if isinstance(data["image_data"], bytes):
+            data["image_data"] = data["image_data"].decode("utf-8")
+        if data["realPathmapdata"] is not None:
+            data["realPathmapdata"] = data["realPathmapdata"].to_list()
+        data["mappathdata"] = copy.deepcopy(data["mappathdata"])
+        data["backupmap_data"] = copy.deepcopy(data["backupmap_data"])
+        return data
+
+    def restore_snapshot(self, data: dict) -> None:
+        """Restore map data from a warm-start snapshot."""
+        self.mapid = data.get("mapid", 0)
+        self.image_mapid = data.get("image_mapid", 0)
+        self.mapurl = data.get("mapurl", "")
+        image_data = data.get("image_data")
+        if image_data:
+            self.image_data = image_data.encode("utf-8")
+            self.image_state = "Loaded"
+        self.mappathdata = data.get("mappathdata")
+        self.realPathFileUlr = data.get("realPathFileUlr", "")
+        if data.get("realPathmapdata"):
+            self.realPathmapdata = PathSlice.from_points(data["realPathmapdata"])
+        self.backupmap_data = data.get("backupmap_data")
+        self.heatmap_url = data.get("heatmap_url")
+        self.wifimap_url = data.get("wifimap_url")
+        self.netmap_url = data.get("netmap_url")
+
     def InitValues(self, settings) -> None:
         """Init values at upstart."""
         if self.mower.model in (MODEL_X, MODEL_S):
@@ -0,0 +1,134 @@
+"""Parsed map data."""
+
+from dataclasses import dataclass
+from functools import cached_property
+import json
+import re
+
+
+@dataclass(frozen=True)
+class MapRegion:
+    """A region of the map."""
+
+    id: int | None  # as sent by the cloud, None if missing
+    name: str
+    points: list[tuple[float, float]]
+
+    @property
+    def area(self) -> float:
+        """Area in m²."""
+        points = self.points
+        twice = sum(
+            x1 * y2 - x2 * y1
+            for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1], strict=True)
+        )
+        return abs(twice) / 2
+
+
+@dataclass(frozen=True)
+class MapModel:
+    """Map json parsed once, shared by the renderer and the device.
+
+    Treat it as read only, it is cached until the map data changes.
+    """
+
+    mapid: int
+    data: dict  # the parsed map json
+    phi: float | None
+    work: list[MapRegion]  # region_work
+    channel: list[MapRegion]  # region_channel
+    obstacle: list[MapRegion]  # region_obstacle
+    forbidden: list[MapRegion]  # region_forbidden
+    placed_blank: list[MapRegion]  # region_placed_blank
+    divide: list[MapRegion]  # divide_area_work
+    charger_channel: list[MapRegion]  # region_charger_channel
+    min_x: float
+    max_x: float
+    min_y: float
+    max_y: float
+
+    @cached_property
+    def summary(self) -> dict:
+        """Region ids, names and areas, small enough for state attributes."""
+        return {
+            "map_id": self.mapid,
+            "work_areas": [
+                {"id": region.id, "name": region.name, "area": round(region.area, 1)}
+                for region in self.work
+            ],
+            "passages": len(self.channel),
+            "obstacles": len(self.obstacle),
+            "forbidden_areas": len(self.forbidden),
+        }
+
+
+def parse_points(points) -> list[tuple[float, float]]:
+    """Convert points string to list of tuples."""
+    if isinstance(points, str):
+        points = points.strip()
+        points = re.sub(r",\s*([\]\}])", r"\1", points)
+        points = json.loads(points)
+    return [(float(p[0]), float(p[1])) for p in points]
+
+
+def _regions(data: dict, key: str) -> list[MapRegion]:
+    return [
+        MapRegion(
+            region.get("id"),
+            region.get("name", ""),
+            parse_points(region["points"]),
+        )
+        for region in data.get(key, [])
+    ]
+
+
+def parse_map_model(image_data: bytes | str, mapid: int = 0) -> MapModel:
+    """Parse the map json."""
+    data = json.loads(image_data)
+    phi = None
+    if data.get("map_coordniate"):
+        if data.get("map_coordniate").get("phi"):
+            phi = data.get("map_coordniate").get("phi")
+
+    work = _regions(data, "region_work")
+    channel = _regions(data, "region_channel")
+    obstacle = _regions(data, "region_obstacle")
+    forbidden = _regions(data, "region_forbidden")
+    placed_blank = _regions(data, "region_placed_blank")
+    divide = _regions(data, "divide_area_work")
+    charger_channel = _regions(data, "region_charger_channel")
+
+    # The bounds always include the origin (the charger)
+    min_x = max_x = min_y = max_y = 0
+    for regions in (
+        divide,
+        work,
+        channel,
+        obstacle,
+        forbidden,
+        placed_blank,
+        charger_channel,
+    ):
+        for region in regions:
+            for x, y in region.points:
+                min_x = min(x, min_x)
+                max_x = max(x, max_x)
+                min_y = min(y, min_y)
+                max_y = max(y, max_y)
+
+    return MapModel(
+        mapid,
+        data,
+        phi,
+        work,
+        channel,
+        obstacle,
+        forbidden,
+        placed_blank,
+        divide,
+        charger_channel,
+        min_x,
+        max_x,
+        min_y,
+        max_y,
+    )
@@ -1,19 +1,25 @@
 """SunseekerPy."""
 
+import asyncio
 import base64
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 import json
 import logging
-import queue
-from threading import Lock, Thread, Timer
+from operator import attrgetter
+import ssl
+from threading import Condition, Lock, Thread, Timer
 from typing import TYPE_CHECKING, Any
 import uuid
+import weakref
+import zlib
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 import paho.mqtt.client as mqtt
-import requests
 
 from .const import (
     APPTYPE_NEW,
@@ -21,23 +27,351 @@ from .const import (
     MODEL_OLD,
     MODEL_V,
     MODEL_V1,
+    MQTT_QUEUE_SIZE,
+    MQTT_QUEUE_TIMEOUT,
+    MQTT_WORKERS,
     REGION_EU,
     REGION_US,
 )
 from .sunseeker_device import SunseekerDevice
+from .sunseeker_mqtt_fields import FieldMap, MqttFieldMapper
 from .sunseeker_schedule import Sunseeker_new_schedule_day
 
 if TYPE_CHECKING:
     from .sunseeker import SunseekerRoboticmower
 _LOGGER = logging.getLogger(__name__)
 
+# Keys of the data node of a position frame, a newer frame supersedes it
+_POSITION_KEYS = frozenset({"robot_pos", "rtk_pos"})
+# Seconds between the keepalive checks of a client run on the event loop
+_MISC_INTERVAL = 1
+# Max seconds between two reconnect attempts, as paho's own loop
+_RECONNECT_MAX_DELAY = 120
+
+
+def is_position_frame(data: dict) -> bool:
+    """Return True if the message only reports the position of the mower."""
+    datanode = data.get("data")
+    return (
+        isinstance(datanode, dict)
+        and bool(datanode)
+        and datanode.keys() <= _POSITION_KEYS
+    )
+
+
+class mqtt_message:
+    """MQTT message, parsed once when it is received."""
+
+    def __init__(
+        self,
+        topic: str,
+        payload: bytes,
+        data: dict,
+        handler: Callable[["mqtt_message"], None],
+        owner: object = None,
+    ) -> None:
+        """Init."""
+        self.topic = topic
+        self.payload = payload  # raw bytes, only decoded for logging
+        self.data = data
+        self.handler = handler  # called by the worker
+        self.owner = owner  # the controller, see mqtt_queue.release
+        self.droppable = is_position_frame(data)
+
+
+class mqtt_queue:
+    """Bounded FIFO of the messages of one worker.
+
+    When the queue is full the oldest position frame is dropped to make room.
+    Other messages wait for the worker instead, for at most timeout seconds:
+    the waiting MQTT network thread sends no keepalive, so a stalled worker
+    must not hold it until the broker drops the connection.
+    """
+
+    def __init__(self, maxsize: int, timeout: float) -> None:
+        """Init."""
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._messages: deque[mqtt_message] = deque()
+        self._cond = Condition()
+        self.dropped = 0  # position frames dropped
+        self.waits = 0  # puts that had to wait for room
+        self.timeouts = 0  # messages dropped after waiting timeout seconds
+        self.discarded = 0  # messages of released owners
+        self._released: weakref.WeakSet = weakref.WeakSet()
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        """Return the number of waiting messages."""
+        return len(self._messages)
+
+    def put(self, message: mqtt_message) -> bool:
+        """Queue message, return False if it was dropped."""
+        with self._cond:
+            if len(self._messages) >= self.maxsize and not self._make_room():
+                if message.droppable:
+                    # Only events and schedules are waiting, they go first
+                    self.dropped += 1
+                    return False
+                self.waits += 1
+                if not self._cond.wait_for(
+                    lambda: (
+                        len(self._messages) < self.maxsize
+                        or message.owner in self._released
+                    ),
+                    self.timeout,
+                ):
+                    self.timeouts += 1
+                    return False
+            if message.owner in self._released:
+                self.discarded += 1
+                return False
+            self._messages.append(message)
+            self.max_depth = max(self.max_depth, len(self._messages))
+            self._cond.notify_all()
+            return True
+
+    def _make_room(self) -> bool:
+        """Drop the oldest position frame, return False if there is none."""
+        for index, queued in enumerate(self._messages):
+            if queued.droppable:
+                del self._messages[index]
+                self.dropped += 1
+                return True
+        return False
+
+    def get(self) -> mqtt_message:
+        """Return the next message, waiting for one."""
+        with self._cond:
+            while not self._messages:
+                self._cond.wait()
+            message = self._messages.popleft()
+            self._cond.notify_all()
+            return message
+
+    def release(self, owner: object) -> None:
+        """Discard the messages of owner and wake its waiting puts.
+
+        Called when owner unloads, its later messages are discarded too.
+        """
+        with self._cond:
+            self._released.add(owner)
+            kept = deque(msg for msg in self._messages if msg.owner is not owner)
+            self.discarded += len(self._messages) - len(kept)
+            self._messages = kept
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        """Return the queue counters."""
+        return {
+            "depth": len(self._messages),
+            "max_depth": self.max_depth,
+            "dropped": self.dropped,
+            "waits": self.waits,
+            "timeouts": self.timeouts,
+            "discarded": self.discarded,
+        }
+
+
+class mqtt_worker_pool:
+    """Fixed set of worker threads shared by all MQTT controllers.
+
+    The messages of a device always go to the worker picked by its serial
+    number, so they are handled in order. Blocking calls such as the requests
+    made after a connect run on a separate, equally bounded executor.
+    """
+
+    def __init__(self, size: int, queue_size: int, timeout: float) -> None:
+        """Init."""
+        self._queues = [mqtt_queue(queue_size, timeout) for _ in range(size)]
+        for index, q in enumerate(self._queues):
+            Thread(
+                target=self._worker,
+                args=(q,),
+                daemon=True,
+                name=f"sunseeker_mqtt_{index}",
+            ).start()
+        self._jobs = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="sunseeker_mqtt_job"
+        )
+
+    def _worker(self, q: mqtt_queue) -> None:
+        """Worker thread: processes the messages of its devices in FIFO order."""
+        while True:
+            msg = q.get()
+            try:
+                msg.handler(msg)
+            except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+                # Keep the worker alive, a dead one would block the queue
+                _LOGGER.error("MQTT worker error: " + str(error))  # noqa: G003
+
+    def put(self, devicesn: str, message: mqtt_message) -> bool:
+        """Queue message on the worker of devicesn, return False if dropped."""
+        index = zlib.crc32(devicesn.encode()) % len(self._queues)
+        return self._queues[index].put(message)
+
+    def release(self, owner: object) -> None:
+        """Discard the queued messages of owner, see mqtt_queue.release."""
+        for q in self._queues:
+            q.release(owner)
+
+    def submit(self, func: Callable[[], None]) -> None:
+        """Run a blocking call off the message workers."""
+        self._jobs.submit(_run_job, func)
+
+    def stats(self) -> list[dict[str, int]]:
+        """Return the counters of the worker queues."""
+        return [q.stats() for q in self._queues]
+
+
+def _run_job(func: Callable[[], None]) -> None:
+    """Run a blocking MQTT job, logging its errors."""
+    try:
+        func()
+    except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+        _LOGGER.error("MQTT job error: " + str(error))  # noqa: G003
+
+
+_worker_pool: mqtt_worker_pool | None = None
+_worker_pool_lock = Lock()
+
+
+def worker_pool() -> mqtt_worker_pool:
+    """Return the worker pool shared by all controllers, starting it if needed."""
+    global _worker_pool  # noqa: PLW0603
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = mqtt_worker_pool(
+                MQTT_WORKERS, MQTT_QUEUE_SIZE, MQTT_QUEUE_TIMEOUT
+            )
+        return _worker_pool
+
+
+class mqtt_loop_runner:
+    """Runs the network loop of a connected paho client on an asyncio loop.
+
+    Used instead of loop_start: paho reports its socket through the socket
+    callbacks and the event loop calls loop_read and loop_write when it is
+    ready, so the messages are handled on the loop thread. Reconnecting
+    blocks, it runs in the executor.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, client: mqtt.Client) -> None:
+        """Init and start watching the socket opened by connect."""
+        self._loop = loop
+        self._client = client
+        self._running = True
+        self._reconnect_delay = 1
+        client.on_socket_open = self._on_socket_open
+        client.on_socket_close = self._on_socket_close
+        client.on_socket_register_write = self._on_socket_register_write
+        client.on_socket_unregister_write = self._on_socket_unregister_write
+        if (sock := client.socket()) is not None:
+            self._call(self._opened, sock.fileno(), client.want_write())
+        self._call(self._misc)
+
+    def stop(self) -> None:
+        """Stop the keepalive and reconnects, the socket closes on disconnect."""
+        self._running = False
+
+    def _call(self, func: Callable[..., None], *args) -> None:
+        """Run func on the event loop, paho calls back from any thread."""
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            func(*args)
+        else:
+            self._loop.call_soon_threadsafe(func, *args)
+
+    def _on_socket_open(self, client, userdata, sock) -> None:
+        self._call(self._opened, sock.fileno(), False)
+
+    def _on_socket_close(self, client, userdata, sock) -> None:
+        # paho closes sock after this returns, so pass the fd along
+        self._call(self._closed, sock.fileno())
+
+    def _on_socket_register_write(self, client, userdata, sock) -> None:
+        self._call(self._loop.add_writer, sock.fileno(), self._on_writable)
+
+    def _on_socket_unregister_write(self, client, userdata, sock) -> None:
+        self._call(self._loop.remove_writer, sock.fileno())
+
+    def _opened(self, fd: int, want_write: bool) -> None:
+        self._loop.add_reader(fd, self._on_readable)
+        if want_write:
+            self._loop.add_writer(fd, self._on_writable)
+
+    def _closed(self, fd: int) -> None:
+        self._loop.remove_reader(fd)
+        self._loop.remove_writer(fd)
+        if self._running:
+            self._schedule_reconnect()
+
+    def _on_readable(self) -> None:
+        client = self._client
+        # A TLS socket may hold decrypted packets the selector does not see
+        while (
+            client.loop_read() == mqtt.MQTT_ERR_SUCCESS
+            and isinstance(sock := client.socket(), ssl.SSLSocket)
+            and sock.pending()
+        ):
+            pass
+
+    def _on_writable(self) -> None:
+        self._client.loop_write()
+
+    def _misc(self) -> None:
+        """Send the keepalive pings and drop a connection that stopped answering."""
+        if not self._running:
+            return
+        self._client.loop_misc()
+        if self._client.is_connected():
+            self._reconnect_delay = 1
+        self._loop.call_later(_MISC_INTERVAL, self._misc)
+
+    def _schedule_reconnect(self) -> None:
+        delay = self._reconnect_delay
+        self._reconnect_delay = min(delay * 2, _RECONNECT_MAX_DELAY)
+        _LOGGER.debug("MQTT connection lost, reconnecting in %s seconds", delay)
+        self._loop.call_later(delay, self._start_reconnect)
+
+    def _start_reconnect(self) -> None:
+        if self._running:
+            self._loop.run_in_executor(None, self._reconnect)
+
+    def _reconnect(self) -> None:
+        """Executor job: reconnect, or try again later."""
+        try:
+            self._client.reconnect()
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            _LOGGER.debug("MQTT reconnect error: " + str(error))  # noqa: G003
+            self._call(self._retry)
+
+    def _retry(self) -> None:
+        if self._running:
+            self._schedule_reconnect()
+
 
 class mqtt_needupdate:
-    """Holds the value if mqtt trigers update."""
+    """Holds the value if mqtt trigers update.
+
+    fields holds the device attributes known to have changed, need_update is
+    set for changes that may affect any entity.
+    """
 
     def __init__(self) -> None:
         """Init."""
         self.need_update = False
+        self.fields: set[str] = set()
+
+    def changed(self, field: str | None) -> None:
+        """Record a change of field, or of anything if None."""
+        if field is None:
+            self.need_update = True
+        else:
+            self.fields.add(field)
 
 
 class mqtt_update_values:
@@ -56,6 +390,20 @@ class mqtt_update_values:
         self.netmap = False
         self.path_url_to_load = ""  # URL to load path from directly, bypassing the API
 
+    def merge(self, other: "mqtt_update_values") -> None:
+        """Add the updates requested by other."""
+        self.schedule |= other.schedule
+        self.heatmap |= other.heatmap
+        self.fetch_new_map_data |= other.fetch_new_map_data
+        self.start_new_path |= other.start_new_path
+        self.map_update |= other.map_update
+        self.livemap_update |= other.livemap_update
+        self.wifimap |= other.wifimap
+        self.live_move_update |= other.live_move_update
+        self.netmap |= other.netmap
+        if other.path_url_to_load:
+            self.path_url_to_load = other.path_url_to_load
+
 
 class SunseekermqttController:
     """Sunseeker Mqtt controller class."""
@@ -70,8 +418,12 @@ class SunseekermqttController:
         apptype,
         model,
         url,
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
-        """Init."""
+        """Init.
+
+        With a loop the clients run on it instead of paho's network threads.
+        """
         self.Sunseeker: SunseekerRoboticmower = mower
         self.mqttdata = {}
         self._unloading = False
@@ -89,8 +441,34 @@ class SunseekermqttController:
         self.appId = "0123456789abcdef"
         self.mqtt_passwd = str(uuid.uuid4()).replace("-", "")[:24]
         self.public_key = "-----BEGIN PUBLIC KEY-----\nMIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA0f7mbMVc/YIYQbR8Ty3u\n7yx0cKX6Gt7JkVQrWynI7xM6/yVPMC1I7nXdjMlVPpc06UXoc5ClQNsTbQ4vumFg\n2RZPQwAOc7yL1Y8t1W0b9jMTztu32ZzlobfzIVkIO1R7x1I+pkyp6QDm/MnvWyeu\nCM77gS2bDv47H9COQn/gy/fy9uecyWCY3u+dXQhujLPrSJ2FFs6SwD0t5QEJjdrC\nftkKQFsflm+i5RQZBMNGT3LdAMnPK4avG642Afum0SzmNrEZrIo7pr2w0fvokbWB\nSOOeEdGAx7UVI1kHssOohqW37yJzzFMIlahZSEJ0A3Dm6yrtgobp2mQlCisqsVW4\nXwIDAQAB\n-----END PUBLIC KEY-----"
-        self._device_queues: dict[str, queue.Queue] = {}
-        self._queues_lock: Lock = Lock()
+        self.rejected = 0  # messages of unknown devices
+        self._field_mappers: dict[str, MqttFieldMapper] = {}
+        self.loop = loop
+        self._runners: dict[mqtt.Client, mqtt_loop_runner] = {}
+        self._password_reconnect: asyncio.Task | None = None
+
+    def _loop_start(self, client: mqtt.Client) -> None:
+        """Start the network loop of a connected client."""
+        if self.loop is None:
+            client.loop_start()
+        else:
+            self._runners[client] = mqtt_loop_runner(self.loop, client)
+
+    def _submit(self, func: Callable[[], None]) -> None:
+        """Run a blocking call off the network loop."""
+        if self.loop is None:
+            worker_pool().submit(func)
+        else:
+            self.loop.run_in_executor(None, _run_job, func)
+
+    def _disconnect(self, client: mqtt.Client) -> None:
+        """Disconnect client and stop its network loop."""
+        runner = self._runners.pop(client, None)
+        if runner is not None:
+            runner.stop()
+        client.disconnect()
+        if runner is None:
+            client.loop_stop()
 
     def Start_mqtt(self):
         """Create and connect."""
@@ -106,15 +484,14 @@ class SunseekermqttController:
     def unload(self):
         """Unload."""
         self._unloading = True
-        with self._queues_lock:
-            for q in self._device_queues.values():
-                q.put(None)
+        if self.loop is None:
+            # The workers are shared, free them from our pending messages.
+            # First, so a network thread waiting in put can be stopped
+            worker_pool().release(self)
         if self.mqtt_client is not None:
-            self.mqtt_client.disconnect()
-            self.mqtt_client.loop_stop()
+            self._disconnect(self.mqtt_client)
         if self.mqtt_client_new is not None:
-            self.mqtt_client_new.disconnect()
-            self.mqtt_client_new.loop_stop()
+            self._disconnect(self.mqtt_client_new)
 
     def encrypt_rsa_base64(self, text: str, public_key_pem: str) -> str:
         """Encrypt text with RSA public key and return base64 encoded string."""
@@ -141,7 +518,7 @@ class SunseekermqttController:
             _LOGGER.debug(f"data: {data_}")  # noqa: G004
             _LOGGER.debug(f"headers: {headers_}")  # noqa: G004
             _LOGGER.debug(f"url: {url_}")  # noqa: G004
-            response = requests.put(
+            response = self.Sunseeker.http.put(
                 url=url_,
                 headers=headers_,
                 json=data_,
@@ -156,33 +533,74 @@ class SunseekermqttController:
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug(f"Set MQTT password failed {error}")  # noqa: G004
 
-    def _reconnect_with_new_password(self):
-        """Generate a new MQTT password, upload it, and reconnect."""
+    def _renew_password(self):
+        """Generate a new MQTT password and upload it."""
         self.mqtt_passwd = str(uuid.uuid4()).replace("-", "")[:24]
         encrypted_pass = self.encrypt_rsa_base64(self.mqtt_passwd, self.public_key)
         _LOGGER.debug("MQTT new password: " + self.mqtt_passwd)  # noqa: G003
         _LOGGER.debug("MQTT encrypted password: " + encrypted_pass)  # noqa: G003
         self.edit_password_mqtt(encrypted_pass)
+
+    def _reconnect_with_new_password(self):
+        """Generate a new MQTT password, upload it, and reconnect."""
+        self._renew_password()
         self.connect_mqtt_new()
 
+    def _reconnect_with_new_password_later(self):
+        """Retry with a new password in 30 seconds."""
+        if self.loop is None:
+            Timer(30, self._reconnect_with_new_password).start()
+        else:
+            # The client is owned by the event loop, only the blocking
+            # parts run in the executor
+            self.loop.call_later(30, self._start_password_reconnect)
+
+    def _start_password_reconnect(self):
+        self._password_reconnect = self.loop.create_task(
+            self._async_reconnect_with_new_password()
+        )
+
+    async def _async_reconnect_with_new_password(self):
+        """Event loop version of _reconnect_with_new_password."""
+        if self._unloading:
+            return
+        try:
+            await self.loop.run_in_executor(None, self._renew_password)
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            _LOGGER.debug("MQTT password renewal error: " + str(error))  # noqa: G003
+            return
+        if self.mqtt_client_new:
+            self._disconnect(self.mqtt_client_new)
+        client, host, port = self._create_client_new()
+        self.mqtt_client_new = client
+        if not await self.loop.run_in_executor(
+            None, self._connect_client, client, host, port
+        ):
+            return
+        if self._unloading:
+            client.disconnect()
+        else:
+            self._loop_start(client)
+
     def connect_mqtt_new(self):
         """Connect mqtt new."""
         if self.mqtt_client_new:
-            self.mqtt_client_new.disconnect()
-            self.mqtt_client_new.loop_stop()
-
-        self.mqtt_client_new = mqtt.Client(
-            client_id=self.client_id + "new", protocol=mqtt.MQTTv311
-        )
-        self.mqtt_client_new.on_connect = self.on_mqtt_connect_new
-        self.mqtt_client_new.on_message = self.on_mqtt_message
-        self.mqtt_client_new.on_disconnect = self.on_mqtt_disconnect
-        self.mqtt_client_new.on_error = self.on_mqtt_error
-        self.mqtt_client_new.on_close = self.on_mqtt_close
-        self.mqtt_client_new.username_pw_set(
-            self.username + self.appId, self.mqtt_passwd
-        )
-        self.mqtt_client_new.tls_set()
+            self._disconnect(self.mqtt_client_new)
+
+        self.mqtt_client_new, host, port = self._create_client_new()
+        if self._connect_client(self.mqtt_client_new, host, port):
+            self._loop_start(self.mqtt_client_new)
+
+    def _create_client_new(self) -> tuple[mqtt.Client, str, int]:
+        """Create the new app client, return it with the host and port."""
+        client = mqtt.Client(client_id=self.client_id + "new", protocol=mqtt.MQTTv311)
+        client.on_connect = self.on_mqtt_connect_new
+        client.on_message = self.on_mqtt_message
+        client.on_disconnect = self.on_mqtt_disconnect
+        client.on_error = self.on_mqtt_error
+        client.on_close = self.on_mqtt_close
+        client.username_pw_set(self.username + self.appId, self.mqtt_passwd)
+        client.tls_set()
         if self.region == REGION_EU:
             if self.model == MODEL_V1:
                 host = "app.mqttv1-eu.sk-robot.com"
@@ -200,17 +618,22 @@ class SunseekermqttController:
         _LOGGER.debug("MQTT host: " + host)  # noqa: G003
         _LOGGER.debug("MQTT username: " + self.username + self.appId)  # noqa: G003
         _LOGGER.debug("MQTT password: " + self.mqtt_passwd)  # noqa: G003
+        return client, host, port
 
+    @staticmethod
+    def _connect_client(client: mqtt.Client, host: str, port: int) -> bool:
+        """Connect client, blocking. Return False if it failed."""
         try:
-            self.mqtt_client_new.connect(
+            client.connect(
                 host=host,
                 keepalive=60,
                 port=port,
             )
-            _LOGGER.debug("MQTT starting loop")
-            self.mqtt_client_new.loop_start()
         except Exception as error:  # noqa: BLE001
             _LOGGER.debug("MQTT connect error: " + str(error))  # noqa: G003
+            return False
+        _LOGGER.debug("MQTT starting loop")
+        return True
 
     def on_mqtt_connect_new(self, client, userdata, flags, rc):
         """On mqtt connect."""
@@ -228,7 +651,7 @@ class SunseekermqttController:
                     f"MQTT new connect rejected ({reason}), generating new password and retrying"  # noqa: G004
                 )
                 if not self._unloading:
-                    Timer(30, self._reconnect_with_new_password).start()
+                    self._reconnect_with_new_password_later()
             else:
                 _LOGGER.debug(
                     f"MQTT new connect failed ({reason}), not retrying"  # noqa: G004
@@ -252,14 +675,12 @@ class SunseekermqttController:
 
         for device_ in self.Sunseeker.robotList:
             device: SunseekerDevice = device_
-            thread0 = Thread(target=device.after_mqtt_connect)
-            thread0.start()
+            self._submit(device.after_mqtt_connect)
 
     def connect_mqtt(self):
         """Connect mqtt."""
         if self.mqtt_client:
-            self.mqtt_client.disconnect()
-            self.mqtt_client.loop_stop()
+            self._disconnect(self.mqtt_client)
 
         self.mqtt_client = mqtt.Client(client_id=self.client_id)
         self.mqtt_client.on_connect = self.on_mqtt_connect
@@ -274,7 +695,7 @@ class SunseekermqttController:
                 keepalive=60,
             )
             _LOGGER.debug("MQTT starting loop")
-            self.mqtt_client.loop_start()
+            self._loop_start(self.mqtt_client)
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug("MQTT connect error: " + str(error))  # noqa: G003
 
@@ -337,43 +758,40 @@ class SunseekermqttController:
         if "pause" in data:
             device.Schedule_new.schedule_pause = data.get("pause")
 
-    def _get_or_create_queue(self, devicesn: str) -> queue.Queue:
-        """Return the per-device queue, creating it and its worker thread if needed."""
-        with self._queues_lock:
-            if devicesn not in self._device_queues:
-                q: queue.Queue = queue.Queue()
-                self._device_queues[devicesn] = q
-                Thread(
-                    target=self._worker,
-                    args=(q,),
-                    daemon=True,
-                    name=f"sunseeker_mqtt_{devicesn}",
-                ).start()
-            return self._device_queues[devicesn]
-
-    def _worker(self, q: queue.Queue):
-        """Worker thread: processes one device's MQTT messages in FIFO order."""
-        while True:
-            msg = q.get()
-            if msg is None:
-                q.task_done()
-                break
-            try:
-                self.handle_mqtt_message(msg)
-            finally:
-                q.task_done()
-
     def on_mqtt_message(self, client, userdata, message):
         """On mqtt message."""
         try:
-            devicesn = json.loads(message.payload.decode()).get("deviceSn")
+            data = json.loads(message.payload)
+            devicesn = data.get("deviceSn")
         except Exception:  # noqa: BLE001
             devicesn = None
-        if devicesn:
-            self._get_or_create_queue(devicesn).put(message)
+        if not devicesn:
+            return
+        if self.Sunseeker.get_device(devicesn) is None:
+            # Not one of ours, don't spend a worker on it
+            self.rejected += 1
+            _LOGGER.debug("MQTT message error, DeviceSn: %s not found", devicesn)
+            return
+        msg = mqtt_message(
+            message.topic, message.payload, data, self.handle_mqtt_message, self
+        )
+        if self.loop is not None:
+            # Already on the event loop, hand it straight to the coordinator
+            self.handle_mqtt_message(msg)
+        elif not worker_pool().put(devicesn, msg):
+            if msg.droppable:
+                _LOGGER.debug("MQTT queue of %s full, position dropped", devicesn)
+            else:
+                # The worker did not make room in time, see mqtt_queue
+                _LOGGER.warning("MQTT queue of %s full, message dropped", devicesn)
 
     def update_var_if_changed(
-        self, nu: mqtt_needupdate, s: str, old_value: Any, new_value: Any
+        self,
+        nu: mqtt_needupdate,
+        s: str,
+        old_value: Any,
+        new_value: Any,
+        field: str | None = None,
     ) -> Any:
         """Update a variable if the new value is different."""
         if isinstance(old_value, dict) and isinstance(new_value, dict):
@@ -381,7 +799,7 @@ class SunseekermqttController:
                 _LOGGER.debug(
                     f"dict node: {s} - Old_value: {old_value} New_value: {new_value}"  # noqa: G004
                 )
-                nu.need_update = True
+                nu.changed(field)
                 return new_value.copy()
             return old_value
         if isinstance(old_value, list) and isinstance(new_value, list):
@@ -389,14 +807,14 @@ class SunseekermqttController:
                 _LOGGER.debug(
                     f"list node: {s} - Old_value: {old_value} New_value: {new_value}"  # noqa: G004
                 )
-                nu.need_update = True
+                nu.changed(field)
                 return new_value.copy()
             return old_value
         if old_value != new_value:
             _LOGGER.debug(
                 f"simple node: {s}  - Old_value: {old_value} New_value: {new_value}"  # noqa: G004
             )
-            nu.need_update = True
+            nu.changed(field)
             return new_value
         return old_value
 
@@ -407,8 +825,9 @@ class SunseekermqttController:
         key_path: list[str],
         nodename: str,
         prev_prop_value,
+        field: str | None = None,
     ):
-        """Gets the value to update."""
+        """Gets the value to update, field names it when recording a change."""
         current_node = basenode
         for key in key_path:
             if isinstance(current_node, dict):
@@ -441,9 +860,52 @@ class SunseekermqttController:
         #               return prev_prop_value
         #            current_node = current_node.get(key)
         return self.update_var_if_changed(
-            nu, nodename, prev_prop_value, current_node.get(nodename, prev_prop_value)
+            nu,
+            nodename,
+            prev_prop_value,
+            current_node.get(nodename, prev_prop_value),
+            field,
         )
 
+    def field_mapper(self, model: str) -> MqttFieldMapper:
+        """Return the compiled field maps of model."""
+        mapper = self._field_mappers.get(model)
+        if mapper is None:
+            mapper = MqttFieldMapper(model, self.apptype)
+            self._field_mappers[model] = mapper
+        return mapper
+
+    def apply_fields(
+        self,
+        nu: mqtt_needupdate,
+        node: dict,
+        fields: FieldMap,
+        target,
+        prefix: str = "",
+    ) -> None:
+        """Set the attributes of target mapped from the keys present in node.
+
+        Changes are recorded as prefix + the dotted attr.
+        """
+        matched = [field for key in node if key in fields for field in fields[key]]
+        if len(matched) > 1:
+            # Keep the table order when several keys map to the same attribute
+            matched.sort(key=attrgetter("order"))
+        for field in matched:
+            obj = field.parent(target)
+            setattr(
+                obj,
+                field.attr,
+                self.setvalue(
+                    nu,
+                    node,
+                    field.path,
+                    field.name,
+                    getattr(obj, field.attr),
+                    prefix + field.field,
+                ),
+            )
+
     def handle_mqtt_schedule_ctime_data(
         self,
         upd: mqtt_update_values,
@@ -484,159 +946,6 @@ class SunseekermqttController:
                     dayobj.start = day.get("start", dayobj.start)
                     dayobj.end = day.get("end", dayobj.end)
 
-    def handle_mqtt_consumable_data(
-        self,
-        upd: mqtt_update_values,
-        nu: mqtt_needupdate,
-        data,
-        datanode,
-        device: SunseekerDevice,
-    ):
-        """Handles the mqtt consumable items."""
-        device.consumable.blade.at = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "blade"],
-            "at",
-            device.consumable.blade.at,
-        )
-        device.consumable.blade.loop = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "blade"],
-            "loop",
-            device.consumable.blade.loop,
-        )
-        device.consumable.blade.ls = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "blade"],
-            "ls",
-            device.consumable.blade.ls,
-        )
-        device.consumable.blade.mp = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "blade"],
-            "mp",
-            device.consumable.blade.mp,
-        )
-        device.consumable.blade.twt = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "blade"],
-            "twt",
-            device.consumable.blade.twt,
-        )
-
-        device.consumable.cutter.at = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "cutter"],
-            "at",
-            device.consumable.cutter.at,
-        )
-        device.consumable.cutter.loop = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "cutter"],
-            "loop",
-            device.consumable.cutter.loop,
-        )
-        device.consumable.cutter.ls = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "cutter"],
-            "ls",
-            device.consumable.cutter.ls,
-        )
-        device.consumable.cutter.mp = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "cutter"],
-            "mp",
-            device.consumable.cutter.mp,
-        )
-        device.consumable.cutter.twt = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "cutter"],
-            "twt",
-            device.consumable.cutter.twt,
-        )
-
-        device.consumable.small_blade.at = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_blade"],
-            "at",
-            device.consumable.small_blade.at,
-        )
-        device.consumable.small_blade.loop = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_blade"],
-            "loop",
-            device.consumable.small_blade.loop,
-        )
-        device.consumable.small_blade.ls = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_blade"],
-            "ls",
-            device.consumable.small_blade.ls,
-        )
-        device.consumable.small_blade.mp = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_blade"],
-            "mp",
-            device.consumable.small_blade.mp,
-        )
-        device.consumable.small_blade.twt = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_blade"],
-            "twt",
-            device.consumable.small_blade.twt,
-        )
-
-        device.consumable.small_cutter.at = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_cutter"],
-            "at",
-            device.consumable.small_cutter.at,
-        )
-        device.consumable.small_cutter.loop = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_cutter"],
-            "loop",
-            device.consumable.small_cutter.loop,
-        )
-        device.consumable.small_cutter.ls = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_cutter"],
-            "ls",
-            device.consumable.small_cutter.ls,
-        )
-        device.consumable.small_cutter.mp = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_cutter"],
-            "mp",
-            device.consumable.small_cutter.mp,
-        )
-        device.consumable.small_cutter.twt = self.setvalue(
-            nu,
-            datanode,
-            ["consumable_items", "small_cutter"],
-            "twt",
-            device.consumable.small_cutter.twt,
-        )
-
     def handle_mqtt_schedule_data(
         self,
         upd: mqtt_update_values,
@@ -646,27 +955,6 @@ class SunseekermqttController:
         device: SunseekerDevice,
     ):
         """Handles the mqtt schedule data."""
-
-        device.Schedule_new.schedule_recommended = self.setvalue(
-            nu,
-            datanode,
-            [],
-            "recommended_time_flag",
-            device.Schedule_new.schedule_recommended,
-        )
-        device.Schedule_new.schedule_custom = self.setvalue(
-            nu,
-            datanode,
-            [],
-            "time_custom_flag",
-            device.Schedule_new.schedule_custom,
-        )
-        device.Schedule_new.schedule_pause = self.setvalue(
-            nu, datanode, [], "pause", device.Schedule_new.schedule_pause
-        )
-        device.Schedule_new.timezone = self.setvalue(
-            nu, datanode, [], "time_zone", device.Schedule_new.timezone
-        )
         # Schedule
         if "time_custom" in datanode:
             nu.need_update = True
@@ -717,45 +1005,56 @@ class SunseekermqttController:
             upd.fetch_new_map_data = True
             upd.map_update = True
             upd.livemap_update = True
-        # "charge_pos":{"angle":-3.127,"point":[-0.018,0.261]}
-        device.map.charger_orientation = self.setvalue(
-            nu, datanode, ["charge_pos"], "angle", device.map.charger_orientation
-        )
         if "rtk_pos" in datanode:
+            if datanode.get("rtk_pos") != device.RTKPos:
+                nu.changed("RTKPos")
             device.RTKPos = datanode.get("rtk_pos")
 
         if "charge_pos" in datanode:
             if "point" in datanode.get("charge_pos"):
                 x, y = data["data"]["charge_pos"]["point"]
+                if (x, y) != (device.map.charger_pos_x, device.map.charger_pos_y):
+                    nu.changed("map.charger_pos")
                 device.map.charger_pos_x = x
                 device.map.charger_pos_y = y
                 upd.live_move_update = True
         msg_timestamp = data.get("timestamp", 0)
-        if msg_timestamp >= device.map.last_pos_timestamp:
+        if "robot_pos" in datanode and msg_timestamp >= device.map.last_pos_timestamp:
             device.map.mower_orientation = self.setvalue(
-                nu, datanode, ["robot_pos"], "angle", device.map.mower_orientation
+                nu,
+                datanode,
+                ["robot_pos"],
+                "angle",
+                device.map.mower_orientation,
+                "map.mower_orientation",
             )
-            if "robot_pos" in datanode:
-                if "point" in datanode.get("robot_pos"):
-                    x, y = data["data"]["robot_pos"]["point"]
-                    device.map.mower_pos_x = x
-                    device.map.mower_pos_y = y
-                    device.map.last_pos_timestamp = msg_timestamp
-                    upd.live_move_update = True
+            if "point" in datanode.get("robot_pos"):
+                x, y = data["data"]["robot_pos"]["point"]
+                if (x, y) != (device.map.mower_pos_x, device.map.mower_pos_y):
+                    nu.changed("map.mower_pos")
+                device.map.mower_pos_x = x
+                device.map.mower_pos_y = y
+                device.map.last_pos_timestamp = msg_timestamp
+                upd.live_move_update = True
 
         # id = report_path_change or report_path
         if "path_info" in datanode:
-            path_size = self.setvalue(nu, datanode, ["path_info"], "size", 0)
+            # Only compared with the total, it is not kept on the device
+            path_info = datanode["path_info"]
+            path_size = path_info.get("size", 0) if isinstance(path_info, dict) else 0
             device.map.path_total = self.setvalue(
-                nu, datanode, ["path_info"], "total", device.map.path_total
+                nu,
+                datanode,
+                ["path_info"],
+                "total",
+                device.map.path_total,
+                "map.path_total",
             )
             if (
                 path_size == device.map.path_total
             ):  # First points in the new path_id series
                 upd.start_new_path = True
-                device.map.livepathpoints.clear()
-                device.map.cached_pathpoints.clear()
-                device.map._live_type10_pending.clear()  # noqa: SLF001
+                device.map.clear_path()
                 device.map.realPathmapdata = None
                 device.map.realPathFileUlr = ""
                 device.map.pathurl = ""
@@ -763,7 +1062,12 @@ class SunseekermqttController:
                 # device.map.skip_server_path = True
 
             device.map.path_id = self.setvalue(
-                nu, datanode, ["path_info"], "path_id", device.map.path_id
+                nu,
+                datanode,
+                ["path_info"],
+                "path_id",
+                device.map.path_id,
+                "map.path_id",
             )
 
             if "path" in datanode.get("path_info"):
@@ -783,43 +1087,14 @@ class SunseekermqttController:
         device: SunseekerDevice,
     ):
         """Handle zone data."""
-        # zones
-        device.custom_zones = self.setvalue(
-            nu, datanode, [], "custom_flag", device.custom_zones
-        )
         if "custom" in datanode:
             customdata = datanode.get("custom")
             for z in customdata:
                 zoneid = z["region_id"]
                 zone = device.get_zone(zoneid)
                 if zone:
-                    zone.start = self.setvalue(nu, z, [], "start", zone.start)
-                    zone.finish = self.setvalue(nu, z, [], "finish", zone.finish)
-                    zone.gap = self.setvalue(nu, z, [], "work_gap", zone.gap)
-                    zone.region_size = self.setvalue(
-                        nu, z, [], "region_size", zone.region_size
-                    )
-                    zone.blade_height = self.setvalue(
-                        nu, z, [], "blade_height", zone.blade_height
-                    )
-                    zone.estimate_time = self.setvalue(
-                        nu, z, [], "estimate_time", zone.estimate_time
-                    )
-                    zone.blade_speed = self.setvalue(
-                        nu, z, [], "blade_speed", zone.blade_speed
-                    )
-                    zone.plan_mode = self.setvalue(
-                        nu, z, [], "plan_mode", zone.plan_mode
-                    )
-                    zone.plan_angle = self.setvalue(
-                        nu, z, [], "plan_angle", zone.plan_angle
-                    )
-                    zone.work_speed = self.setvalue(
-                        nu, z, [], "work_speed", zone.work_speed
-                    )
-                    zone.setting = self.setvalue(nu, z, [], "setting", zone.setting)
-                    zone.multi_zigzag_angles = self.setvalue(
-                        nu, z, [], "multi_zigzag_angles", zone.multi_zigzag_angles
+                    self.apply_fields(
+                        nu, z, self.field_mapper(device.model).zone, zone, "zone."
                     )
                     zigzag_slots = [
                         zone.zigzag_1,
@@ -856,9 +1131,11 @@ class SunseekermqttController:
             # device.eventtype = data.get("id")
 
         if datanode.get("event_code"):
-            device.eventtype = self.setvalue(nu, data, [], "id", device.eventtype)
+            device.eventtype = self.setvalue(
+                nu, data, [], "id", device.eventtype, "eventtype"
+            )
             device.eventcode = self.setvalue(
-                nu, datanode, [], "event_code", device.eventcode
+                nu, datanode, [], "event_code", device.eventcode, "eventcode"
             )
             if device.eventtype == "report_event":
                 if device.eventcode == 7:  # new map upladed
@@ -884,9 +1161,7 @@ class SunseekermqttController:
                         device.map.realPathmapdata = None
                         device.map.realPathFileUlr = ""
                         device.map.pathurl = ""
-                        device.map.livepathpoints.clear()
-                        device.map.cached_pathpoints.clear()
-                        device.map._live_type10_pending.clear()  # noqa: SLF001
+                        device.map.clear_path()
                         nu.need_update = True
                         upd.map_update = True
                         upd.livemap_update = True
@@ -937,150 +1212,25 @@ class SunseekermqttController:
                     upd.map_update = True
                     upd.livemap_update = True
                     upd.fetch_new_map_data = True
-            device.mode = self.setvalue(nu, datanode, [], "status", device.mode)
-        if "consumable_items" in datanode:
-            self.handle_mqtt_consumable_data(upd, nu, data, datanode, device)
+            device.mode = self.setvalue(nu, datanode, [], "status", device.mode, "mode")
         if "id" in data:
             self.handle_mqtt_data_id(upd, nu, data, datanode, device)
-        device.above_edge = self.setvalue(
-            nu, datanode, [], "above_edge", device.above_edge
-        )
-        # X gen2
-        # auto ride edge does not get reported via mqtt.
-        device.auto_ride_edge = self.setvalue(
-            nu, datanode, [], "auto_ride_edge_map_m", device.auto_ride_edge
-        )
-        device.recharge_mode = self.setvalue(
-            nu, datanode, [], "recharge_mode", device.recharge_mode
-        )
-        device.nightwork = self.setvalue(
-            nu, datanode, [], "night_work", device.nightwork
-        )
-        device.enery_mode = self.setvalue(
-            nu, datanode, [], "energy_saving_mode", device.enery_mode
-        )
-        # online
-        device.deviceOnlineFlag = self.setvalue(
-            nu, datanode, [], "online", device.deviceOnlineFlag
-        )
-        # task info
-        device.task_id = self.setvalue(nu, datanode, [], "task_id", device.task_id)
-        device.schedule_cancel = self.setvalue(
-            nu, datanode, [], "schedule_cancel", device.schedule_cancel
-        )
-        device.normal_done = self.setvalue(
-            nu, datanode, [], "normal_done", device.normal_done
-        )
-        device.end_reason = self.setvalue(
-            nu, datanode, [], "end_reason", device.end_reason
-        )
-        device.oneshot_task_type = self.setvalue(
-            nu, datanode, [], "oneshot_task_type", device.oneshot_task_type
-        )
-        device.start_reason = self.setvalue(
-            nu, datanode, [], "start_reason", device.start_reason
-        )
-        device.task_type = self.setvalue(
-            nu, datanode, [], "task_type", device.task_type
-        )
-
-        # firmware_version
-        device.device_firmware = self.setvalue(
-            nu, datanode, [], "firmware_version", device.device_firmware
-        )
-        device.base_firmware = self.setvalue(
-            nu, datanode, [], "station_firmware_version", device.base_firmware
-        )
-
-        device.avoid_objects = self.setvalue(
-            nu, datanode, [], "work_touch_mode", device.avoid_objects
-        )
-        device.AISens = self.setvalue(nu, datanode, [], "ai_sensitivity", device.AISens)
-        device.cur_min = self.setvalue(nu, datanode, [], "work_time", device.cur_min)
-        device.power = self.setvalue(nu, datanode, [], "elec", device.power)
-        device.rain_delay_left = self.setvalue(
-            nu, datanode, [], "rain_countdown", device.rain_delay_left
-        )
-        device.rain_status = self.setvalue(
-            nu, datanode, [], "rain_status", device.rain_status
-        )
-        device.rain_en = self.setvalue(
-            nu, datanode, ["rain"], "rain_flag", device.rain_en
-        )
-        device.rain_delay_set = self.setvalue(
-            nu, datanode, ["rain"], "delay", device.rain_delay_set
-        )
-        device.robotsignal = self.setvalue(
-            nu, datanode, [], "robot_sig", device.robotsignal
-        )
-        device.border_first = self.setvalue(
-            nu, datanode, [], "first_along_border", device.border_first
-        )
-        device.border_mode = self.setvalue(
-            nu, datanode, [], "follow_border_freq", device.border_mode
-        )
-        device.wifi_lv = self.setvalue(nu, datanode, [], "wifi_sig", device.wifi_lv)
-        device.taskTotalArea = self.setvalue(
-            nu, datanode, [], "task_total_area", device.taskTotalArea
-        )
-        device.taskCoverArea = self.setvalue(
-            nu, datanode, [], "task_cover_area", device.taskCoverArea
-        )
-        device.net_4g_sig = self.setvalue(
-            nu, datanode, [], "net_4g_sig", device.net_4g_sig
-        )
-        device.time_work_repeat = self.setvalue(
-            nu, datanode, [], "time_work_repeat", device.time_work_repeat
-        )
-        device.gap = self.setvalue(nu, datanode, ["mow_efficiency"], "gap", device.gap)
-        device.work_speed = self.setvalue(
-            nu, datanode, ["mow_efficiency"], "speed", device.work_speed
-        )
-        device.plan_angle = self.setvalue(
-            nu, datanode, [], "plan_value", device.plan_angle
-        )
-        device.plan_mode = self.setvalue(
-            nu, datanode, [], "plan_mode", device.plan_mode
-        )
-        device.plan_angle = self.setvalue(
-            nu, datanode, ["plan_angle"], "plan_value", device.plan_angle
-        )
-        device.plan_mode = self.setvalue(
-            nu, datanode, ["plan_angle"], "plan_mode", device.plan_mode
-        )
-        device.multi_zigzag_angles = self.setvalue(
-            nu,
-            datanode,
-            ["plan_angle"],
-            "multi_zigzag_angles",
-            device.multi_zigzag_angles,
-        )
-        zigzag_slots = [
-            device.zigzag_1,
-            device.zigzag_2,
-            device.zigzag_3,
-            device.zigzag_4,
-        ]
-        for i, slot in enumerate(zigzag_slots):
-            if i < len(device.multi_zigzag_angles):
-                entry = device.multi_zigzag_angles[i]
-                slot.active = entry.get("active", False)
-                slot.angle = entry.get("angle", 0)
-            else:
-                slot.active = False
-                slot.angle = 0
-        device.blade_speed = self.setvalue(
-            nu, datanode, ["blade"], "speed", device.blade_speed
-        )
-        device.blade_height = self.setvalue(
-            nu, datanode, ["blade"], "height", device.blade_height
-        )
-        device.dis_along_border = self.setvalue(
-            nu, datanode, [], "dis_along_border", device.dis_along_border
-        )
-        device.cliff_detect = self.setvalue(
-            nu, datanode, [], "cliff_detect_enable", device.cliff_detect
-        )
+        self.apply_fields(nu, datanode, self.field_mapper(device.model).data, device)
+        if "plan_angle" in datanode:
+            zigzag_slots = [
+                device.zigzag_1,
+                device.zigzag_2,
+                device.zigzag_3,
+                device.zigzag_4,
+            ]
+            for i, slot in enumerate(zigzag_slots):
+                if i < len(device.multi_zigzag_angles):
+                    entry = device.multi_zigzag_angles[i]
+                    slot.active = entry.get("active", False)
+                    slot.angle = entry.get("angle", 0)
+                else:
+                    slot.active = False
+                    slot.angle = 0
 
         self.handle_mqtt_map_data(upd, nu, data, datanode, device)
         self.handle_mqtt_schedule_data(upd, nu, data, datanode, device)
@@ -1094,17 +1244,12 @@ class SunseekermqttController:
         device: SunseekerDevice,
     ):
         """Handle mqtt data."""
-        device.power = self.setvalue(nu, data, [], "power", device.power)
-        device.mode = self.setvalue(nu, data, [], "mode", device.mode)
+        fields = self.field_mapper(device.model)
+        self.apply_fields(nu, data, fields.status, device)
         if "mode" in data and "errortype" not in data:
-            device.errortype = 0
-        else:
-            device.errortype = self.setvalue(
-                nu, data, [], "errortype", device.errortype
+            device.errortype = self.update_var_if_changed(
+                nu, "errortype", device.errortype, 0, "errortype"
             )
-        # msg/event code V1
-        if device.model in (MODEL_V1, MODEL_OLD):
-            device.eventcode = self.setvalue(nu, data, [], "msg", device.eventcode)
 
         if "data" in data:
             datanode = data.get("data")
@@ -1116,63 +1261,8 @@ class SunseekermqttController:
                     device.deviceOnlineFlag = datanode
                 self.handle_mqtt_data_data(upd, nu, data, datanode, device)
 
-        device.station = self.setvalue(nu, data, [], "station", device.station)
-        device.wifi_lv = self.setvalue(nu, data, [], "wifi_lv", device.wifi_lv)
-        device.rain_en = self.setvalue(nu, data, [], "rain_en", device.rain_en)
-        device.rain_status = self.setvalue(
-            nu, data, [], "rain_status", device.rain_status
-        )
-        device.rain_delay_set = self.setvalue(
-            nu, data, [], "rain_delay_set", device.rain_delay_set
-        )
-        device.rain_delay_left = self.setvalue(
-            nu, data, [], "rain_delay_left", device.rain_delay_left
-        )
-        device.rain_delay_left = self.setvalue(
-            nu, data, [], "rain_countdown", device.rain_delay_left
-        )
-        device.cur_min = self.setvalue(nu, data, [], "cur_min", device.cur_min)
-        device.zoneOpenFlag = self.setvalue(
-            nu, data, [], "zoneOpenFlag", device.zoneOpenFlag
-        )
+        self.apply_fields(nu, data, fields.root, device)
         if self.apptype == APPTYPE_OLD:
-            device.mul_en = self.setvalue(nu, data, [], "mul_en", device.mul_en)
-            device.mul_auto = self.setvalue(nu, data, [], "mul_auto", device.mul_auto)
-            device.mul_zon1 = self.setvalue(nu, data, [], "mul_zon1", device.mul_zon1)
-            device.mul_zon2 = self.setvalue(nu, data, [], "mul_zon2", device.mul_zon2)
-            device.mul_zon3 = self.setvalue(nu, data, [], "mul_zon3", device.mul_zon3)
-            device.mul_zon4 = self.setvalue(nu, data, [], "mul_zon4", device.mul_zon4)
-            device.mulpro_zon1 = self.setvalue(
-                nu, data, [], "mul_pro1", device.mulpro_zon1
-            )
-            device.mulpro_zon2 = self.setvalue(
-                nu, data, [], "mul_pro2", device.mulpro_zon2
-            )
-            device.mulpro_zon3 = self.setvalue(
-                nu, data, [], "mul_pro3", device.mulpro_zon3
-            )
-            device.mulpro_zon4 = self.setvalue(
-                nu, data, [], "mul_pro4", device.mulpro_zon4
-            )
-            # ultrasonic
-            device.ultra_flag = self.setvalue(
-                nu, data, [], "ultra_en", device.ultra_flag
-            )
-            device.ultra_lv = self.setvalue(nu, data, [], "ultra", device.ultra_lv)
-            # led
-            device.ledFlag = self.setvalue(nu, data, [], "led_en", device.ledFlag)
-            device.ledModeCode = self.setvalue(
-                nu, data, [], "led_mode", device.ledModeCode
-            )
-            device.ledColorCode = self.setvalue(
-                nu, data, [], "led_color", device.ledColorCode
-            )
-            device.ledStart = self.setvalue(nu, data, [], "led_start", device.ledStart)
-            device.ledEnd = self.setvalue(nu, data, [], "led_end", device.ledEnd)
-            device.ledNightFlag = self.setvalue(
-                nu, data, [], "led_night", device.ledNightFlag
-            )
-
             day_keys = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
             is_full_schedule = data.get("cmd") == 503 or bool(day_keys & data.keys())
             if is_full_schedule and any(k in data for k in day_keys):
@@ -1210,19 +1300,6 @@ class SunseekermqttController:
                 upd.schedule = True
                 nu.need_update = True
         if device.model in (MODEL_V, MODEL_V1):
-            # V models
-            device.screen_lock = self.setvalue(
-                nu, data, [], "duration", device.screen_lock
-            )
-            device.border_distance = self.setvalue(
-                nu, data, [], "lv", device.border_distance
-            )
-            device.border_first = self.setvalue(
-                nu, data, [], "ride_en", device.border_first
-            )
-            device.robotsignal = self.setvalue(
-                nu, data, [], "wifi_rssi", device.robotsignal
-            )
             # "cmd":536,"type":0 = sporingsfrit / "cmd":536,"type":1 = smart
             if "cmd" in data:
                 if data.get("cmd") == 503:  # schedule
@@ -1232,25 +1309,17 @@ class SunseekermqttController:
                     if data.get("type") == 0:
                         if device.docking_path == 1:
                             device.docking_path = 0
-                            nu.need_update = True
+                            nu.changed("docking_path")
                     if data.get("type") == 1:
                         if device.docking_path == 0:
                             device.docking_path = 1
-                            nu.need_update = True
+                            nu.changed("docking_path")
 
-    def handle_mqtt_message(self, message):
-        """Thread to handle the messages."""
-
-        # _LOGGER.debug("MQTT message: " + message.topic + " " + message.payload.decode())
-        data = json.loads(message.payload.decode())
-        if "deviceSn" not in data:
-            _LOGGER.debug(
-                "deviceSn not in MQTT message: "  # noqa: G003
-                + message.topic
-                + " "
-                + message.payload.decode()
-            )
+    def handle_mqtt_message(self, message: mqtt_message):
+        """Handle a message, on a worker or the event loop."""
+        if self._unloading:
             return
+        data = message.data
         nu = mqtt_needupdate()
         upd = mqtt_update_values()
         devicesn = data.get("deviceSn")
@@ -1258,17 +1327,18 @@ class SunseekermqttController:
         if not device:
             _LOGGER.debug("MQTT message error, DeviceSn: %s not found", devicesn)
             return
-        _LOGGER.debug(
-            device.DeviceName  # noqa: G003
-            + " MQTT message: "
-            + message.topic
-            + " "
-            + message.payload.decode()
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s MQTT message: %s %s",
+                device.DeviceName,
+                message.topic,
+                message.payload.decode(),
+            )
         try:
-            self.handle_mqtt_data(upd, nu, data, device)
+            with device.data_lock:
+                self.handle_mqtt_data(upd, nu, data, device)
             if device.dataupdated is not None:
-                device.dataupdated(device.devicesn, upd, nu.need_update)
+                device.dataupdated(device.devicesn, upd, nu.need_update, nu.fields)
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.error("MQTT message error: " + str(error))  # noqa: G003
             _LOGGER.error("MQTT message: " + message.payload.decode())  # noqa: G003
@@ -0,0 +1,206 @@
+"""Mapping of MQTT payload keys to device attributes."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any
+
+from .const import APPTYPE_OLD, MODEL_OLD, MODEL_V, MODEL_V1
+
+
+@dataclass(frozen=True)
+class MqttField:
+    """A device attribute set from a value in an MQTT payload."""
+
+    path: tuple[str, ...]  # nodes leading to the value, empty for top level keys
+    name: str  # key of the value
+    attr: str  # attribute to set, dotted for nested objects
+    models: tuple[str, ...] | None = None  # None for all models
+    apptypes: tuple[str, ...] | None = None  # None for all apptypes
+
+
+@dataclass(frozen=True)
+class CompiledField:
+    """A field resolved for one model and apptype."""
+
+    order: int  # position in the table, later fields win
+    path: list[str]
+    name: str
+    parent: Callable[[Any], Any]  # returns the object holding attr
+    attr: str
+    field: str  # the dotted attr, reported as changed
+
+
+type FieldMap = dict[str, list[CompiledField]]
+
+
+# Top level keys handled before the data node
+STATUS_FIELDS: tuple[MqttField, ...] = (
+    MqttField((), "power", "power"),
+    MqttField((), "mode", "mode"),
+    MqttField((), "errortype", "errortype"),
+    # msg/event code V1
+    MqttField((), "msg", "eventcode", models=(MODEL_V1, MODEL_OLD)),
+)
+
+# Top level keys handled after the data node
+ROOT_FIELDS: tuple[MqttField, ...] = (
+    MqttField((), "station", "station"),
+    MqttField((), "wifi_lv", "wifi_lv"),
+    MqttField((), "rain_en", "rain_en"),
+    MqttField((), "rain_status", "rain_status"),
+    MqttField((), "rain_delay_set", "rain_delay_set"),
+    MqttField((), "rain_delay_left", "rain_delay_left"),
+    MqttField((), "rain_countdown", "rain_delay_left"),
+    MqttField((), "cur_min", "cur_min"),
+    MqttField((), "zoneOpenFlag", "zoneOpenFlag"),
+    *(
+        MqttField((), name, attr, apptypes=(APPTYPE_OLD,))
+        for name, attr in (
+            ("mul_en", "mul_en"),
+            ("mul_auto", "mul_auto"),
+            ("mul_zon1", "mul_zon1"),
+            ("mul_zon2", "mul_zon2"),
+            ("mul_zon3", "mul_zon3"),
+            ("mul_zon4", "mul_zon4"),
+            ("mul_pro1", "mulpro_zon1"),
+            ("mul_pro2", "mulpro_zon2"),
+            ("mul_pro3", "mulpro_zon3"),
+            ("mul_pro4", "mulpro_zon4"),
+            # ultrasonic
+            ("ultra_en", "ultra_flag"),
+            ("ultra", "ultra_lv"),
+            # led
+            ("led_en", "ledFlag"),
+            ("led_mode", "ledModeCode"),
+            ("led_color", "ledColorCode"),
+            ("led_start", "ledStart"),
+            ("led_end", "ledEnd"),
+            ("led_night", "ledNightFlag"),
+        )
+    ),
+    # V models
+    MqttField((), "duration", "screen_lock", models=(MODEL_V, MODEL_V1)),
+    MqttField((), "lv", "border_distance", models=(MODEL_V, MODEL_V1)),
+    MqttField((), "ride_en", "border_first", models=(MODEL_V, MODEL_V1)),
+    MqttField((), "wifi_rssi", "robotsignal", models=(MODEL_V, MODEL_V1)),
+)
+
+# Keys of the data node
+DATA_FIELDS: tuple[MqttField, ...] = (
+    *(
+        MqttField(("consumable_items", item), name, f"consumable.{item}.{name}")
+        for item in ("blade", "cutter", "small_blade", "small_cutter")
+        for name in ("at", "loop", "ls", "mp", "twt")
+    ),
+    MqttField((), "above_edge", "above_edge"),
+    # X gen2
+    # auto ride edge does not get reported via mqtt.
+    MqttField((), "auto_ride_edge_map_m", "auto_ride_edge"),
+    MqttField((), "recharge_mode", "recharge_mode"),
+    MqttField((), "night_work", "nightwork"),
+    MqttField((), "energy_saving_mode", "enery_mode"),
+    # online
+    MqttField((), "online", "deviceOnlineFlag"),
+    # task info
+    MqttField((), "task_id", "task_id"),
+    MqttField((), "schedule_cancel", "schedule_cancel"),
+    MqttField((), "normal_done", "normal_done"),
+    MqttField((), "end_reason", "end_reason"),
+    MqttField((), "oneshot_task_type", "oneshot_task_type"),
+    MqttField((), "start_reason", "start_reason"),
+    MqttField((), "task_type", "task_type"),
+    # firmware_version
+    MqttField((), "firmware_version", "device_firmware"),
+    MqttField((), "station_firmware_version", "base_firmware"),
+    MqttField((), "work_touch_mode", "avoid_objects"),
+    MqttField((), "ai_sensitivity", "AISens"),
+    MqttField((), "work_time", "cur_min"),
+    MqttField((), "elec", "power"),
+    MqttField((), "rain_countdown", "rain_delay_left"),
+    MqttField((), "rain_status", "rain_status"),
+    MqttField(("rain",), "rain_flag", "rain_en"),
+    MqttField(("rain",), "delay", "rain_delay_set"),
+    MqttField((), "robot_sig", "robotsignal"),
+    MqttField((), "first_along_border", "border_first"),
+    MqttField((), "follow_border_freq", "border_mode"),
+    MqttField((), "wifi_sig", "wifi_lv"),
+    MqttField((), "task_total_area", "taskTotalArea"),
+    MqttField((), "task_cover_area", "taskCoverArea"),
+    MqttField((), "net_4g_sig", "net_4g_sig"),
+    MqttField((), "time_work_repeat", "time_work_repeat"),
+    MqttField(("mow_efficiency",), "gap", "gap"),
+    MqttField(("mow_efficiency",), "speed", "work_speed"),
+    MqttField((), "plan_value", "plan_angle"),
+    MqttField((), "plan_mode", "plan_mode"),
+    MqttField(("plan_angle",), "plan_value", "plan_angle"),
+    MqttField(("plan_angle",), "plan_mode", "plan_mode"),
+    MqttField(("plan_angle",), "multi_zigzag_angles", "multi_zigzag_angles"),
+    MqttField(("blade",), "speed", "blade_speed"),
+    MqttField(("blade",), "height", "blade_height"),
+    MqttField((), "dis_along_border", "dis_along_border"),
+    MqttField((), "cliff_detect_enable", "cliff_detect"),
+    # "charge_pos":{"angle":-3.127,"point":[-0.018,0.261]}
+    MqttField(("charge_pos",), "angle", "map.charger_orientation"),
+    # schedule
+    MqttField((), "recommended_time_flag", "Schedule_new.schedule_recommended"),
+    MqttField((), "time_custom_flag", "Schedule_new.schedule_custom"),
+    MqttField((), "pause", "Schedule_new.schedule_pause"),
+    MqttField((), "time_zone", "Schedule_new.timezone"),
+    # zones
+    MqttField((), "custom_flag", "custom_zones"),
+)
+
+# Keys of a zone in the custom node, set on the SunseekerZone
+ZONE_FIELDS: tuple[MqttField, ...] = (
+    MqttField((), "start", "start"),
+    MqttField((), "finish", "finish"),
+    MqttField((), "work_gap", "gap"),
+    MqttField((), "region_size", "region_size"),
+    MqttField((), "blade_height", "blade_height"),
+    MqttField((), "estimate_time", "estimate_time"),
+    MqttField((), "blade_speed", "blade_speed"),
+    MqttField((), "plan_mode", "plan_mode"),
+    MqttField((), "plan_angle", "plan_angle"),
+    MqttField((), "work_speed", "work_speed"),
+    MqttField((), "setting", "setting"),
+    MqttField((), "multi_zigzag_angles", "multi_zigzag_angles"),
+)
+
+
+def _same(obj: Any) -> Any:
+    return obj
+
+
+def compile_fields(fields: tuple[MqttField, ...], model: str, apptype: str) -> FieldMap:
+    """Index the fields used by model and apptype by their top level key."""
+    field_map: FieldMap = {}
+    for order, field in enumerate(fields):
+        if field.models is not None and model not in field.models:
+            continue
+        if field.apptypes is not None and apptype not in field.apptypes:
+            continue
+        parent_path, _, attr = field.attr.rpartition(".")
+        key = field.path[0] if field.path else field.name
+        field_map.setdefault(key, []).append(
+            CompiledField(
+                order,
+                list(field.path),
+                field.name,
+                attrgetter(parent_path) if parent_path else _same,
+                attr,
+                field.attr,
+            )
+        )
+    return field_map
+
+
+class MqttFieldMapper:
+    """Compiled field maps for one model and apptype."""
+
+    def __init__(self, model: str, apptype: str) -> None:
+        """Init."""
+        self.status = compile_fields(STATUS_FIELDS, model, apptype)
+        self.root = compile_fields(ROOT_FIELDS, model, apptype)
+        self.data = compile_fields(DATA_FIELDS, model, apptype)
+        self.zone = compile_fields(ZONE_FIELDS, model, apptype)
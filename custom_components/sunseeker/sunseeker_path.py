@@ -0,0 +1,130 @@
+"""Compact storage of mower path points."""
+
+from array import array
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+
+# Type of the points sent without one
+NO_TYPE = -1
+
+
+@dataclass(frozen=True)
+class PathSlice:
+    """Read only path points as x, y and type arrays."""
+
+    xs: np.ndarray
+    ys: np.ndarray
+    types: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "PathSlice":
+        """Return a slice without points."""
+        return cls(
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=np.int16),
+        )
+
+    @classmethod
+    def from_points(cls, points) -> "PathSlice":
+        """Build a slice from points [x, y, type] as sent by the mower."""
+        count = len(points)
+        return cls(
+            np.fromiter((p[0] for p in points), dtype=np.float64, count=count),
+            np.fromiter((p[1] for p in points), dtype=np.float64, count=count),
+            np.fromiter(
+                (int(p[2]) if len(p) > 2 else NO_TYPE for p in points),
+                dtype=np.int16,
+                count=count,
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self.types)
+
+    def __getitem__(self, index: slice) -> "PathSlice":
+        """Return a slice of the points, sharing the arrays."""
+        return PathSlice(self.xs[index], self.ys[index], self.types[index])
+
+    def __add__(self, other: "PathSlice") -> "PathSlice":
+        """Return the points of both slices."""
+        return PathSlice(
+            np.concatenate((self.xs, other.xs)),
+            np.concatenate((self.ys, other.ys)),
+            np.concatenate((self.types, other.types)),
+        )
+
+    def to_list(self) -> list[list]:
+        """Return the points in the format sent by the mower."""
+        return [
+            [x, y] if t == NO_TYPE else [x, y, t]
+            for x, y, t in zip(
+                self.xs.tolist(), self.ys.tolist(), self.types.tolist(), strict=True
+            )
+        ]
+
+
+class PathStore:
+    """Growing list of path points, packed in arrays.
+
+    The MQTT workers append to it while the renderer reads it, so all access
+    goes through a lock. epoch changes each time the store is cleared, which
+    tells a renderer holding a snapshot that a new path was started.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self._lock = Lock()
+        self._xs = array("d")
+        self._ys = array("d")
+        self._types = array("h")
+        self.epoch = 0
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self._types)
+
+    def extend(self, points) -> None:
+        """Append points [x, y, type] as sent by the mower."""
+        xs = array("d", (p[0] for p in points))
+        ys = array("d", (p[1] for p in points))
+        types = array("h", (int(p[2]) if len(p) > 2 else NO_TYPE for p in points))
+        with self._lock:
+            self._xs.extend(xs)
+            self._ys.extend(ys)
+            self._types.extend(types)
+
+    def clear(self) -> None:
+        """Remove all points."""
+        with self._lock:
+            del self._xs[:]
+            del self._ys[:]
+            del self._types[:]
+            self.epoch += 1
+
+    def drop_front(self, count: int, epoch: int) -> None:
+        """Remove the first count points, unless cleared since epoch."""
+        with self._lock:
+            if epoch == self.epoch:
+                del self._xs[:count]
+                del self._ys[:count]
+                del self._types[:count]
+
+    def snapshot(self) -> tuple[int, PathSlice]:
+        """Return the epoch and a copy of the points.
+
+        The copy is one memcpy per array, the returned arrays are views on it.
+        """
+        with self._lock:
+            xs = self._xs[:]
+            ys = self._ys[:]
+            types = self._types[:]
+            epoch = self.epoch
+        return epoch, PathSlice(
+            np.frombuffer(xs, dtype=np.float64),
+            np.frombuffer(ys, dtype=np.float64),
+            np.frombuffer(types, dtype=np.int16),
+        )
@@ -5,8 +5,6 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
-import requests
-
 if TYPE_CHECKING:
     from .sunseeker import SunseekerDevice
 
@@ -411,7 +409,7 @@ class Sunseeker_new_schedule:
                 "User-Agent": "okhttp/4.4.1",
             }
             _LOGGER.debug(f"Get schedule data header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            response = self.mower.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
@@ -519,7 +517,7 @@ class Sunseeker_new_schedule:
                 "User-Agent": "okhttp/4.4.1",
             }
             _LOGGER.debug(f"Get schedule V data header: {headers_} url: {url_}")  # noqa: G004
-            response = requests.get(
+            response = self.mower.http.get(
                 url=url_,
                 headers=headers_,
                 timeout=10,
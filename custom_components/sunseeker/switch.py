@@ -213,6 +213,8 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities) -> N
 class SunseekerRainSwitch(SunseekerEntity, SwitchEntity):
     """LawnMower switches."""
 
+    _device_fields = ("rain_en",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -233,7 +235,7 @@ class SunseekerRainSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_rain_status,
             True,
             self.device.rain_delay_set,
@@ -241,7 +243,7 @@ class SunseekerRainSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_rain_status,
             False,
             self.device.rain_delay_set,
@@ -249,7 +251,7 @@ class SunseekerRainSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_rain_status,
             not self.is_on,
             self.device.rain_delay_set,
@@ -264,6 +266,8 @@ class SunseekerRainSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerMultiZoneSwitch(SunseekerEntity, SwitchEntity):
     """LawnMower switches."""
 
+    _device_fields = ("mul_en",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -283,7 +287,7 @@ class SunseekerMultiZoneSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_zone_status,
             self.device.mul_auto,
             True,
@@ -299,7 +303,7 @@ class SunseekerMultiZoneSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_zone_status,
             self.device.mul_auto,
             False,
@@ -315,7 +319,7 @@ class SunseekerMultiZoneSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_zone_status,
             self.device.mul_auto,
             not self.device.mul_en,
@@ -338,6 +342,8 @@ class SunseekerMultiZoneSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerMultiZoneAutoSwitch(SunseekerEntity, SwitchEntity):
     """LawnMower switches."""
 
+    _device_fields = ("mul_auto",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -357,7 +363,7 @@ class SunseekerMultiZoneAutoSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_zone_status,
             True,
             self.device.mul_en,
@@ -373,7 +379,7 @@ class SunseekerMultiZoneAutoSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_zone_status,
             False,
             self.device.mul_en,
@@ -389,7 +395,7 @@ class SunseekerMultiZoneAutoSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_zone_status,
             not self.device.mul_auto,
             self.device.mul_en,
@@ -412,6 +418,8 @@ class SunseekerMultiZoneAutoSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerUltrasonicSwitch(SunseekerEntity, SwitchEntity):
     """Ultrasonic switch for old models."""
 
+    _device_fields = ("ultra_flag",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -432,7 +440,7 @@ class SunseekerUltrasonicSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_ultrasonic,
             True,
             int(self.device.ultra_lv or 0),
@@ -440,7 +448,7 @@ class SunseekerUltrasonicSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_ultrasonic,
             False,
             int(self.device.ultra_lv or 0),
@@ -448,7 +456,7 @@ class SunseekerUltrasonicSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_ultrasonic,
             not self.is_on,
             int(self.device.ultra_lv or 0),
@@ -501,7 +509,7 @@ class _SunseekerLedBaseSwitch(SunseekerEntity, SwitchEntity):
         )
 
     async def _set_led(self, **kwargs) -> None:
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_led,
             *self._led_args(**kwargs),
         )
@@ -510,6 +518,8 @@ class _SunseekerLedBaseSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerLedFlagSwitch(_SunseekerLedBaseSwitch):
     """Master headlight switch for old models."""
 
+    _device_fields = ("ledFlag",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -540,6 +550,8 @@ class SunseekerLedFlagSwitch(_SunseekerLedBaseSwitch):
 class SunseekerLedModeSwitch(_SunseekerLedBaseSwitch):
     """White light mode switch for old models."""
 
+    _device_fields = ("ledModeCode",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -570,6 +582,8 @@ class SunseekerLedModeSwitch(_SunseekerLedBaseSwitch):
 class SunseekerLedNightFlagSwitch(_SunseekerLedBaseSwitch):
     """Night-only headlight switch for old models."""
 
+    _device_fields = ("ledNightFlag",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -680,7 +694,7 @@ class SunseekerScheduleSwitch(SunseekerEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         await self.SetSchedule(True)
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_schedule,
             self.device.Schedule.days,
         )
@@ -688,7 +702,7 @@ class SunseekerScheduleSwitch(SunseekerEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         await self.SetSchedule(False)
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_schedule,
             self.device.Schedule.days,
         )
@@ -696,7 +710,7 @@ class SunseekerScheduleSwitch(SunseekerEntity, SwitchEntity):
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
         await self.SetSchedule(not self.is_on)
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_schedule,
             self.device.Schedule.days,
         )
@@ -710,6 +724,8 @@ class SunseekerScheduleSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerBorderFirstSwitch(SunseekerEntity, SwitchEntity):
     """LawnMower switches."""
 
+    _device_fields = ("border_first",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -730,21 +746,21 @@ class SunseekerBorderFirstSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_border_first,
             True,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_border_first,
             False,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_border_first,
             not self.is_on,
         )
@@ -758,6 +774,8 @@ class SunseekerBorderFirstSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerTimeWorkRepeatSwitch(SunseekerEntity, SwitchEntity):
     """LawnMower switches."""
 
+    _device_fields = ("time_work_repeat",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -778,21 +796,21 @@ class SunseekerTimeWorkRepeatSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_time_work_repeat,
             True,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_time_work_repeat,
             False,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_time_work_repeat,
             not self.is_on,
         )
@@ -806,6 +824,8 @@ class SunseekerTimeWorkRepeatSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerCustomEnableSwitch(SunseekerEntity, SwitchEntity):
     """LawnMower switches."""
 
+    _device_fields = ("custom_zones",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -826,21 +846,21 @@ class SunseekerCustomEnableSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_custom_flag,
             True,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_custom_flag,
             False,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_custom_flag,
             not self.is_on,
         )
@@ -854,6 +874,8 @@ class SunseekerCustomEnableSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerSchedulePauseSwitch(SunseekerEntity, SwitchEntity):
     """LawnMower switches."""
 
+    _device_fields = ("Schedule_new.schedule_pause",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -876,12 +898,12 @@ class SunseekerSchedulePauseSwitch(SunseekerEntity, SwitchEntity):
         """Turn the entity on."""
         self.device.Schedule_new.schedule_pause = True
         if self.device.model in (MODEL_V1):
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_schedule_on_off_V1,
                 True,
             )
         else:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_schedule_data,
             )
 
@@ -889,12 +911,12 @@ class SunseekerSchedulePauseSwitch(SunseekerEntity, SwitchEntity):
         """Turn the entity off."""
         self.device.Schedule_new.schedule_pause = False
         if self.device.model in (MODEL_V1):
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_schedule_on_off_V1,
                 False,
             )
         else:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_schedule_data,
             )
 
@@ -904,12 +926,12 @@ class SunseekerSchedulePauseSwitch(SunseekerEntity, SwitchEntity):
             not self.device.Schedule_new.schedule_pause
         )
         if self.device.model in (MODEL_V1):
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_schedule_on_off_V1,
                 self.device.Schedule_new.schedule_pause,
             )
         else:
-            await self.hass.async_add_executor_job(
+            await self.device.async_command(
                 self.device.set_schedule_data,
             )
 
@@ -922,6 +944,8 @@ class SunseekerSchedulePauseSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerZigzagActiveSwitch(SunseekerEntity, SwitchEntity):
     """Switch entity for a global zigzag angle active flag."""
 
+    _device_fields = ("multi_zigzag_angles",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -955,15 +979,15 @@ class SunseekerZigzagActiveSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(self._set_active, True)
+        await self.device.async_command(self._set_active, True)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(self._set_active, False)
+        await self.device.async_command(self._set_active, False)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(self._set_active, not self.is_on)
+        await self.device.async_command(self._set_active, not self.is_on)
 
     @property
     def is_on(self):
@@ -974,6 +998,8 @@ class SunseekerZigzagActiveSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerCustomZigzagActiveSwitch(SunseekerEntity, SwitchEntity):
     """Switch entity for a zone-specific zigzag angle active flag."""
 
+    _device_fields = ("zone.multi_zigzag_angles",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1011,17 +1037,17 @@ class SunseekerCustomZigzagActiveSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(self._set_active, True)
+        await self.device.async_command(self._set_active, True)
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(self._set_active, False)
+        await self.device.async_command(self._set_active, False)
         self.async_write_ha_state()
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(self._set_active, not self.is_on)
+        await self.device.async_command(self._set_active, not self.is_on)
         self.async_write_ha_state()
 
     @property
@@ -1033,6 +1059,8 @@ class SunseekerCustomZigzagActiveSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerNightWorkSwitch(SunseekerEntity, SwitchEntity):
     """Switch entity for night work mode."""
 
+    _device_fields = ("nightwork",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1053,21 +1081,21 @@ class SunseekerNightWorkSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_night_work,
             True,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_night_work,
             False,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_night_work,
             not self.is_on,
         )
@@ -1081,6 +1109,8 @@ class SunseekerNightWorkSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerEnergySavingSwitch(SunseekerEntity, SwitchEntity):
     """Switch entity for energy saving mode."""
 
+    _device_fields = ("enery_mode",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1101,21 +1131,21 @@ class SunseekerEnergySavingSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_energy_save,
             True,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_energy_save,
             False,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_energy_save,
             not self.is_on,
         )
@@ -1129,6 +1159,8 @@ class SunseekerEnergySavingSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerAutoRideEdgeSwitch(SunseekerEntity, SwitchEntity):
     """Switch entity for auto ride edge (auto map outside borders)."""
 
+    _device_fields = ("auto_ride_edge",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1149,21 +1181,21 @@ class SunseekerAutoRideEdgeSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_auto_ride_edge,
             1,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_auto_ride_edge,
             0,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_auto_ride_edge,
             0 if self.is_on else 1,
         )
@@ -1177,6 +1209,8 @@ class SunseekerAutoRideEdgeSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerCliffDetectSwitch(SunseekerEntity, SwitchEntity):
     """Switch entity for cliff detection (Model X only)."""
 
+    _device_fields = ("cliff_detect",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1197,21 +1231,21 @@ class SunseekerCliffDetectSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_Cliff_detect,
             True,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_Cliff_detect,
             False,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_Cliff_detect,
             not self.is_on,
         )
@@ -1225,6 +1259,8 @@ class SunseekerCliffDetectSwitch(SunseekerEntity, SwitchEntity):
 class SunseekerAboveEdgeSwitch(SunseekerEntity, SwitchEntity):
     """Switch entity for ride on edge mode."""
 
+    _device_fields = ("above_edge",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -1245,21 +1281,21 @@ class SunseekerAboveEdgeSwitch(SunseekerEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_above_edge,
             True,
         )
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_above_edge,
             False,
         )
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_above_edge,
             not self.is_on,
         )
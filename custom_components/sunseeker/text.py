@@ -126,7 +126,7 @@ class _SunseekerLedBaseText(SunseekerEntity, TextEntity):
         self.device = self._data_handler.get_device(self._sn)
 
     async def _set_led(self, **kwargs) -> None:
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_led,
             self.device.ledFlag
             if kwargs.get("ledFlag") is None
@@ -152,6 +152,8 @@ class _SunseekerLedBaseText(SunseekerEntity, TextEntity):
 class SunseekerLedColorCodeText(_SunseekerLedBaseText):
     """Headlight color code text entity for old models."""
 
+    _device_fields = ("ledColorCode",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -178,6 +180,8 @@ class SunseekerLedColorCodeText(_SunseekerLedBaseText):
 class SunseekerLedStartText(_SunseekerLedBaseText):
     """Headlight start time text entity for old models."""
 
+    _device_fields = ("ledStart",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -204,6 +208,8 @@ class SunseekerLedStartText(_SunseekerLedBaseText):
 class SunseekerLedEndText(_SunseekerLedBaseText):
     """Headlight end time text entity for old models."""
 
+    _device_fields = ("ledEnd",)
+
     def __init__(
         self,
         coordinator: SunseekerDataCoordinator,
@@ -281,7 +287,7 @@ class SunseekerScheduleText(SunseekerEntity, TextEntity):
         except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
             _LOGGER.debug(error)
 
-        await self.hass.async_add_executor_job(
+        await self.device.async_command(
             self.device.set_schedule,
             self.device.Schedule.days,
         )
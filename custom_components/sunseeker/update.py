@@ -79,6 +79,7 @@ class SunseekerFirmwareUpdate(SunseekerEntity, UpdateEntity):
         self._installed_attr = installed_attr
         self._latest_attr = latest_attr
         self._release_notes_attr = release_notes_attr
+        self._device_fields = (installed_attr, latest_attr, release_notes_attr)
         self._can_install = can_install
 
         if can_install:
@@ -127,8 +128,6 @@ class SunseekerFirmwareUpdate(SunseekerEntity, UpdateEntity):
         if not self._can_install:
             return
         if self.name == "Base firmware":
-            await self.hass.async_add_executor_job(
-                self.device.base_ota_upgrade_X_models
-            )
+            await self.device.async_command(self.device.base_ota_upgrade_X_models)
         else:
-            await self.hass.async_add_executor_job(self.device.ota_upgrade_X_models)
+            await self.device.async_command(self.device.ota_upgrade_X_models)
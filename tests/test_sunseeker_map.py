@@ -0,0 +1,217 @@
+"""Tests for the path drawing of the map renderer."""
+
+import math
+import random
+
+import numpy as np
+from PIL import Image, ImageDraw
+import pytest
+
+from custom_components.sunseeker.const import (
+    MAP_DRAW_MODE_ADVANCED_BORDER,
+    MAP_DRAW_MODE_ALL,
+    MAP_DRAW_MODE_SIMPLE,
+    MAP_DRAW_MODE_SIMPLE_BORDER,
+    MAP_DRAW_MODES,
+)
+from custom_components.sunseeker.sunseeker_map import (
+    MapView,
+    _draw_path_runs,
+    _simplify_path,
+)
+
+WORK_COLOR = (0, 255, 0)
+TYPES = [9, 10, 11, 12, 13, 14, 16, 17, 18, 19, 137, 138, 139, 140, 144, 146]
+
+
+def _view(draw_mode: str, tolerance: float = 0) -> MapView:
+    return MapView(
+        draw_mode=draw_mode,
+        work_color=WORK_COLOR,
+        grass_color=(0, 0, 0),
+        grass_fill_color=(0, 0, 0),
+        forbidden_fill_color=(0, 0, 0),
+        forbidden_color=(0, 0, 0),
+        obstacle_fill_color=(0, 0, 0),
+        obstacle_color=(0, 0, 0),
+        placed_blank_fill_color=(0, 0, 0),
+        placed_blank_color=(0, 0, 0),
+        map_min_x=-20,
+        map_max_x=20,
+        map_min_y=-15,
+        map_max_y=15,
+        canvas_width=400,
+        canvas_height=300,
+        charger_pos_x=0,
+        charger_pos_y=0,
+        charger_orientation=0,
+        mower_pos_x=0,
+        mower_pos_y=0,
+        mower_orientation=0,
+        charger_image=None,
+        robot_image=None,
+        max_canvas_size=2048,
+        path_tolerance=tolerance,
+    )
+
+
+def _random_path(rng: random.Random) -> list[list]:
+    """Return a random walk in runs of random types, with some repeated points."""
+    points = []
+    x, y = rng.uniform(-15, 15), rng.uniform(-10, 10)
+    for _ in range(rng.randint(1, 40)):
+        ptype = rng.choice(TYPES)
+        step = rng.choice((0.01, 0.05, 0.3))
+        for _ in range(rng.randint(1, 30)):
+            if rng.random() > 0.2:
+                x = min(max(x + rng.uniform(-step, step), -20), 20)
+                y = min(max(y + rng.uniform(-step, step), -15), 15)
+            points.append([x, y, ptype])
+    return points
+
+
+def _reference_draw_path_runs(view: MapView, draw: ImageDraw.ImageDraw, data) -> None:
+    """Point by point path drawing the numpy version replaced."""
+    draw_border = view.draw_mode in (
+        MAP_DRAW_MODE_SIMPLE_BORDER,
+        MAP_DRAW_MODE_ADVANCED_BORDER,
+    )
+    draw_transitions = view.draw_mode not in (
+        MAP_DRAW_MODE_SIMPLE,
+        MAP_DRAW_MODE_SIMPLE_BORDER,
+    )
+    type_colors = {9: view.work_color, 137: view.work_color}
+    if draw_border:
+        type_colors[12] = (0, 200, 255)
+        type_colors[140] = (0, 200, 255)
+    all_type_colors = {
+        9: view.work_color,
+        10: view.work_color,
+        11: (255, 165, 0),
+        12: (0, 200, 255),
+        13: (180, 180, 180),
+        14: (180, 180, 180),
+        16: (200, 100, 100),
+        17: (255, 220, 0),
+        18: (100, 200, 100),
+        19: (100, 100, 200),
+        137: view.work_color,
+        138: view.work_color,
+        139: (255, 220, 0),
+        140: (0, 200, 255),
+        144: (200, 100, 100),
+        146: (100, 200, 100),
+    }
+    bridge_types = {17, 13, 19, 139}
+
+    runs = []
+    i = 0
+    while i < len(data):
+        j = i + 1
+        while j < len(data) and data[j][2] == data[i][2]:
+            j += 1
+        pts = [(data[k][0], data[k][1]) for k in range(i, j)]
+        total_dist = sum(math.dist(pts[k], pts[k + 1]) for k in range(len(pts) - 1))
+        runs.append((data[i][2], pts, total_dist))
+        i = j
+
+    segment: list = []
+    seg_color = None
+
+    def flush() -> None:
+        nonlocal segment, seg_color
+        if len(segment) >= 2 and seg_color is not None:
+            draw.line(segment, fill=seg_color, width=1)
+        segment = []
+        seg_color = None
+
+    for ptype, pts, total_dist in runs:
+        if view.draw_mode == MAP_DRAW_MODE_ALL:
+            color = all_type_colors.get(ptype, view.work_color)
+        elif ptype in bridge_types:
+            if segment:
+                segment.extend(view.transform(p) for p in pts)
+            continue
+        elif ptype in (10, 138):
+            color = view.work_color if draw_transitions and total_dist < 2.0 else None
+        else:
+            color = type_colors.get(ptype)
+        if color is None:
+            flush()
+            continue
+        transformed = [view.transform(p) for p in pts]
+        if seg_color == color:
+            segment.extend(transformed)
+        else:
+            flush()
+            segment = transformed
+            seg_color = color
+    flush()
+
+
+def _render(func, view: MapView, points: list[list]) -> bytes:
+    image = Image.new("RGB", (int(view.canvas_width), int(view.canvas_height)))
+    func(view, ImageDraw.Draw(image), points)
+    return image.tobytes()
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_no_tolerance_draws_like_reference(seed: int) -> None:
+    """Without tolerance only points on the same pixel are skipped."""
+    rng = random.Random(seed)
+    view = _view(MAP_DRAW_MODES[seed % len(MAP_DRAW_MODES)])
+    points = _random_path(rng)
+    assert _render(_draw_path_runs, view, points) == _render(
+        _reference_draw_path_runs, view, points
+    )
+
+
+@pytest.mark.parametrize("tolerance", [0.5, 1.0, 3.0])
+def test_simplify_keeps_run_ends(tolerance: float) -> None:
+    """The first and last point of every run survive simplification."""
+    rng = np.random.default_rng(1)
+    count = 2000
+    fx = np.cumsum(rng.uniform(-1, 1, count)) + 200
+    fy = np.cumsum(rng.uniform(-1, 1, count)) + 150
+    starts = np.array([0, 10, 11, 500, 1337])
+    ends = np.append(starts[1:], count)
+    keep = _simplify_path(
+        fx,
+        fy,
+        fx.astype(np.int64),
+        fy.astype(np.int64),
+        starts,
+        ends,
+        tolerance,
+    )
+    assert keep[starts].all()
+    assert keep[ends - 1].all()
+    assert keep.sum() < count
+
+
+def test_simplify_stays_within_tolerance() -> None:
+    """Points dropped by Douglas-Peucker are within tolerance of the lines."""
+    tolerance = 1.0
+    rng = np.random.default_rng(2)
+    count = 500
+    fx = np.cumsum(rng.uniform(0, 2, count))
+    fy = np.cumsum(rng.uniform(-1, 1, count)) + 150
+    args = (
+        fx,
+        fy,
+        fx.astype(np.int64),
+        fy.astype(np.int64),
+        np.array([0]),
+        np.array([count]),
+    )
+    # Points on the same pixel as the one before are dropped without a check
+    candidates = _simplify_path(*args, 0)
+    keep = _simplify_path(*args, tolerance)
+    assert keep.sum() < candidates.sum()
+    kept = np.flatnonzero(keep)
+    for first, last in zip(kept[:-1], kept[1:], strict=True):
+        dx, dy = fx[last] - fx[first], fy[last] - fy[first]
+        norm = math.hypot(dx, dy)
+        for index in np.flatnonzero(candidates[first + 1 : last]) + first + 1:
+            rx, ry = fx[index] - fx[first], fy[index] - fy[first]
+            assert abs(dx * ry - dy * rx) / norm <= tolerance + 1e-9
@@ -0,0 +1,122 @@
+"""Tests for the MQTT message queues."""
+
+import threading
+import time
+
+from custom_components.sunseeker.sunseeker_mqtt import (
+    mqtt_message,
+    mqtt_queue,
+    mqtt_worker_pool,
+)
+
+
+class _Owner:
+    """Stands in for a controller."""
+
+
+def _message(
+    position: bool = False, owner: object = None, handler=None, seq: int = 0
+) -> mqtt_message:
+    data = {"data": {"robot_pos": {"point": [seq, 0]}}} if position else {"seq": seq}
+    return mqtt_message("/app/1/get", b"{}", data, handler, owner)
+
+
+def test_position_frames_are_droppable() -> None:
+    """Only messages with nothing but positions may be dropped."""
+    assert _message(position=True).droppable
+    assert not _message().droppable
+    both = mqtt_message("t", b"", {"data": {"robot_pos": {}, "work_status": 1}}, None)
+    assert not both.droppable
+
+
+def test_full_queue_drops_oldest_position() -> None:
+    """A full queue makes room by dropping its oldest position frame."""
+    q = mqtt_queue(3, 1)
+    first = _message(position=True, seq=1)
+    assert q.put(first)
+    assert q.put(_message(seq=2))
+    assert q.put(_message(position=True, seq=3))
+    assert q.put(_message(seq=4))
+    assert first not in q._messages
+    assert [q.get().data for _ in range(3)] == [
+        {"seq": 2},
+        {"data": {"robot_pos": {"point": [3, 0]}}},
+        {"seq": 4},
+    ]
+    assert q.stats()["dropped"] == 1
+
+
+def test_position_dropped_when_no_room() -> None:
+    """A position frame is dropped when only other messages are queued."""
+    q = mqtt_queue(2, 1)
+    assert q.put(_message(seq=1))
+    assert q.put(_message(seq=2))
+    assert not q.put(_message(position=True))
+    assert len(q) == 2
+    assert q.stats()["dropped"] == 1
+
+
+def test_put_times_out() -> None:
+    """Other messages wait for room, but not longer than the timeout."""
+    q = mqtt_queue(1, 0.1)
+    assert q.put(_message(seq=1))
+    start = time.monotonic()
+    assert not q.put(_message(seq=2))
+    assert time.monotonic() - start >= 0.1
+    stats = q.stats()
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+
+
+def test_put_waits_for_worker() -> None:
+    """A waiting put goes through once the worker takes a message."""
+    q = mqtt_queue(1, 5)
+    assert q.put(_message(seq=1))
+    threading.Timer(0.05, q.get).start()
+    assert q.put(_message(seq=2))
+    assert q.get().data == {"seq": 2}
+
+
+def test_release_discards_and_wakes() -> None:
+    """Releasing an owner drops its messages and frees its waiting put."""
+    unloaded, other = _Owner(), _Owner()
+    q = mqtt_queue(2, 5)
+    assert q.put(_message(owner=unloaded, seq=1))
+    assert q.put(_message(owner=other, seq=2))
+    result = []
+    waiting = threading.Thread(
+        target=lambda: result.append(q.put(_message(owner=unloaded, seq=3)))
+    )
+    waiting.start()
+    time.sleep(0.05)
+    start = time.monotonic()
+    q.release(unloaded)
+    waiting.join(1)
+    assert result == [False]
+    assert time.monotonic() - start < 1
+    assert [msg.owner for msg in q._messages] == [other]
+    assert not q.put(_message(owner=unloaded, seq=4))
+    assert q.stats()["discarded"] == 3
+
+
+def test_pool_keeps_device_order() -> None:
+    """The messages of a device are handled in order, on one thread."""
+    handled: dict[str, list[tuple[int, str]]] = {}
+    done = threading.Event()
+    count = 200
+
+    def handler(msg: mqtt_message) -> None:
+        handled.setdefault(msg.data["sn"], []).append(
+            (msg.data["seq"], threading.current_thread().name)
+        )
+        if sum(len(seqs) for seqs in handled.values()) == count:
+            done.set()
+
+    pool = mqtt_worker_pool(3, 256, 1)
+    for seq in range(count):
+        sn = f"SN{seq % 7}"
+        pool.put(sn, mqtt_message("t", b"", {"sn": sn, "seq": seq}, handler))
+    assert done.wait(5)
+    for seqs in handled.values():
+        assert [seq for seq, _ in seqs] == sorted(seq for seq, _ in seqs)
+        assert len({name for _, name in seqs}) == 1